@@ -0,0 +1,56 @@
+"""
+Measures InventoryManager.checkout throughput in orders per second.
+
+Each order takes one unit of three random SKUs from a shared catalog.
+
+Usage:
+    python -m benchmarks.checkout_throughput [--products N] [--orders N]
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from src.category import Category
+from src.inventory import InventoryManager
+from src.product_factory import ProductFactory
+
+
+def run(products: int, orders: int, threads: int) -> float:
+    """Runs ``orders`` checkouts spread over ``threads`` and returns orders/sec."""
+    category = Category("Electronics", "Devices and gadgets")
+    inventory = InventoryManager()
+    catalog = ProductFactory.create_products(
+        [(f"Item {i}", 10.0, category, 10**9) for i in range(products)]
+    )
+    inventory.add_products(catalog)
+    skus = [product.id for product in catalog]
+    per_thread = orders // threads
+
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(per_thread):
+            inventory.checkout({sku: -1 for sku in rng.sample(skus, 3)})
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--orders", type=int, default=40000)
+    args = parser.parse_args()
+    for threads in (1, 2, 4, 8):
+        rate = run(args.products, args.orders, threads)
+        print(f"threads={threads:<2} orders/sec={rate:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Measures ShardedInventory stock-update throughput against shard count.
+
+Updates are sent with update_quantities in batches, one message per shard
+per batch. On a machine with enough cores, throughput should rise close to
+linearly with the shard count.
+
+Usage:
+    python -m benchmarks.sharded_updates [--products N] [--updates N]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from src.category import Category
+from src.product_factory import ProductFactory
+from src.sharding import ShardedInventory
+
+
+def run(shards: int, products: int, updates: int, batch: int) -> float:
+    """Applies ``updates`` stock changes and returns updates/sec."""
+    category = Category("Electronics", "Devices and gadgets")
+    catalog = ProductFactory.create_products(
+        [(f"Item {i}", 10.0, category, 10**9) for i in range(products)]
+    )
+    rng = random.Random(0)
+    skus = [product.id for product in catalog]
+    changes = [(rng.choice(skus), -1) for _ in range(updates)]
+    with ShardedInventory(shards) as inventory:
+        inventory.add_products(catalog)
+        start = time.perf_counter()
+        for offset in range(0, updates, batch):
+            inventory.update_quantities(changes[offset : offset + batch])
+        return updates / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--products", type=int, default=100000)
+    parser.add_argument("--updates", type=int, default=400000)
+    parser.add_argument("--batch", type=int, default=20000)
+    args = parser.parse_args()
+    shards = 1
+    while shards <= (os.cpu_count() or 1):
+        rate = run(shards, args.products, args.updates, args.batch)
+        print(f"shards={shards:<2} updates/sec={rate:,.0f}")
+        shards *= 2
+
+
+if __name__ == "__main__":
+    main()
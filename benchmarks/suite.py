@@ -0,0 +1,248 @@
+"""
+Times the inventory hot paths on synthetic catalogs and saves the results.
+
+For every catalog size the suite measures ProductFactory.create_product,
+InventoryManager.add_product, get_product_by_id, get_products_by_category,
+Product.update_quantity from several threads on a small hot set of SKUs,
+and the memory held per product. Catalogs are generated from a fixed seed
+so runs are comparable; each timing is the best of ``--repeat`` runs.
+
+Usage:
+    python -m benchmarks.suite [--sizes N ...] [--output FILE]
+                               [--compare FILE] [--tolerance FRACTION]
+
+Sizes from 10k to 10M are supported; 10M needs several GB of memory.
+With --compare, results are checked against an earlier JSON file and the
+exit status is 1 if any timing or memory figure regressed by more than the tolerance.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+from src.category import Category
+from src.inventory import InventoryManager
+from src.product_factory import ProductFactory
+
+CATEGORIES = 20
+LOOKUPS = 100000
+UPDATES = 200000
+THREADS = 4
+HOT_SKUS = 64
+# Metrics where a larger value is worse, checked by --compare.
+COMPARED = ("ns_per_op", "bytes_per_product", "bytes_per_indexed_product")
+
+
+def catalog_rows(size: int, seed: int = 0) -> list:
+    """Builds ``size`` reproducible ``(name, price, category, quantity)`` rows."""
+    rng = random.Random(seed)
+    categories = [Category(f"Category {i}", "Synthetic") for i in range(CATEGORIES)]
+    return [
+        (
+            f"Item {i}",
+            round(rng.uniform(1, 1000), 2),
+            categories[i % CATEGORIES],
+            rng.randrange(10**6, 10**7),
+        )
+        for i in range(size)
+    ]
+
+
+def best_of(repeat: int, function) -> float:
+    """Runs ``function`` ``repeat`` times and returns the fastest wall time."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def bench_create_product(rows, repeat) -> dict:
+    def create():
+        for name, price, category, quantity in rows:
+            ProductFactory.create_product(name, price, category, quantity)
+
+    seconds = best_of(repeat, create)
+    return {"ns_per_op": seconds / len(rows) * 1e9}
+
+
+def bench_add_product(products, repeat) -> dict:
+    def add():
+        inventory = InventoryManager()
+        for product in products:
+            inventory.add_product(product)
+        for product in products:  # Detach so the next run can add them again.
+            product.remove_observer(inventory)
+
+    seconds = best_of(repeat, add)
+    return {"ns_per_op": seconds / len(products) * 1e9}
+
+
+def bench_get_product_by_id(inventory, products, repeat) -> dict:
+    rng = random.Random(1)
+    ids = [rng.choice(products).id for _ in range(LOOKUPS)]
+
+    def lookup():
+        get = inventory.get_product_by_id
+        for product_id in ids:
+            get(product_id)
+
+    seconds = best_of(repeat, lookup)
+    return {"ns_per_op": seconds / len(ids) * 1e9}
+
+
+def bench_get_products_by_category(inventory, products, repeat) -> dict:
+    categories = list({product.category: None for product in products})
+
+    def lookup():
+        for category in categories:
+            inventory.get_products_by_category(category)
+
+    seconds = best_of(repeat, lookup)
+    return {
+        "ns_per_op": seconds / len(categories) * 1e9,
+        "products_per_category": len(products) // len(categories),
+    }
+
+
+def bench_update_quantity(products, repeat) -> dict:
+    hot = products[:HOT_SKUS]
+    per_thread = UPDATES // THREADS
+
+    def contend():
+        def worker(seed):
+            rng = random.Random(seed)
+            picks = [rng.choice(hot) for _ in range(per_thread)]
+            for product in picks:
+                product.update_quantity(-1)
+
+        threads = [
+            threading.Thread(target=worker, args=(i,)) for i in range(THREADS)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    seconds = best_of(repeat, contend)
+    return {
+        "ns_per_op": seconds / (per_thread * THREADS) * 1e9,
+        "threads": THREADS,
+        "hot_skus": HOT_SKUS,
+    }
+
+
+def bench_memory(rows) -> dict:
+    """Measures bytes held per product, bare and once indexed."""
+    gc.collect()
+    tracemalloc.start()
+    products = ProductFactory.create_products(rows)
+    bare = tracemalloc.get_traced_memory()[0]
+    inventory = InventoryManager()
+    inventory.add_products(products)
+    indexed = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return {
+        "bytes_per_product": bare / len(rows),
+        "bytes_per_indexed_product": indexed / len(rows),
+        "sample": len(rows),
+    }
+
+
+def run(size: int, repeat: int, memory_sample: int) -> dict:
+    """Runs every benchmark on a catalog of ``size`` products."""
+    rows = catalog_rows(size)
+    results = {"create_product": bench_create_product(rows, repeat)}
+    products = ProductFactory.create_products(rows)
+    results["add_product"] = bench_add_product(products, repeat)
+    inventory = InventoryManager()
+    inventory.add_products(products)
+    results["get_product_by_id"] = bench_get_product_by_id(
+        inventory, products, repeat
+    )
+    results["get_products_by_category"] = bench_get_products_by_category(
+        inventory, products, repeat
+    )
+    results["update_quantity_contended"] = bench_update_quantity(products, repeat)
+    del inventory, products
+    results["memory"] = bench_memory(rows[: min(size, memory_sample)])
+    return results
+
+
+def environment() -> dict:
+    """Describes the interpreter, machine and commit the results came from."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list:
+    """Lists the metrics that grew past ``baseline`` by more than ``tolerance``."""
+    regressions = []
+    for size, results in current["results"].items():
+        for name, metrics in results.items():
+            before = baseline["results"].get(size, {}).get(name, {})
+            for metric in COMPARED:
+                if metric not in metrics or metric not in before:
+                    continue
+                ratio = metrics[metric] / before[metric]
+                print(f"size={size:<9} {name:<26} {metric:<26} {ratio:5.2f}x")
+                if ratio > 1 + tolerance:
+                    regressions.append((size, name, metric, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--memory-sample", type=int, default=100000)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    report = {"environment": environment(), "results": {}}
+    for size in args.sizes:
+        results = run(size, args.repeat, args.memory_sample)
+        report["results"][str(size)] = results
+        for name, metrics in results.items():
+            summary = ", ".join(
+                f"{key}={value:,.1f}" if isinstance(value, float) else f"{key}={value}"
+                for key, value in metrics.items()
+            )
+            print(f"size={size:<9} {name:<26} {summary}")
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Results saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed past the tolerance.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
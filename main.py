@@ -1,8 +1,14 @@
 import tkinter as tk
+from tkinter import filedialog
 from tkinter import messagebox
 from tkinter import ttk
+from src.background import BackgroundTasks
+from src.catalog_io import import_catalog
 from src.category import Category
+from src.change_feed import ChangeFeed
+from src.indexes import NameIndex
 from src.product_factory import ProductFactory
+from src.product_list import ProductListModel, ProductListView
 from src.inventory import InventoryManager
 
 
@@ -21,22 +27,41 @@ product2 = ProductFactory.create_product("T-Shirt", 19.99, clothing, 50)
 inventory.add_product(product1)
 inventory.add_product(product2)
 
+# The product list applies changes from this feed instead of reloading
+feed = ChangeFeed(inventory)
+
 
 # GUI Setup
 root = tk.Tk()
 root.title("E-commerce Inventory Management")
-root.geometry("700x500")
+root.geometry("760x560")
+
+# Slow work runs on worker threads; results come back through root.after()
+tasks = BackgroundTasks()
+tasks.attach(root)
+import_task = None
+
 
+# **Function to Report Background Errors**
+def show_error(error):
+    status_var.set("")
+    messagebox.showerror("Error", str(error))
 
-# **Function to Update Product Listbox**
+
+# **Function to Show All Products**
 def update_product_list():
-    product_listbox.delete(0, tk.END)  # Clear listbox
-    for product in inventory.products.values():
-        product_listbox.insert(
-            tk.END,
-            f"ID={product.id}, Name={product.name}, Price=${product.price}, "
-            f"Category={product.category.name}, Quantity={product.quantity}",
-        )
+    status_var.set("Loading products...")
+    tasks.submit(
+        lambda task: inventory.get_all_products(),
+        on_done=show_products,
+        on_error=show_error,
+        channel="list",
+    )
+
+
+def show_products(products, predicate=None):
+    status_var.set("")
+    product_view.show(products, predicate)
 
 
 # **Function to Add a Product**
@@ -67,7 +92,6 @@ def add_product():
 
         new_product = ProductFactory.create_product(name, price, category, quantity)
         inventory.add_product(new_product)
-        update_product_list()
         messagebox.showinfo("Success", "Product added successfully!")
 
     except ValueError:
@@ -78,38 +102,52 @@ def add_product():
 
 # **Function to Remove Selected Product**
 def remove_product():
-    selected = product_listbox.curselection()
-    if not selected:
+    product_id = product_view.selected_sku()
+    if product_id is None:
         messagebox.showerror("Error", "Please select a product to remove.")
         return
 
-    selected_text = product_listbox.get(selected[0])
-    product_id = selected_text.split(",")[0].split("=")[1].strip()  # Extract ID
-
     try:
         inventory.remove_product(product_id)
-        update_product_list()
         messagebox.showinfo("Success", "Product removed successfully.")
     except ValueError:
         messagebox.showerror("Error", "Product not found.")
 
 
-# **Function to Search Product by ID**
+# **Function to Search Product by ID or Name**
 def search_product():
-    product_id = search_entry.get().strip()
-    if not product_id:
-        messagebox.showerror("Error", "Enter a product ID to search.")
+    query = search_entry.get().strip()
+    if not query:
+        messagebox.showerror("Error", "Enter a product ID or name to search.")
         return
 
-    product = inventory.get_product_by_id(product_id)
-    if product:
-        messagebox.showinfo(
-            "Product Found",
-            f"ID={product.id}, Name={product.name}, Price=${product.price}, "
-            f"Category={product.category.name}, Quantity={product.quantity}",
-        )
-    else:
-        messagebox.showerror("Error", "Product not found.")
+    def find(task):
+        product = inventory.get_product_by_id(query)
+        if product:
+            return product, []
+        return None, inventory.search_by_name(query, limit=100)
+
+    def show_matches(result):
+        product, matches = result
+        status_var.set("")
+        if product:
+            messagebox.showinfo(
+                "Product Found",
+                f"ID={product.id}, Name={product.name}, Price=${product.price}, "
+                f"Category={product.category.name}, Quantity={product.quantity}",
+            )
+        elif not matches:
+            messagebox.showerror("Error", "Product not found.")
+        else:
+            # Show best matches first; later matching products are appended
+            show_products(
+                matches,
+                lambda product: NameIndex.name_matches(query, product.name),
+            )
+
+    # A newer search or filter cancels this one
+    status_var.set("Searching...")
+    tasks.submit(find, on_done=show_matches, on_error=show_error, channel="list")
 
 
 # **Function to Filter Products by Category**
@@ -124,18 +162,66 @@ def filter_by_category():
         messagebox.showerror("Error", "Please select 'Electronics' or 'Clothing'.")
         return
 
-    filtered_products = inventory.get_products_by_category(category)
+    def show_filtered(filtered_products):
+        show_products(
+            filtered_products, lambda product: product.category is category
+        )
+        if not filtered_products:
+            messagebox.showinfo("No Products", "No products found in this category.")
+
+    status_var.set("Filtering...")
+    tasks.submit(
+        lambda task: inventory.get_products_by_category(category),
+        on_done=show_filtered,
+        on_error=show_error,
+        channel="list",
+    )
+
+
+# **Function to Import a Catalog File in the Background**
+def import_products():
+    global import_task
+    path = filedialog.askopenfilename(
+        filetypes=[("Catalogs", "*.csv *.jsonl *.ndjson"), ("All files", "*")]
+    )
+    if not path:
+        return
 
-    product_listbox.delete(0, tk.END)  # Clear listbox
-    if filtered_products:
-        for product in filtered_products:
-            product_listbox.insert(
-                tk.END,
-                f"ID={product.id}, Name={product.name}, Price=${product.price}, "
-                f"Category={product.category.name}, Quantity={product.quantity}",
-            )
-    else:
-        messagebox.showinfo("No Products", "No products found in this category.")
+    def run(task):
+        categories = {"Electronics": electronics, "Clothing": clothing}
+        return import_catalog(
+            path,
+            inventory,
+            categories,
+            progress=lambda report: task.report(report.imported),
+        )
+
+    def finished(report):
+        status_var.set("")
+        cancel_button.config(state=tk.DISABLED)
+        messagebox.showinfo("Import Finished", str(report))
+
+    def failed(error):
+        cancel_button.config(state=tk.DISABLED)
+        show_error(error)
+
+    import_task = tasks.submit(
+        run,
+        on_done=finished,
+        on_error=failed,
+        on_progress=lambda done, total: status_var.set(f"Imported {done} products"),
+        channel="import",
+    )
+    cancel_button.config(state=tk.NORMAL)
+    status_var.set("Importing...")
+
+
+# **Function to Cancel a Running Import**
+def cancel_import():
+    if import_task is not None:
+        import_task.cancel()
+    cancel_button.config(state=tk.DISABLED)
+    status_var.set("Import cancelled; products already read were kept.")
 
 
 # **Create Frames for Better Organization**
@@ -152,9 +238,10 @@ frame4 = tk.Frame(root)
 frame4.pack(pady=10)
 
 # **Widgets**
-product_listbox = tk.Listbox(root, width=100, height=10)
-product_listbox.pack(pady=10)
-update_product_list()  # Load initial product list
+product_view = ProductListView(
+    root, ProductListModel(inventory), subscription=feed.subscribe(), height=10
+)
+product_view.pack(pady=10, fill="x", padx=10)
 
 
 # **Add Product Section**
@@ -186,9 +273,20 @@ remove_button = tk.Button(
 )
 remove_button.grid(row=0, column=0, padx=5, pady=5)
 
+import_button = tk.Button(frame2, text="Import Catalog...", command=import_products)
+import_button.grid(row=0, column=1, padx=5, pady=5)
+
+cancel_button = tk.Button(
+    frame2, text="Cancel Import", command=cancel_import, state=tk.DISABLED
+)
+cancel_button.grid(row=0, column=2, padx=5, pady=5)
+
+status_var = tk.StringVar()
+tk.Label(frame2, textvariable=status_var).grid(row=1, column=0, columnspan=3)
 
-# **Search Product by ID**
-tk.Label(frame3, text="Search Product by ID").grid(row=0, column=0)
+
+# **Search Product by ID or Name**
+tk.Label(frame3, text="Search Product by ID or Name").grid(row=0, column=0)
 
 search_entry = tk.Entry(frame3, width=20)
 search_entry.grid(row=0, column=1, padx=5, pady=5)
@@ -208,6 +306,9 @@ category_filter_dropdown.grid(row=0, column=1, padx=5, pady=5)
 filter_button = tk.Button(frame4, text="Filter", command=filter_by_category)
 filter_button.grid(row=0, column=2, padx=5, pady=5)
 
+show_all_button = tk.Button(frame4, text="Show All", command=update_product_list)
+show_all_button.grid(row=0, column=3, padx=5, pady=5)
+
 
 # **Run the Tkinter Main Loop**
 root.mainloop()
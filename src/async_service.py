@@ -0,0 +1,163 @@
+import asyncio
+import functools
+import json
+
+from .product_factory import ProductFactory
+from .reservations import ReservationManager
+
+
+class AsyncInventoryService:
+    """
+    asyncio facade over an inventory.
+
+    Every call runs the underlying (possibly blocking) inventory method on an
+    executor so the event loop never stalls. Concurrent identical reads are
+    coalesced: while one lookup for a key is in flight, other callers await
+    the same result instead of starting their own.
+
+    Attributes:
+        inventory (InventoryManager): The wrapped inventory.
+        reservations (ReservationManager): Reservations against the inventory.
+        categories (dict): Category name to Category, for requests by name.
+    """
+
+    def __init__(self, inventory, categories=None, reservations=None, executor=None):
+        """
+        Initializes the service.
+
+        Args:
+            inventory (InventoryManager): The inventory to expose.
+            categories (dict, optional): Category name to Category.
+            reservations (ReservationManager, optional): Created when omitted.
+            executor (concurrent.futures.Executor, optional): Where blocking
+                calls run; the loop's default executor when omitted.
+        """
+        self.inventory = inventory
+        self.categories = {} if categories is None else categories
+        self.reservations = reservations or ReservationManager(inventory)
+        self._executor = executor
+        self._inflight = {}  # read key -> Future
+
+    async def add_product(self, name, price, category, quantity):
+        """Creates a product through ProductFactory and adds it."""
+        if isinstance(category, str):
+            category = self.category(category)
+        product = ProductFactory.create_product(name, price, category, quantity)
+        await self._run(self.inventory.add_product, product)
+        return product
+
+    async def get_product(self, product_id):
+        """Looks up a product by SKU."""
+        return await self._coalesce(
+            ("get", product_id), self.inventory.get_product_by_id, product_id
+        )
+
+    async def get_products_by_category(self, category):
+        """Lists the products of a category, given as a Category or a name."""
+        if isinstance(category, str):
+            category = self.category(category)
+        return await self._coalesce(
+            ("category", category),
+            self.inventory.get_products_by_category,
+            category,
+        )
+
+    async def reserve(self, product_id, quantity, ttl=None):
+        """Holds stock for a pending order and returns the reservation id."""
+        return await self._run(self.reservations.reserve, product_id, quantity, ttl)
+
+    async def commit(self, reservation_id):
+        """Makes a reservation final."""
+        await self._run(self.reservations.commit, reservation_id)
+
+    async def release(self, reservation_id):
+        """Cancels a reservation and returns its stock."""
+        await self._run(self.reservations.release, reservation_id)
+
+    async def checkout(self, basket):
+        """Applies a basket of stock changes atomically."""
+        await self._run(self.inventory.checkout, basket)
+
+    def category(self, name):
+        """
+        Returns the registered category with this name.
+
+        Raises:
+            ValueError: If no such category is registered.
+        """
+        try:
+            return self.categories[name]
+        except KeyError:
+            raise ValueError(f"Unknown category: {name!r}")
+
+    async def _run(self, function, *args):
+        """Runs a blocking call on the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(function, *args)
+        )
+
+    async def _coalesce(self, key, function, *args):
+        """Runs a read, sharing the result with identical reads in flight."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(function, *args))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+
+async def serve(service, host="127.0.0.1", port=0):
+    """
+    Starts a JSON Lines TCP front end for load testing a service.
+
+    Each request line is an object with an ``op`` of ``"get"`` (``id``),
+    ``"category"`` (``name``), ``"add"`` (``name``, ``price``, ``category``,
+    ``quantity``), ``"reserve"`` (``id``, ``quantity``), ``"commit"`` or
+    ``"release"`` (``reservation``). Each reply line is
+    ``{"ok": true, "result": ...}`` or ``{"ok": false, "error": ...}``.
+
+    Args:
+        service (AsyncInventoryService): The service to expose.
+        host (str): The interface to bind.
+        port (int): The port to bind; 0 picks a free one.
+
+    Returns:
+        asyncio.AbstractServer: The running server.
+    """
+
+    async def handle(reader, writer):
+        async for line in reader:
+            try:
+                result = await _dispatch(service, json.loads(line))
+                reply = {"ok": True, "result": result}
+            except (ValueError, TypeError, KeyError) as error:
+                reply = {"ok": False, "error": str(error)}
+            writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+            await writer.drain()
+        writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+async def _dispatch(service, request):
+    """Executes one decoded request against the service."""
+    op = request["op"]
+    if op == "get":
+        product = await service.get_product(request["id"])
+        return None if product is None else product.get_details()
+    if op == "category":
+        products = await service.get_products_by_category(request["name"])
+        return [product.get_details() for product in products]
+    if op == "add":
+        product = await service.add_product(
+            request["name"], request["price"], request["category"], request["quantity"]
+        )
+        return product.id
+    if op == "reserve":
+        return await service.reserve(request["id"], request["quantity"])
+    if op == "commit":
+        return await service.commit(request["reservation"])
+    if op == "release":
+        return await service.release(request["reservation"])
+    raise ValueError(f"Unknown op: {op!r}")
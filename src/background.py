@@ -0,0 +1,209 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task that has been cancelled or superseded."""
+
+
+class Task:
+    """
+    Handle for work submitted to ``BackgroundTasks``.
+
+    The running function receives its Task and uses it to report progress
+    and to notice cancellation; both are cooperative.
+
+    Attributes:
+        channel (str): Tasks on the same channel supersede each other.
+        cancelled (bool): Whether the task was cancelled or superseded.
+    """
+
+    def __init__(self, runner, channel):
+        """Initializes a Task. Use ``BackgroundTasks.submit`` instead."""
+        self.channel = channel
+        self.cancelled = False
+        self._runner = runner
+
+    def cancel(self):
+        """Cancels the task; its callbacks will not run."""
+        self.cancelled = True
+
+    def check(self):
+        """
+        Stops the task if it has been cancelled.
+
+        Raises:
+            TaskCancelled: If the task was cancelled or superseded.
+        """
+        if self.cancelled:
+            raise TaskCancelled()
+
+    def report(self, done, total=None):
+        """
+        Publishes progress, then stops the task if it has been cancelled.
+
+        Only the latest report is delivered when several arrive between
+        two dispatches.
+
+        Args:
+            done: Work completed so far, e.g. a count of rows.
+            total (optional): The amount of work expected, when known.
+
+        Raises:
+            TaskCancelled: If the task was cancelled or superseded.
+        """
+        self.check()
+        self._runner._post(self, "progress", (done, total))
+
+
+class BackgroundTasks:
+    """
+    Runs slow work on a thread pool and hands results back to one thread.
+
+    ``submit`` starts a function on a worker; its outcome, and any progress
+    it reports, are queued and only delivered when ``dispatch`` is called,
+    so callbacks always run on the thread that owns the GUI. ``attach``
+    makes a Tk widget call ``dispatch`` through ``after()`` polling.
+    Submitting on a channel cancels the task still running there, so a
+    newer search or filter always wins over an older one.
+
+    Example Usage:
+        tasks = BackgroundTasks()
+        tasks.attach(root)
+        tasks.submit(
+            lambda task: inventory.search_by_name(query, 100),
+            on_done=show_results,
+            channel="list",
+        )
+    """
+
+    def __init__(self, workers: int = 2):
+        """
+        Initializes the worker pool.
+
+        Args:
+            workers (int): The number of worker threads.
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="inventory-task"
+        )
+        self._events = queue.SimpleQueue()
+        self._channels = {}  # channel -> Task
+        self._callbacks = {}  # Task -> (on_done, on_error, on_progress)
+        self._progress = {}  # Task -> latest unsent progress
+        self._lock = threading.Lock()
+
+    def submit(
+        self, function, on_done=None, on_error=None, on_progress=None, channel=None
+    ) -> Task:
+        """
+        Starts ``function(task)`` on a worker thread.
+
+        Args:
+            function (callable): The work; receives its Task.
+            on_done (callable, optional): Called with the return value.
+            on_error (callable, optional): Called with a raised exception.
+            on_progress (callable, optional): Called with ``(done, total)``.
+            channel (str, optional): Cancels the task running on this channel.
+
+        Returns:
+            Task: The handle for progress and cancellation.
+        """
+        task = Task(self, channel)
+        with self._lock:
+            if channel is not None:
+                previous = self._channels.get(channel)
+                if previous is not None:
+                    previous.cancel()
+                self._channels[channel] = task
+            self._callbacks[task] = (on_done, on_error, on_progress)
+        self._executor.submit(self._run, task, function)
+        return task
+
+    def pending(self, channel=None) -> bool:
+        """Checks whether any task, or the task on ``channel``, is unfinished."""
+        with self._lock:
+            if channel is None:
+                return bool(self._callbacks)
+            task = self._channels.get(channel)
+            return task is not None and task in self._callbacks
+
+    def dispatch(self) -> int:
+        """
+        Runs the callbacks of everything that finished or reported progress.
+
+        Call this from the thread that owns the GUI.
+
+        Returns:
+            int: The number of callbacks run.
+        """
+        calls = 0
+        while True:
+            try:
+                task, kind, value = self._events.get_nowait()
+            except queue.Empty:
+                return calls
+            with self._lock:
+                if kind == "progress":
+                    callbacks = self._callbacks.get(task)
+                    value = self._progress.pop(task)
+                else:
+                    callbacks = self._callbacks.pop(task)
+                    self._progress.pop(task, None)
+                    if self._channels.get(task.channel) is task:
+                        del self._channels[task.channel]
+            if callbacks is None or task.cancelled:
+                continue
+            on_done, on_error, on_progress = callbacks
+            if kind == "progress" and on_progress is not None:
+                on_progress(*value)
+            elif kind == "done" and on_done is not None:
+                on_done(value)
+            elif kind == "error" and on_error is not None:
+                on_error(value)
+            else:
+                continue
+            calls += 1
+
+    def attach(self, widget, interval_ms: int = 50):
+        """
+        Polls for results from a Tk widget's event loop.
+
+        Args:
+            widget (tk.Misc): Any widget; its ``after`` schedules the polls.
+            interval_ms (int): Milliseconds between polls.
+        """
+
+        def poll():
+            self.dispatch()
+            widget.after(interval_ms, poll)
+
+        widget.after(interval_ms, poll)
+
+    def shutdown(self):
+        """Cancels everything queued and stops the workers."""
+        with self._lock:
+            for task in self._callbacks:
+                task.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _run(self, task, function):
+        """Worker side: runs a task and queues its outcome."""
+        try:
+            task.check()
+            self._post(task, "done", function(task))
+        except TaskCancelled:
+            self._post(task, "cancelled", None)
+        except Exception as error:  # Delivered to on_error on the GUI thread.
+            self._post(task, "error", error)
+
+    def _post(self, task, kind, value):
+        """Queues an event; progress is coalesced to the latest value."""
+        if kind == "progress":
+            with self._lock:
+                first = task not in self._progress
+                self._progress[task] = value
+            if not first:
+                return
+        self._events.put((task, kind, value))
@@ -0,0 +1,340 @@
+import csv
+import json
+import math
+import os
+from contextlib import contextmanager
+from itertools import islice
+
+from .category import Category
+from .product import sku_bytes
+from .product_factory import ProductFactory
+
+FIELDS = ("id", "name", "price", "category", "quantity")
+# Rejected rows kept in an ImportReport; later ones are only counted.
+MAX_REJECTED = 1000
+
+
+class ImportReport:
+    """
+    Summary of a catalog import.
+
+    Attributes:
+        imported (int): The number of products added to the inventory.
+        rejected (list): ``(line_number, reason)`` pairs for the first
+            ``MAX_REJECTED`` skipped rows.
+        rejected_count (int): The number of skipped rows, including those
+            past ``MAX_REJECTED``.
+    """
+
+    def __init__(self):
+        """Initializes an empty report."""
+        self.imported = 0
+        self.rejected = []
+        self.rejected_count = 0
+
+    def reject(self, line_number: int, reason: str):
+        """Records a skipped row; only the first ``MAX_REJECTED`` are kept."""
+        self.rejected_count += 1
+        if len(self.rejected) < MAX_REJECTED:
+            self.rejected.append((line_number, reason))
+
+    def __str__(self) -> str:
+        """Returns a readable string representation of the report."""
+        return (
+            f"ImportReport[Imported={self.imported}, "
+            f"Rejected={self.rejected_count}]"
+        )
+
+
+def detect_format(path) -> str:
+    """
+    Infers the catalog format from a file name.
+
+    Args:
+        path (str): The catalog file path.
+
+    Returns:
+        str: ``"csv"`` or ``"jsonl"``.
+
+    Raises:
+        ValueError: If the extension is not recognised.
+    """
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot infer catalog format from {path!r}.")
+
+
+@contextmanager
+def _open(target, mode):
+    """
+    Opens a path, or passes through an already open text stream.
+
+    Bytes that are not valid UTF-8 are read as lone surrogates, so one bad
+    row can be rejected without abandoning the rest of the file.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        errors = "surrogateescape" if mode == "r" else "strict"
+        with open(
+            target, mode, newline="", encoding="utf-8", errors=errors
+        ) as handle:
+            yield handle
+    else:
+        yield target
+
+
+def read_rows(source, fmt=None):
+    """
+    Streams raw rows from a CSV or JSON Lines catalog.
+
+    Args:
+        source (str or file): A path or an open text stream.
+        fmt (str, optional): ``"csv"`` or ``"jsonl"``; inferred from the path
+            when omitted.
+
+    Yields:
+        tuple: ``(line_number, row)`` where row is a dict, or an error string
+        for a line that could not be decoded.
+    """
+    fmt = fmt or detect_format(source)
+    with _open(source, "r") as handle:
+        if fmt == "csv":
+            consumed = [0]  # csv.Error can leave line_num behind the reader
+
+            def lines():
+                for line in handle:
+                    consumed[0] += 1
+                    yield line
+
+            reader = csv.DictReader(lines())
+            while True:
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error as error:
+                    yield consumed[0], f"Malformed CSV: {error}"
+                    continue
+                except UnicodeDecodeError:
+                    yield consumed[0] + 1, _UNDECODABLE_STREAM
+                    return
+                text = "".join(v for v in row.values() if isinstance(v, str))
+                if not _decodable(text):
+                    yield reader.line_num, _UNDECODABLE
+                    continue
+                yield reader.line_num, row
+        elif fmt == "jsonl":
+            line_number = 0
+            try:
+                for line_number, line in enumerate(handle, start=1):
+                    if not line.strip():
+                        continue
+                    if not _decodable(line):
+                        yield line_number, _UNDECODABLE
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except json.JSONDecodeError as error:
+                        yield line_number, f"Invalid JSON: {error.msg}"
+                        continue
+                    if not isinstance(row, dict):
+                        yield line_number, "Expected a JSON object."
+                        continue
+                    yield line_number, row
+            except UnicodeDecodeError:
+                yield line_number + 1, _UNDECODABLE_STREAM
+        else:
+            raise ValueError(f"Unsupported catalog format: {fmt!r}")
+
+
+_UNDECODABLE = "Invalid UTF-8."
+_UNDECODABLE_STREAM = "Invalid UTF-8; the rest of the stream was skipped."
+
+
+def _decodable(text: str) -> bool:
+    """Checks that text holds no bytes escaped by ``surrogateescape``."""
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def parse_row(row, categories):
+    """
+    Validates one raw row and converts it for ``ProductFactory.create_products``.
+
+    Args:
+        row (dict): The raw row with ``name``, ``price``, ``category``,
+            ``quantity`` and optionally ``id``.
+        categories (dict): Category name to Category; unknown names are added.
+
+    Returns:
+        tuple: ``(name, price, category, quantity, sku)``.
+
+    Raises:
+        ValueError: If the row is incomplete or holds invalid values.
+    """
+    name = str(row.get("name") or "").strip()
+    category_name = str(row.get("category") or "").strip()
+    if not name or not category_name:
+        raise ValueError("Name and category are required.")
+    try:
+        price = _to_price(row["price"])
+        quantity = _to_integer(row["quantity"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Price must be a number and quantity an integer.")
+    if not math.isfinite(price) or price < 0 or quantity < 0:
+        raise ValueError("Price and quantity must be non-negative.")
+    sku = None
+    if row.get("id"):
+        sku = sku_bytes(str(row["id"]).strip())
+        if sku is None:
+            raise ValueError(f"Invalid SKU: {row['id']!r}")
+    category = categories.get(category_name)
+    if category is None:
+        category = categories[category_name] = Category(category_name, "")
+    return name, price, category, quantity, sku
+
+
+def parse_change(row):
+    """
+    Validates one raw row of a price and stock update.
+
+    Args:
+        row (dict): The raw row with ``id`` and optionally ``price`` (the new
+            price) and ``quantity_change`` (units to add, negative to
+            remove). Blank values are left unchanged.
+
+    Returns:
+        tuple: ``(sku, price, quantity_change)``; the last two may be None.
+
+    Raises:
+        ValueError: If the SKU or a value is invalid, or the row has an
+            absolute ``quantity`` column, as a catalog export does.
+    """
+    sku = sku_bytes(str(row.get("id") or "").strip())
+    if sku is None:
+        raise ValueError(f"Invalid SKU: {row.get('id')!r}")
+    if row.get("quantity") not in (None, ""):
+        raise ValueError("Use quantity_change; quantity is absolute stock.")
+    price, change = row.get("price"), row.get("quantity_change")
+    try:
+        price = None if price in (None, "") else _to_price(price)
+        change = None if change in (None, "") else _to_integer(change)
+    except (TypeError, ValueError):
+        raise ValueError("Price must be a number and quantity_change an integer.")
+    if price is not None and not 0 <= price < math.inf:
+        raise ValueError("Price must be finite and non-negative.")
+    return sku, price, change
+
+
+def _to_price(value) -> float:
+    """Converts a raw price; JSON booleans are not prices."""
+    if isinstance(value, bool):
+        raise TypeError("Expected a number.")
+    return float(value)
+
+
+def _to_integer(value) -> int:
+    """Converts a raw count; JSON booleans and floats such as 2.5 are rejected."""
+    if isinstance(value, (bool, float)):
+        raise TypeError("Expected an integer.")
+    return int(value)
+
+
+def import_catalog(
+    source, inventory, categories=None, fmt=None, chunk_size=10000, progress=None
+):
+    """
+    Streams a catalog into an inventory, one chunk at a time.
+
+    Invalid rows, including malformed CSV and bytes that are not UTF-8, and
+    rows whose SKU is already present are skipped and counted in the report;
+    the rest of the chunk is still imported. Only one chunk of rows and the
+    first ``MAX_REJECTED`` rejections are held in memory at once.
+
+    Args:
+        source (str or file): A path or an open text stream.
+        inventory (InventoryManager): The inventory to fill.
+        categories (dict, optional): Category name to Category, used to
+            resolve each row's category and extended with new names.
+        fmt (str, optional): ``"csv"`` or ``"jsonl"``; inferred when omitted.
+        chunk_size (int): The number of rows validated and inserted together.
+        progress (callable, optional): Called with the report after each
+            chunk; an exception raised from it stops the import, keeping
+            the chunks already inserted.
+
+    Returns:
+        ImportReport: Counts of imported rows and the rejected rows.
+    """
+    categories = {} if categories is None else categories
+    report = ImportReport()
+    rows = read_rows(source, fmt)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return report
+        parsed, seen = [], set()
+        for line_number, row in chunk:
+            if isinstance(row, str):
+                report.reject(line_number, row)
+                continue
+            try:
+                values = parse_row(row, categories)
+            except ValueError as error:
+                report.reject(line_number, str(error))
+                continue
+            sku = values[4]
+            if sku is not None:
+                if sku in seen or inventory.get_product_by_id(sku) is not None:
+                    report.reject(line_number, "Duplicate SKU.")
+                    continue
+                seen.add(sku)
+            parsed.append(values)
+        inventory.add_products(ProductFactory.create_products(parsed))
+        report.imported += len(parsed)
+        if progress is not None:
+            progress(report)
+
+
+def export_catalog(products, target, fmt=None) -> int:
+    """
+    Streams products to a CSV or JSON Lines catalog.
+
+    Rows are written as the products are iterated, so exporting an
+    inventory never builds the whole catalog in memory.
+
+    Args:
+        products (iterable): The products to write, e.g.
+            ``inventory.iter_products()``.
+        target (str or file): A path or an open text stream.
+        fmt (str, optional): ``"csv"`` or ``"jsonl"``; inferred when omitted.
+
+    Returns:
+        int: The number of products written.
+    """
+    fmt = fmt or detect_format(target)
+    if fmt not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported catalog format: {fmt!r}")
+    count = 0
+    with _open(target, "w") as handle:
+        if fmt == "csv":
+            writer = csv.writer(handle)
+            writer.writerow(FIELDS)
+        for product in products:
+            values = (
+                product.id,
+                product.name,
+                product.price,
+                product.category.name,
+                product.quantity,
+            )
+            if fmt == "csv":
+                writer.writerow(values)
+            else:
+                handle.write(json.dumps(dict(zip(FIELDS, values))) + "\n")
+            count += 1
+    return count
@@ -1,12 +1,20 @@
+import sys
+
+
 class Category:
     """
     Represents a product category.
 
+    Categories use ``__slots__`` and intern their name, so the many products
+    that reference a category share one small object and one name string.
+
     Attributes:
         name (str): The name of the category.
         description (str): A short description of the category.
     """
 
+    __slots__ = ("name", "description")
+
     def __init__(self, name: str, description: str):
         """
         Initializes a Category instance.
@@ -15,7 +23,7 @@ class Category:
             name (str): The name of the category.
             description (str): A short description of the category.
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.description = description
 
     def get_details(self) -> dict[str, str]:
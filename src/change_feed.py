@@ -0,0 +1,216 @@
+import threading
+import time
+
+
+class Change:
+    """
+    One pending change to a product, as delivered to a subscriber.
+
+    Attributes:
+        seq (int): Feed sequence number of the latest event folded in.
+        op (str): ``"add"``, ``"update"``, ``"remove"`` or ``"reset"``.
+        sku (bytes): The product's SKU; None for ``"reset"``.
+        product (Product): The product object; None for ``"reset"``.
+        fields (frozenset): Attributes changed by an ``"update"``.
+    """
+
+    __slots__ = ("seq", "op", "sku", "product", "fields")
+
+    def __init__(self, seq: int, op: str, sku, product, fields=frozenset()):
+        """Initializes a Change instance."""
+        self.seq = seq
+        self.op = op
+        self.sku = sku
+        self.product = product
+        self.fields = fields
+
+    def __repr__(self):
+        return f"Change(seq={self.seq}, op={self.op!r}, fields={sorted(self.fields)})"
+
+
+class Subscription:
+    """
+    A consumer's cursor into a ``ChangeFeed``.
+
+    Pending changes are held one per SKU: a burst of updates to the same
+    product collapses into a single ``"update"`` listing every changed
+    field, an add followed by updates stays an ``"add"``, and an add
+    followed by a remove disappears. Memory is therefore bounded by the
+    number of distinct SKUs touched, and capped at ``max_pending``; a
+    subscriber that falls further behind has its backlog dropped and
+    receives a single ``"reset"`` change telling it to reload everything.
+    """
+
+    def __init__(self, feed, max_pending: int):
+        """
+        Initializes a subscription. Use ``ChangeFeed.subscribe`` instead.
+
+        Args:
+            feed (ChangeFeed): The feed delivering changes.
+            max_pending (int): The most SKUs held before a reset.
+        """
+        self.max_pending = max_pending
+        self._feed = feed
+        self._pending = {}  # SKU -> Change, oldest first
+        self._reset = None  # A pending "reset" Change, if overflowed
+
+    def poll(self, max_items: int = None) -> list:
+        """
+        Takes pending changes in sequence order without blocking.
+
+        Args:
+            max_items (int, optional): The most changes to take; the rest
+                stay pending for the next call.
+
+        Returns:
+            list: Change objects, oldest first. A ``"reset"`` change comes
+            first and alone: discard local state and reload.
+        """
+        with self._feed._condition:
+            if self._reset is not None:
+                reset, self._reset = self._reset, None
+                return [reset]
+            pending = self._pending
+            count = len(pending) if max_items is None else min(max_items, len(pending))
+            return [pending.pop(next(iter(pending))) for _ in range(count)]
+
+    def wait(self, timeout: float = None, max_items: int = None) -> list:
+        """
+        Like ``poll``, but blocks until a change is pending or ``timeout``
+        seconds pass.
+
+        Returns:
+            list: Change objects, possibly empty after a timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._feed._condition:
+            while not self._pending and self._reset is None:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return []
+                self._feed._condition.wait(remaining)
+            return self.poll(max_items)
+
+    def close(self):
+        """Stops receiving changes and drops anything pending."""
+        self._feed.unsubscribe(self)
+
+    def __len__(self) -> int:
+        return len(self._pending) + (self._reset is not None)
+
+    def _offer(self, seq, op, sku, product, field):
+        """Folds one event into the pending changes for its SKU."""
+        if self._reset is not None:
+            self._reset.seq = seq
+            return
+        fields = frozenset() if field is None else frozenset((field,))
+        previous = self._pending.pop(sku, None)
+        if previous is not None:
+            if previous.op == "add" and op == "remove":
+                return  # Never seen by the consumer; nothing to report.
+            if op == "update":
+                fields |= previous.fields
+                if previous.op == "add":
+                    op = "add"
+            elif op == "add":
+                op = "update"  # Removed then re-added under the same SKU.
+                fields = frozenset(("name", "price", "category", "quantity"))
+        if len(self._pending) >= self.max_pending:
+            self._pending.clear()
+            self._reset = Change(seq, "reset", None, None)
+            return
+        self._pending[sku] = Change(seq, op, sku, product, fields)
+
+
+class ChangeFeed:
+    """
+    Sequenced stream of inventory changes for incremental consumers.
+
+    Attach a feed to an ``InventoryManager`` and every add, remove and
+    product change is stamped with a sequence number and offered to each
+    subscription, which coalesces it with earlier pending changes to the
+    same SKU. Consumers poll (or wait) for batches and apply them as deltas
+    instead of re-reading the whole inventory.
+
+    Example Usage:
+        feed = ChangeFeed(inventory)
+        subscription = feed.subscribe()
+        ...
+        for change in subscription.poll():
+            apply(change)
+
+    Attributes:
+        sequence (int): The sequence number of the latest event.
+    """
+
+    def __init__(self, inventory=None):
+        """
+        Initializes a change feed.
+
+        Args:
+            inventory (InventoryManager, optional): An inventory to attach to.
+        """
+        self.sequence = 0
+        self._subscriptions = ()
+        self._condition = threading.Condition()
+        self._inventory = None
+        if inventory is not None:
+            self.attach(inventory)
+
+    def attach(self, inventory):
+        """
+        Starts publishing the mutations of an inventory.
+
+        Args:
+            inventory (InventoryManager): The inventory to follow.
+        """
+        self._inventory = inventory
+        inventory.add_listener(self)
+
+    def detach(self):
+        """Stops publishing; existing subscriptions keep what is pending."""
+        if self._inventory is not None:
+            self._inventory.remove_listener(self)
+            self._inventory = None
+
+    def subscribe(self, max_pending: int = 10000) -> Subscription:
+        """
+        Opens a subscription that receives changes from now on.
+
+        Args:
+            max_pending (int): The most SKUs held for a slow consumer before
+                its backlog is replaced by a ``"reset"``.
+
+        Returns:
+            Subscription: The new subscription.
+        """
+        subscription = Subscription(self, max_pending)
+        with self._condition:
+            self._subscriptions += (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Closes a subscription.
+
+        Args:
+            subscription (Subscription): The subscription to close.
+        """
+        with self._condition:
+            self._subscriptions = tuple(
+                s for s in self._subscriptions if s is not subscription
+            )
+            subscription._pending.clear()
+            subscription._reset = None
+
+    def inventory_changed(self, event, product, old_value):
+        """Listener callback that publishes one mutation."""
+        op = event if event in ("add", "remove") else "update"
+        field = None if op != "update" else event
+        with self._condition:
+            self.sequence += 1
+            for subscription in self._subscriptions:
+                subscription._offer(
+                    self.sequence, op, product.sku_bytes, product, field
+                )
+            self._condition.notify_all()
@@ -0,0 +1,253 @@
+"""
+Headless command-line interface to a journaled inventory.
+
+Usage:
+    python -m src.cli [--data DIR] import SOURCE [--format csv|jsonl]
+    python -m src.cli [--data DIR] export TARGET [--format csv|jsonl]
+    python -m src.cli [--data DIR] query [--category NAME] [--name TEXT] ...
+    python -m src.cli [--data DIR] update SOURCE [--batch-size N]
+    python -m src.cli [--data DIR] reprice FACTOR [--category NAME]
+    python -m src.cli [--data DIR] stats
+
+SOURCE and TARGET may be ``-`` for stdin and stdout, which are streamed a
+chunk at a time. The inventory lives in a ``Journal`` directory (``--data``,
+or ``$INVENTORY_DATA``); ``query``, ``export`` and ``stats`` only read it,
+and the writing commands save everything or nothing. ``update`` reads
+``id,price,quantity_change`` rows, where the change is relative. Modules
+are imported by the subcommand that needs them, so startup costs little
+more than the interpreter itself.
+"""
+
+import argparse
+import os
+import sys
+
+
+def main(argv=None) -> int:
+    """
+    Runs one CLI command.
+
+    Args:
+        argv (list, optional): Arguments without the program name; read from
+            ``sys.argv`` when omitted.
+
+    Returns:
+        int: The process exit status.
+    """
+    args = _parser().parse_args(argv)
+    try:
+        args.command(args)
+    except (ValueError, TypeError, OSError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli", description="Headless inventory management."
+    )
+    parser.add_argument(
+        "--data",
+        default=os.environ.get("INVENTORY_DATA", "inventory-data"),
+        help="journal directory holding the inventory",
+    )
+    commands = parser.add_subparsers(dest="name", required=True)
+
+    command = commands.add_parser("import", help="add products from a catalog")
+    command.add_argument("source", help="CSV or JSON Lines file, or - for stdin")
+    command.add_argument("--format", choices=("csv", "jsonl"))
+    command.add_argument("--chunk-size", type=int, default=10000)
+    command.set_defaults(command=_import)
+
+    command = commands.add_parser("export", help="write every product out")
+    command.add_argument("target", help="CSV or JSON Lines file, or - for stdout")
+    command.add_argument("--format", choices=("csv", "jsonl"))
+    command.set_defaults(command=_export)
+
+    command = commands.add_parser("query", help="print matching products")
+    command.add_argument("--category")
+    command.add_argument("--name", help="words or word prefixes in the name")
+    command.add_argument("--min-price", type=float)
+    command.add_argument("--max-price", type=float)
+    command.add_argument("--in-stock", action="store_true")
+    command.add_argument("--order-by", choices=("price", "quantity", "name"))
+    command.add_argument("--descending", action="store_true")
+    command.add_argument("--limit", type=int)
+    command.add_argument("--format", choices=("csv", "jsonl"), default="jsonl")
+    command.add_argument(
+        "--explain", action="store_true", help="print the chosen index only"
+    )
+    command.set_defaults(command=_query)
+
+    command = commands.add_parser(
+        "update",
+        help="apply id,price,quantity_change rows",
+        description="Sets new prices and adds or removes stock. quantity_change "
+        "is relative (-3 removes three units), unlike the absolute quantity "
+        "of import and export; rows with a quantity column are rejected.",
+    )
+    command.add_argument("source", help="CSV or JSON Lines file, or - for stdin")
+    command.add_argument("--format", choices=("csv", "jsonl"))
+    command.add_argument(
+        "--batch-size",
+        type=int,
+        default=100000,
+        help="rows held in memory per bulk update; nothing is saved unless "
+        "every batch succeeds",
+    )
+    command.set_defaults(command=_update)
+
+    command = commands.add_parser("reprice", help="multiply prices by a factor")
+    command.add_argument("factor", type=float, help="e.g. 1.05 for +5%%")
+    command.add_argument("--category")
+    command.set_defaults(command=_reprice)
+
+    command = commands.add_parser("stats", help="print inventory totals as JSON")
+    command.set_defaults(command=_stats)
+    return parser
+
+
+def _read_store(args, categories=None):
+    """Loads the inventory without creating or changing any file."""
+    from .journal import Journal
+
+    if not os.path.isdir(args.data):
+        raise ValueError(f"No inventory data in {args.data!r}.")
+    return Journal(args.data).load(categories=categories)
+
+
+def _write_batch(args, work, categories=None):
+    """
+    Runs ``work(inventory)`` without per-row logging, then snapshots.
+
+    Nothing reaches disk until the final snapshot, so an interrupted command
+    leaves the stored inventory as it was.
+    """
+    from .journal import Journal
+
+    journal = Journal(args.data)
+    inventory = journal.recover(categories=categories)
+    journal.detach()
+    result = work(inventory)
+    journal.attach(inventory)
+    journal.close()
+    return result
+
+
+def _stream(path):
+    """Maps ``-`` to the standard streams."""
+    return path if path != "-" else None
+
+
+def _import(args):
+    from .catalog_io import import_catalog
+
+    categories = {}
+    source = _stream(args.source) or sys.stdin
+    fmt = args.format or ("csv" if source is sys.stdin else None)
+    report = _write_batch(
+        args,
+        lambda inventory: import_catalog(
+            source, inventory, categories, fmt, args.chunk_size
+        ),
+        categories,
+    )
+    for line_number, reason in report.rejected[:20]:
+        print(f"line {line_number}: {reason}", file=sys.stderr)
+    print(report)
+
+
+def _export(args):
+    from .catalog_io import export_catalog
+
+    inventory = _read_store(args)
+    target = _stream(args.target) or sys.stdout
+    fmt = args.format or ("csv" if target is sys.stdout else None)
+    count = export_catalog(inventory.iter_products(), target, fmt)
+    print(f"Exported {count} products.", file=sys.stderr)
+
+
+def _query(args):
+    from .catalog_io import export_catalog
+
+    categories = {}
+    query = _read_store(args, categories).query()
+    if args.category is not None:
+        if args.category not in categories:
+            return
+        query.category(categories[args.category])
+    if args.name:
+        query.name_matches(args.name)
+    if args.min_price is not None or args.max_price is not None:
+        query.price_between(args.min_price, args.max_price)
+    if args.in_stock:
+        query.in_stock()
+    if args.order_by:
+        query.order_by(args.order_by, descending=args.descending)
+    if args.limit is not None:
+        query.limit(args.limit)
+    if args.explain:
+        print(query.explain())
+        return
+    export_catalog(query, sys.stdout, args.format)
+
+
+def _update(args):
+    from itertools import islice
+
+    from .catalog_io import parse_change, read_rows
+
+    source = _stream(args.source) or sys.stdin
+    rows = read_rows(source, args.format or ("csv" if source is sys.stdin else None))
+
+    def apply(inventory):
+        applied = 0
+        while True:
+            batch = list(islice(rows, args.batch_size))
+            if not batch:
+                return applied
+            prices, quantities = [], []
+            for line_number, row in batch:
+                try:
+                    if isinstance(row, str):
+                        raise ValueError(row)
+                    sku, price, quantity_change = parse_change(row)
+                except ValueError as error:
+                    raise ValueError(f"line {line_number}: {error}")
+                if price is not None:
+                    prices.append((sku, price))
+                if quantity_change is not None:
+                    quantities.append((sku, quantity_change))
+            applied += inventory.bulk_update(prices, quantities)
+
+    print(f"Applied {_write_batch(args, apply)} changes.")
+
+
+def _reprice(args):
+    categories = {}
+
+    def apply(inventory):
+        if args.category is None:
+            return inventory.reprice(args.factor)
+        if args.category not in categories:
+            raise ValueError(f"Unknown category: {args.category!r}")
+        return inventory.reprice(args.factor, categories[args.category])
+
+    print(f"Repriced {_write_batch(args, apply, categories)} products.")
+
+
+def _stats(args):
+    import json
+
+    inventory = _read_store(args)
+    stats = inventory.stats()
+    stats["categories"] = {
+        category.name: totals for category, totals in stats["categories"].items()
+    }
+    stats["locations"] = inventory.units_by_location()
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+from array import array
+import operator
+
+from .inventory import InventoryManager, _locked
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; aggregates fall back to array loops.
+    np = None
+
+
+class ColumnarInventoryManager(InventoryManager):
+    """
+    Inventory manager that mirrors prices, quantities and categories in
+    contiguous columns for fast bulk analytics.
+
+    Every product is assigned a slot; slot ``i`` of each ``array`` column
+    holds that product's price, quantity, category code and a live flag.
+    Slots freed by ``remove_product`` are reused. Aggregates run vectorized
+    over NumPy views of the columns when NumPy is installed, and over the raw
+    arrays with C-level iteration otherwise. Aggregates hold the index lock,
+    because a column cannot grow while NumPy has a view of its buffer.
+
+    Attributes:
+        products (dict): A dictionary storing products keyed by SKU bytes.
+    """
+
+    def __init__(self):
+        """Initializes an empty columnar inventory."""
+        super().__init__()
+        self._prices_col = array("d")
+        self._quantities_col = array("q")
+        self._codes_col = array("i")
+        self._live_col = array("b")
+        self._slots = {}  # SKU bytes -> slot
+        self._free_slots = []
+        self._category_codes = {}  # Category -> code
+        self._categories = []  # code -> Category
+
+    @_locked
+    def total_value(self) -> float:
+        """
+        Computes the total stock value (price * quantity) of the inventory.
+
+        Returns:
+            float: The summed value of all products.
+        """
+        if np is not None and self._live_col:
+            prices = np.frombuffer(self._prices_col, dtype=np.float64)
+            quantities = np.frombuffer(self._quantities_col, dtype=np.int64)
+            return float(np.dot(prices, quantities))
+        return float(sum(map(operator.mul, self._prices_col, self._quantities_col)))
+
+    @_locked
+    def value_by_category(self) -> dict:
+        """
+        Computes the stock value held in each category.
+
+        Returns:
+            dict: A mapping of Category to its summed stock value.
+        """
+        if np is not None and self._live_col:
+            prices = np.frombuffer(self._prices_col, dtype=np.float64)
+            quantities = np.frombuffer(self._quantities_col, dtype=np.int64)
+            codes = np.frombuffer(self._codes_col, dtype=np.int32)
+            sums = np.bincount(
+                codes, weights=prices * quantities, minlength=len(self._categories)
+            ).tolist()
+        else:
+            sums = [0.0] * len(self._categories)
+            for code, value in zip(
+                self._codes_col,
+                map(operator.mul, self._prices_col, self._quantities_col),
+            ):
+                sums[code] += value
+        return self._by_code(sums)
+
+    @_locked
+    def units_by_category(self) -> dict:
+        """
+        Computes the number of units in stock for each category.
+
+        Returns:
+            dict: A mapping of Category to its total quantity.
+        """
+        if np is not None and self._live_col:
+            quantities = np.frombuffer(self._quantities_col, dtype=np.int64)
+            codes = np.frombuffer(self._codes_col, dtype=np.int32)
+            sums = np.bincount(
+                codes, weights=quantities, minlength=len(self._categories)
+            ).astype(np.int64).tolist()
+        else:
+            sums = [0] * len(self._categories)
+            for code, quantity in zip(self._codes_col, self._quantities_col):
+                sums[code] += quantity
+        return self._by_code(sums)
+
+    @_locked
+    def count_below(self, threshold: int) -> int:
+        """
+        Counts the products with fewer than ``threshold`` units in stock.
+
+        Args:
+            threshold (int): The stock level to compare against.
+
+        Returns:
+            int: The number of matching products.
+        """
+        if np is not None and self._live_col:
+            quantities = np.frombuffer(self._quantities_col, dtype=np.int64)
+            live = np.frombuffer(self._live_col, dtype=np.int8).astype(bool)
+            return int(np.count_nonzero((quantities < threshold) & live))
+        return sum(
+            1
+            for quantity, live in zip(self._quantities_col, self._live_col)
+            if live and quantity < threshold
+        )
+
+    def _update_indexes(self, product, attribute, old_value):
+        """Keeps the columns in step with product changes."""
+        super()._update_indexes(product, attribute, old_value)
+        slot = self._slots[product.sku_bytes]
+        if attribute == "price":
+            self._prices_col[slot] = product.price
+        elif attribute == "quantity":
+            self._quantities_col[slot] = product.quantity
+        elif attribute == "category":
+            self._codes_col[slot] = self._code_for(product.category)
+
+    def _update_indexes_batch(self, old_prices, old_quantities):
+        """Keeps the columns in step with a bulk update."""
+        super()._update_indexes_batch(old_prices, old_quantities)
+        for product in old_prices:
+            self._prices_col[self._slots[product.sku_bytes]] = product.price
+        for product in old_quantities:
+            self._quantities_col[self._slots[product.sku_bytes]] = product.quantity
+
+    def reindex_product(self, product_id):
+        """Re-files a product under its current category, column included."""
+        super().reindex_product(product_id)
+        product = self.get_product_by_id(product_id)
+        self._codes_col[self._slots[product.sku_bytes]] = self._code_for(
+            product.category
+        )
+
+    def _index_product(self, product):
+        """Adds a product to the secondary indexes and assigns it a slot."""
+        super()._index_product(product)
+        self._assign_slot(product)
+
+    def _index_products(self, products):
+        """Adds a batch of products to the secondary indexes and columns."""
+        super()._index_products(products)
+        for product in products:
+            self._assign_slot(product)
+
+    def _assign_slot(self, product):
+        """Writes a product into a free or newly appended column slot."""
+        code = self._code_for(product.category)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._prices_col[slot] = product.price
+            self._quantities_col[slot] = product.quantity
+            self._codes_col[slot] = code
+            self._live_col[slot] = 1
+        else:
+            slot = len(self._live_col)
+            self._prices_col.append(product.price)
+            self._quantities_col.append(product.quantity)
+            self._codes_col.append(code)
+            self._live_col.append(1)
+        self._slots[product.sku_bytes] = slot
+
+    def _unindex_product(self, product):
+        """Removes a product from the secondary indexes and frees its slot."""
+        super()._unindex_product(product)
+        slot = self._slots.pop(product.sku_bytes)
+        self._prices_col[slot] = 0.0
+        self._quantities_col[slot] = 0
+        self._codes_col[slot] = 0
+        self._live_col[slot] = 0
+        self._free_slots.append(slot)
+
+    def _code_for(self, category) -> int:
+        """Returns the integer code for a category, assigning one if new."""
+        code = self._category_codes.get(category)
+        if code is None:
+            code = self._category_codes[category] = len(self._categories)
+            self._categories.append(category)
+        return code
+
+    def _by_code(self, sums: list) -> dict:
+        """Maps per-code sums back to categories that still hold products."""
+        return {
+            category: sums[code]
+            for code, category in enumerate(self._categories)
+            if category in self._by_category
+        }
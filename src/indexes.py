@@ -0,0 +1,387 @@
+import heapq
+import itertools
+import math
+import re
+from bisect import bisect_left, insort
+
+
+class PriceIndex:
+    """
+    Keeps SKUs sorted by price for range and top-N queries.
+
+    Entries are ``(price, sku)`` tuples held in a plain list kept in order
+    with ``bisect``, so lookups cost O(log n + k) for k results.
+    """
+
+    def __init__(self):
+        """Initializes an empty price index."""
+        self._entries = []
+
+    def add(self, price: float, sku: str):
+        """Inserts a SKU at the given price."""
+        insort(self._entries, (price, sku))
+
+    def add_entry(self, entry: tuple):
+        """Inserts a prebuilt ``(price, sku)`` tuple, letting indexes share it."""
+        insort(self._entries, entry)
+
+    def add_entries(self, entries: list):
+        """Inserts many ``(price, sku)`` tuples with a single re-sort."""
+        self._entries.extend(entries)
+        self._entries.sort()
+
+    def replace(self, skus: set, entries: list):
+        """
+        Moves many SKUs at once: drops every entry for ``skus`` and inserts
+        the ``(price, sku)`` tuples in ``entries``, with a single re-sort.
+        """
+        kept = [entry for entry in self._entries if entry[1] not in skus]
+        kept.extend(entries)
+        kept.sort()
+        self._entries = kept
+
+    def remove(self, price: float, sku: str):
+        """
+        Removes a SKU previously inserted at the given price.
+
+        Raises:
+            KeyError: If the entry is not in the index.
+        """
+        entry = (price, sku)
+        position = bisect_left(self._entries, entry)
+        if position == len(self._entries) or self._entries[position] != entry:
+            raise KeyError(sku)
+        del self._entries[position]
+
+    def range(self, low: float, high: float) -> list:
+        """Returns the SKUs priced between ``low`` and ``high`` inclusive."""
+        start, stop = self._bounds(low, high)
+        return [sku for _, sku in self._entries[start:stop]]
+
+    def count(self, low: float, high: float) -> int:
+        """Counts the SKUs priced between ``low`` and ``high`` inclusive."""
+        start, stop = self._bounds(low, high)
+        return stop - start
+
+    def iter_range(self, low: float, high: float, descending=False):
+        """
+        Iterates the SKUs priced between ``low`` and ``high``, in order.
+
+        The matching entries are sliced when this is called, so the index
+        may change while the result is consumed.
+        """
+        start, stop = self._bounds(low, high)
+        entries = self._entries[start:stop]
+        if descending:
+            entries.reverse()
+        return (sku for _, sku in entries)
+
+    def _bounds(self, low: float, high: float) -> tuple:
+        """Returns the slice of entries priced between ``low`` and ``high``."""
+        start = bisect_left(self._entries, (low,))
+        stop = bisect_left(self._entries, (math.nextafter(high, math.inf),))
+        return start, stop
+
+    def lowest(self, n: int) -> list:
+        """Returns the ``n`` cheapest SKUs, cheapest first."""
+        return [sku for _, sku in self._entries[: max(n, 0)]]
+
+    def highest(self, n: int) -> list:
+        """Returns the ``n`` most expensive SKUs, most expensive first."""
+        if n <= 0:
+            return []
+        return [sku for _, sku in reversed(self._entries[-n:])]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class StockWatch:
+    """
+    Tracks stock levels in a min-heap for low-stock queries.
+
+    Updates push a fresh ``(quantity, version, sku)`` entry and leave the old
+    one in place; entries whose version is no longer current are skipped on
+    read and dropped when the heap is compacted. Queries walk only the part of
+    the heap below the requested bound instead of every product.
+    """
+
+    def __init__(self):
+        """Initializes an empty stock watch."""
+        self._heap = []
+        self._current = {}  # SKU -> version of its live heap entry
+        self._versions = itertools.count()
+
+    def update(self, sku: str, quantity: int):
+        """Records the current quantity of a SKU."""
+        version = next(self._versions)
+        self._current[sku] = version
+        heapq.heappush(self._heap, (quantity, version, sku))
+        if len(self._heap) > 2 * len(self._current) + 64:
+            self._compact()
+
+    def update_many(self, items: list):
+        """
+        Records the current quantity of many SKUs.
+
+        Large batches are appended and heapified once instead of being
+        pushed one at a time.
+
+        Args:
+            items (list): ``(sku, quantity)`` pairs.
+        """
+        if len(items) * 16 < len(self._heap):
+            for sku, quantity in items:
+                self.update(sku, quantity)
+            return
+        for sku, quantity in items:
+            version = next(self._versions)
+            self._current[sku] = version
+            self._heap.append((quantity, version, sku))
+        if len(self._heap) > 2 * len(self._current) + 64:
+            self._compact()
+        else:
+            heapq.heapify(self._heap)
+
+    def discard(self, sku: str):
+        """Stops tracking a SKU."""
+        self._current.pop(sku, None)
+
+    def below(self, threshold: int) -> list:
+        """Returns SKUs with quantity strictly below ``threshold``, lowest first."""
+        heap, found, pending = self._heap, [], [0] if self._heap else []
+        while pending:
+            position = pending.pop()
+            entry = heap[position]
+            if entry[0] >= threshold:
+                continue
+            if self._is_live(entry):
+                found.append(entry)
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    pending.append(child)
+        found.sort()
+        return [sku for _, _, sku in found]
+
+    def lowest(self, n: int) -> list:
+        """Returns the ``n`` SKUs with the least stock, lowest first."""
+        heap, found = self._heap, []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(found) < n:
+            entry, position = heapq.heappop(frontier)
+            if self._is_live(entry):
+                found.append(entry[2])
+            for child in (2 * position + 1, 2 * position + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return found
+
+    def _is_live(self, entry) -> bool:
+        """Checks whether a heap entry reflects the SKU's latest update."""
+        return self._current.get(entry[2]) == entry[1]
+
+    def _compact(self):
+        """Rebuilds the heap without superseded entries."""
+        self._heap = [entry for entry in self._heap if self._is_live(entry)]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list:
+    """Splits text into lower-case word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+class NameIndex:
+    """
+    Inverted index from name tokens to SKUs, with prefix matching.
+
+    Each token maps to the set of SKUs whose name contains it, and the
+    distinct tokens are kept sorted so all tokens sharing a prefix are found
+    with one bisect. A query costs time proportional to the postings it
+    touches, not to the number of products.
+    """
+
+    def __init__(self, max_expansions: int = 64):
+        """
+        Initializes an empty name index.
+
+        Args:
+            max_expansions (int): The most tokens a query prefix expands to.
+        """
+        self._postings = {}  # token -> set of SKUs
+        self._tokens = []  # sorted distinct tokens
+        self._max_expansions = max_expansions
+
+    def add(self, sku, name: str):
+        """Indexes a SKU under every token of its name."""
+        for token in set(tokenize(name)):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = set()
+                insort(self._tokens, token)
+            postings.add(sku)
+
+    def remove(self, sku, name: str):
+        """Removes a SKU previously indexed under ``name``."""
+        for token in set(tokenize(name)):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(sku)
+            if not postings:
+                del self._postings[token]
+                del self._tokens[bisect_left(self._tokens, token)]
+
+    def search(self, query: str, limit: int) -> list:
+        """
+        Finds the SKUs whose names best match a query.
+
+        Every query token matches name tokens equal to it (scoring 2) or
+        starting with it (scoring 1). SKUs matching more query tokens rank
+        first, then higher total score, then lower SKU for a stable order.
+
+        Args:
+            query (str): Free text to look for.
+            limit (int): The maximum number of SKUs to return.
+
+        Returns:
+            list: Up to ``limit`` SKUs, best match first.
+        """
+        matched, scores = {}, {}
+        for term in set(tokenize(query)):
+            best = {}
+            for token in self._expand(term):
+                weight = 2 if token == term else 1
+                for sku in self._postings[token]:
+                    if best.get(sku, 0) < weight:
+                        best[sku] = weight
+            for sku, weight in best.items():
+                matched[sku] = matched.get(sku, 0) + 1
+                scores[sku] = scores.get(sku, 0) + weight
+        return heapq.nsmallest(
+            max(limit, 0),
+            scores,
+            key=lambda sku: (-matched[sku], -scores[sku], sku),
+        )
+
+    def estimate(self, query: str) -> int:
+        """Returns an upper bound on the SKUs matching every query word."""
+        sizes = []
+        for term in set(tokenize(query)):
+            tokens = self._expand(term, capped=False)
+            sizes.append(sum(len(self._postings[token]) for token in tokens))
+        return min(sizes) if sizes else 0
+
+    def matching(self, query: str) -> set:
+        """Returns the SKUs whose names match every query word or prefix."""
+        groups = []
+        for term in set(tokenize(query)):
+            group = set()
+            for token in self._expand(term, capped=False):
+                group |= self._postings[token]
+            groups.append(group)
+        if not groups:
+            return set()
+        groups.sort(key=len)
+        return groups[0].intersection(*groups[1:])
+
+    @staticmethod
+    def name_matches(query: str, name: str) -> bool:
+        """Checks whether every query word is a prefix of a word in ``name``."""
+        tokens = tokenize(name)
+        return all(
+            any(token.startswith(term) for token in tokens) for term in tokenize(query)
+        )
+
+    def _expand(self, term: str, capped=True) -> list:
+        """Returns the indexed tokens that start with ``term``."""
+        start = bisect_left(self._tokens, term)
+        stop = start + self._max_expansions if capped else len(self._tokens)
+        tokens = []
+        for position in range(start, stop):
+            if position >= len(self._tokens):
+                break
+            token = self._tokens[position]
+            if not token.startswith(term):
+                break
+            tokens.append(token)
+        return tokens
+
+
+class StockTotals:
+    """
+    Running product, unit and value totals, overall and per category.
+
+    Each bucket holds ``[products, units, value, out_of_stock]`` and is
+    adjusted by the delta of every change, so reading the totals never
+    touches the products themselves.
+    """
+
+    def __init__(self):
+        """Initializes empty totals."""
+        self._overall = [0, 0, 0.0, 0]
+        self._by_category = {}  # Category -> bucket
+
+    def add(self, category, price: float, quantity: int):
+        """Counts a product in ``category``."""
+        self._apply(category, 1, quantity, price * quantity, quantity <= 0)
+
+    def remove(self, category, price: float, quantity: int):
+        """Stops counting a product previously added to ``category``."""
+        self._apply(category, -1, -quantity, -price * quantity, -(quantity <= 0))
+
+    def reprice(self, category, quantity: int, old_price: float, new_price: float):
+        """Adjusts the value held by a product whose price changed."""
+        self._apply(category, 0, 0, (new_price - old_price) * quantity, 0)
+
+    def restock(self, category, price: float, old_quantity: int, new_quantity: int):
+        """Adjusts the units and value held by a product whose stock changed."""
+        self._apply(
+            category,
+            0,
+            new_quantity - old_quantity,
+            price * (new_quantity - old_quantity),
+            (new_quantity <= 0) - (old_quantity <= 0),
+        )
+
+    def overall(self) -> dict:
+        """Returns the totals across every category."""
+        return self._as_dict(self._overall)
+
+    def by_category(self) -> dict:
+        """Returns a mapping of Category to its totals."""
+        return {
+            category: self._as_dict(bucket)
+            for category, bucket in self._by_category.items()
+        }
+
+    def _apply(self, category, products, units, value, out_of_stock):
+        """Adds one delta to the overall and category buckets."""
+        bucket = self._by_category.get(category)
+        if bucket is None:
+            bucket = self._by_category[category] = [0, 0, 0.0, 0]
+        for totals in (self._overall, bucket):
+            totals[0] += products
+            totals[1] += units
+            totals[2] += value
+            totals[3] += out_of_stock
+            if not totals[0]:
+                totals[2] = 0.0  # Drop float residue once nothing is left.
+        if not bucket[0]:
+            del self._by_category[category]
+
+    @staticmethod
+    def _as_dict(bucket) -> dict:
+        products, units, value, out_of_stock = bucket
+        return {
+            "products": products,
+            "units": units,
+            "value": value,
+            "out_of_stock": out_of_stock,
+        }
@@ -0,0 +1,412 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+
+from .inventory import InventoryManager
+from .product import Product
+from .product_factory import ProductFactory
+
+# Histogram upper bounds in seconds: 1 us doubling up to about 16 s.
+BUCKETS = tuple(1e-6 * 2**power for power in range(25))
+
+# Operations timed by ``enable``, keyed by class, with their metric prefix.
+TARGETS = {
+    InventoryManager: (
+        "inventory",
+        (
+            "add_product",
+            "add_products",
+            "remove_product",
+            "checkout",
+            "bulk_update",
+            "reprice",
+            "get_product_by_id",
+            "get_all_products",
+            "get_products_by_category",
+            "get_products_by_price_range",
+            "top_n_by_price",
+            "get_low_stock",
+            "next_to_run_out",
+            "search_by_name",
+            "stats",
+            "reindex_product",
+            "query",
+            "transfer_stock",
+            "nearest_location",
+        ),
+    ),
+    ProductFactory: ("factory", ("create_product", "create_products")),
+    Product: (
+        "product",
+        (
+            "update_price",
+            "update_quantity",
+            "update_name",
+            "update_category",
+            "update_stock",
+            "transfer_stock",
+        ),
+    ),
+}
+
+
+class LatencyHistogram:
+    """
+    Call count, error count and latency distribution of one operation.
+
+    Latencies fall into fixed power-of-two buckets, so recording is a bisect
+    and an increment however many calls have been seen.
+    """
+
+    __slots__ = ("count", "errors", "total", "buckets")
+
+    def __init__(self):
+        """Initializes an empty histogram."""
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # the last one is +Inf
+
+    def record(self, seconds: float, failed=False):
+        """Adds one call that took ``seconds``."""
+        self.count += 1
+        self.errors += failed
+        self.total += seconds
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+
+    def quantile(self, q: float):
+        """
+        Estimates a latency quantile as the upper bound of its bucket.
+
+        Returns:
+            float or None: The bound, or None if it lies past the last one.
+        """
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, hits in zip(BUCKETS, self.buckets):
+            seen += hits
+            if seen >= rank:
+                return bound
+        return None
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of per-operation latency histograms.
+
+    Attributes:
+        namespace (str): Prefix of the exported Prometheus metric names.
+    """
+
+    def __init__(self, namespace: str = "inventory"):
+        """
+        Initializes an empty registry.
+
+        Args:
+            namespace (str): Prefix of the exported Prometheus metric names.
+        """
+        self.namespace = namespace
+        self._histograms = {}  # operation -> LatencyHistogram
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, seconds: float, failed=False):
+        """
+        Adds one call of ``operation``.
+
+        Args:
+            operation (str): The operation name, e.g. ``"inventory.add_product"``.
+            seconds (float): How long the call took.
+            failed (bool): Whether the call raised.
+        """
+        with self._lock:
+            histogram = self._histograms.get(operation)
+            if histogram is None:
+                histogram = self._histograms[operation] = LatencyHistogram()
+            histogram.record(seconds, failed)
+
+    def reset(self):
+        """Forgets everything recorded so far."""
+        with self._lock:
+            self._histograms = {}
+
+    def snapshot(self) -> dict:
+        """
+        Returns a point-in-time copy of every operation's figures.
+
+        Returns:
+            dict: Operation name to ``count``, ``errors``, ``total_seconds``,
+            ``p50``, ``p99`` (bucket upper bounds) and cumulative ``buckets``
+            as ``[upper_bound, count]`` pairs, the last bound being ``"+Inf"``.
+        """
+        with self._lock:
+            histograms = {
+                operation: (h.count, h.errors, h.total, list(h.buckets))
+                for operation, h in self._histograms.items()
+            }
+        snapshot = {}
+        for operation, (count, errors, total, buckets) in sorted(histograms.items()):
+            histogram = LatencyHistogram()
+            histogram.count, histogram.buckets = count, buckets
+            cumulative, running = [], 0
+            for bound, hits in zip(BUCKETS + ("+Inf",), buckets):
+                running += hits
+                cumulative.append([bound, running])
+            snapshot[operation] = {
+                "count": count,
+                "errors": errors,
+                "total_seconds": total,
+                "p50": histogram.quantile(0.5),
+                "p99": histogram.quantile(0.99),
+                "buckets": cumulative,
+            }
+        return snapshot
+
+    def to_json(self) -> str:
+        """Renders the snapshot as JSON."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Renders the snapshot in the Prometheus text exposition format."""
+        name = f"{self.namespace}_operation_seconds"
+        lines = [
+            f"# HELP {name} Latency of inventory operations.",
+            f"# TYPE {name} histogram",
+        ]
+        errors_name = f"{self.namespace}_operation_errors_total"
+        errors = []
+        for operation, figures in self.snapshot().items():
+            label = f'operation="{operation}"'
+            for bound, count in figures["buckets"]:
+                le = bound if isinstance(bound, str) else repr(bound)
+                lines.append(f'{name}_bucket{{{label},le="{le}"}} {count}')
+            lines.append(f"{name}_sum{{{label}}} {figures['total_seconds']!r}")
+            lines.append(f"{name}_count{{{label}}} {figures['count']}")
+            errors.append(f"{errors_name}{{{label}}} {figures['errors']}")
+        if errors:
+            lines.append(f"# HELP {errors_name} Inventory operations that raised.")
+            lines.append(f"# TYPE {errors_name} counter")
+            lines.extend(errors)
+        return "\n".join(lines) + "\n"
+
+    def export(self, path, fmt=None):
+        """
+        Writes the snapshot to a file, replacing it atomically.
+
+        Args:
+            path (str): The destination file.
+            fmt (str, optional): ``"json"`` or ``"prometheus"``; inferred
+                from the extension (``.json``, else Prometheus) when omitted.
+
+        Raises:
+            ValueError: If the format is not recognised.
+        """
+        if fmt is None:
+            fmt = "json" if str(path).endswith(".json") else "prometheus"
+        if fmt == "json":
+            text = self.to_json()
+        elif fmt == "prometheus":
+            text = self.to_prometheus()
+        else:
+            raise ValueError(f"Unsupported metrics format: {fmt!r}")
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(temporary, path)
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler for threads inside instrumented operations.
+
+    A background thread wakes every ``interval`` seconds, reads the stack
+    of each thread currently running an instrumented call, and counts it.
+    Threads doing anything else are never sampled, so the cost is bounded
+    by the sampling rate, not by how often operations run.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Initializes a stopped profiler.
+
+        Args:
+            interval (float): Seconds between samples.
+        """
+        self.interval = interval
+        self.samples = Counter()  # root-first stack tuple -> samples
+        self._active = {}  # thread id -> nesting depth
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Starts sampling."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="inventory-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops sampling; collected samples are kept."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+    def enter(self):
+        """Marks the calling thread as inside an instrumented call."""
+        ident = threading.get_ident()
+        self._active[ident] = self._active.get(ident, 0) + 1
+
+    def exit(self):
+        """Marks the end of the calling thread's instrumented call."""
+        ident = threading.get_ident()
+        depth = self._active.get(ident, 1) - 1
+        if depth:
+            self._active[ident] = depth
+        else:
+            self._active.pop(ident, None)
+
+    def hottest(self, n: int = 10) -> list:
+        """
+        Returns the most sampled stacks.
+
+        Returns:
+            list: Up to ``n`` ``(stack, samples)`` pairs, where ``stack`` is
+            ``"file:function;file:function;..."`` from the outermost frame.
+        """
+        return [
+            (";".join(stack), count) for stack, count in self.samples.most_common(n)
+        ]
+
+    def dump(self, path):
+        """
+        Writes every sampled stack in collapsed format (``stack count`` per
+        line), as read by flame graph tools.
+
+        Args:
+            path (str): The destination file.
+        """
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, count in self.hottest(len(self.samples)):
+                handle.write(f"{stack} {count}\n")
+
+    def _run(self):
+        """Sampler loop."""
+        own = threading.get_ident()
+        while not self._stopping.wait(self.interval):
+            active = set(self._active)
+            for ident, frame in sys._current_frames().items():
+                if ident in active and ident != own:
+                    self.samples[self._stack(frame)] += 1
+
+    @staticmethod
+    def _stack(frame) -> tuple:
+        """Describes a frame and its callers, outermost first."""
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        stack.reverse()
+        return tuple(stack)
+
+
+# The registry ``enable`` records into unless given another one.
+METRICS = MetricsRegistry()
+
+_originals = {}  # (class, attribute) -> original class attribute
+_profiler = None
+
+
+def enable(registry=None, profiler=None) -> MetricsRegistry:
+    """
+    Starts timing every operation in ``TARGETS``.
+
+    The methods are wrapped in place and restored by ``disable``, so when
+    instrumentation is off the original methods run with no added cost.
+
+    Args:
+        registry (MetricsRegistry, optional): Where to record; ``METRICS``
+            when omitted.
+        profiler (SamplingProfiler, optional): Started, and told about each
+            instrumented call so it samples only those threads.
+
+    Returns:
+        MetricsRegistry: The registry being recorded into.
+    """
+    global _profiler
+    disable()
+    registry = METRICS if registry is None else registry
+    for cls, (prefix, names) in TARGETS.items():
+        for name in names:
+            original = cls.__dict__[name]
+            function = original
+            if isinstance(original, staticmethod):
+                function = original.__func__
+            wrapped = _timed(function, f"{prefix}.{name}", registry, profiler)
+            if isinstance(original, staticmethod):
+                wrapped = staticmethod(wrapped)
+            _originals[(cls, name)] = original
+            setattr(cls, name, wrapped)
+    if profiler is not None:
+        _profiler = profiler
+        profiler.start()
+    return registry
+
+
+def disable():
+    """Restores the original methods and stops any profiler."""
+    global _profiler
+    for (cls, name), original in _originals.items():
+        setattr(cls, name, original)
+    _originals.clear()
+    if _profiler is not None:
+        _profiler.stop()
+        _profiler = None
+
+
+def is_enabled() -> bool:
+    """Checks whether operations are currently being timed."""
+    return bool(_originals)
+
+
+def _timed(function, operation, registry, profiler):
+    """Wraps ``function`` so each call is recorded as ``operation``."""
+    clock = time.perf_counter
+    record = registry.record
+
+    if profiler is None:
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+            except BaseException:
+                record(operation, clock() - start, True)
+                raise
+            record(operation, clock() - start)
+            return result
+
+        return wrapper
+
+    timed = _timed(function, operation, registry, None)
+
+    @functools.wraps(function)
+    def profiled(*args, **kwargs):
+        profiler.enter()
+        try:
+            return timed(*args, **kwargs)
+        finally:
+            profiler.exit()
+
+    return profiled
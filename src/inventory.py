@@ -1,5 +1,23 @@
-from .product import Product
+import math
+import threading
+from functools import wraps
+
+from .product import Product, sku_bytes
 from .category import Category
+from .indexes import NameIndex, PriceIndex, StockTotals, StockWatch
+from .locking import SKU_LOCKS
+from .query import Query
+
+
+def _locked(method):
+    """Runs an InventoryManager method while holding its index lock."""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._index_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class InventoryManager:
@@ -8,10 +26,26 @@ class InventoryManager:
         Manages a collection of products in an inventory.
 
         Attributes:
-            products (dict): A dictionary storing products with SKU as key.
+            products (dict): A dictionary storing products keyed by their
+                compact 16-byte SKU (``Product.sku_bytes``), not by the
+                ``Product.id`` string. Look products up by string SKU with
+                ``get_product_by_id``, or test ``product_id in inventory``.
         """
-        self.products = {}  # SKU -> Product object
+        self.products = {}  # SKU bytes -> Product object
+        self._by_category = {}  # Category -> {SKU -> Product}, insertion ordered
+        self._prices = PriceIndex()
+        self._prices_by_category = {}  # Category -> PriceIndex
+        self._stock = StockWatch()
+        self._names = NameIndex()
+        self._totals = StockTotals()
+        self._locations = {}  # location name -> (latitude, longitude)
+        self._location_units = {}  # location name -> units across products
+        self._listeners = ()
+        self._settled = ()  # listeners' inventory_settled callbacks
+        # Guards the dict and indexes; stock checks use the per-SKU locks.
+        self._index_lock = threading.RLock()
 
+    @_locked
     def add_product(self, product):
         """
         Adds a new product to the inventory.
@@ -25,10 +59,46 @@ class InventoryManager:
         """
         if not isinstance(product, Product):
             raise TypeError("Only Product objects can be added to inventory.")
-        if product.id in self.products:
+        if product.sku_bytes in self.products:
             raise ValueError(f"Product with SKU {product.id} already exists.")
-        self.products[product.id] = product
+        self.products[product.sku_bytes] = product
+        self._index_product(product)
+        product.add_observer(self)
+        self._emit("add", product, None)
+
+    @_locked
+    def add_products(self, products):
+        """
+        Adds many products to the inventory in one step.
+
+        The whole batch is checked before anything is inserted, so either
+        every product is added or none is.
+
+        Args:
+            products (iterable): The products to be added.
 
+        Raises:
+            TypeError: If any item is not a Product instance.
+            ValueError: If any SKU already exists or repeats within the batch.
+        """
+        batch = list(products)
+        if not all(isinstance(product, Product) for product in batch):
+            raise TypeError("Only Product objects can be added to inventory.")
+        keys = {product.sku_bytes: product for product in batch}
+        if len(keys) != len(batch):
+            raise ValueError("Batch contains duplicate SKUs.")
+        if not keys.keys().isdisjoint(self.products):
+            duplicate = next(key for key in keys if key in self.products)
+            raise ValueError(
+                f"Product with SKU {keys[duplicate].id} already exists."
+            )
+        self.products.update(keys)
+        self._index_products(batch)
+        for product in batch:
+            product.add_observer(self)
+        self._emit_many(("add", product, None) for product in batch)
+
+    @_locked
     def remove_product(self, product_id):
         """
         Removes a product from inventory.
@@ -39,23 +109,181 @@ class InventoryManager:
         Raises:
             ValueError: If the product does not exist.
         """
-        if product_id in self.products:
-            del self.products[product_id]
-        else:
+        product = self.products.pop(sku_bytes(product_id), None)
+        if product is None:
             raise ValueError("Product not found.")
+        product.remove_observer(self)
+        self._unindex_product(product)
+        self._emit("remove", product, None)
+
+    def checkout(self, basket):
+        """
+        Applies a basket of stock changes atomically.
+
+        The stock locks of every SKU in the basket are taken in a fixed
+        order, all changes are validated, and only then applied, so either
+        every line succeeds or stock is left untouched.
+
+        Args:
+            basket (dict or iterable): SKU -> quantity change (negative to
+                take stock), or ``(sku, quantity_change)`` pairs. Repeated
+                SKUs are summed.
+
+        Raises:
+            ValueError: If a product does not exist or has insufficient stock.
+        """
+        pairs = basket.items() if isinstance(basket, dict) else basket
+        changes = {}  # Product -> summed change
+        for product_id, quantity_change in pairs:
+            product = self.products.get(sku_bytes(product_id))
+            if product is None:
+                raise ValueError(f"Product {product_id} not found.")
+            changes[product] = changes.get(product, 0) + quantity_change
+        with SKU_LOCKS.hold(product.sku_bytes for product in changes):
+            for product, quantity_change in changes.items():
+                if product.unassigned_quantity + quantity_change < 0:
+                    raise ValueError(f"Insufficient stock for {product.id}.")
+            for product, quantity_change in changes.items():
+                product.update_quantity(quantity_change)
+
+    def bulk_update(self, prices=None, quantities=None) -> int:
+        """
+        Applies many price and stock changes atomically.
+
+        The whole batch is validated before anything changes, so either
+        every row is applied or none is. The secondary indexes are then
+        rebuilt once for the batch instead of once per row, and listeners
+        and other product observers are notified per changed attribute.
+
+        Args:
+            prices (dict or iterable, optional): SKU -> new price, or
+                ``(sku, new_price)`` pairs. A repeated SKU keeps its last price.
+            quantities (dict or iterable, optional): SKU -> quantity change,
+                or ``(sku, quantity_change)`` pairs. Repeated SKUs are summed.
+
+        Returns:
+            int: The number of attribute changes applied.
+
+        Raises:
+            ValueError: If a product does not exist, a price is negative or
+                not finite, or a product would be left with negative stock.
+        """
+        new_prices = {}  # Product -> new price
+        for product, price in self._resolve(prices):
+            if not 0 <= price < math.inf:  # also rejects NaN
+                raise ValueError(
+                    f"Price must be finite and non-negative for {product.id}."
+                )
+            new_prices[product] = price
+        changes = {}  # Product -> summed quantity change
+        for product, quantity_change in self._resolve(quantities):
+            changes[product] = changes.get(product, 0) + quantity_change
+        # SKU locks before the index lock, the order Product's mutators use.
+        with SKU_LOCKS.hold(
+            product.sku_bytes for product in (*new_prices, *changes)
+        ):
+            with self._index_lock:
+                for product in (*new_prices, *changes):
+                    if self.products.get(product.sku_bytes) is not product:
+                        raise ValueError(f"Product {product.id} not found.")
+                for product, quantity_change in changes.items():
+                    if product.unassigned_quantity + quantity_change < 0:
+                        raise ValueError(f"Insufficient stock for {product.id}.")
+                old_prices, old_quantities = {}, {}
+                for product, price in new_prices.items():
+                    if price != product.price:
+                        old_prices[product] = product.price
+                        product.price = price
+                for product, quantity_change in changes.items():
+                    if quantity_change:
+                        old_quantities[product] = product.quantity
+                        product.quantity += quantity_change
+                self._update_indexes_batch(old_prices, old_quantities)
+                events = []
+                for attribute, old_values in (
+                    ("price", old_prices),
+                    ("quantity", old_quantities),
+                ):
+                    for product, old_value in old_values.items():
+                        product._notify(attribute, old_value, skip=self)
+                        events.append((attribute, product, old_value))
+                self._emit_many(events)
+        return len(old_prices) + len(old_quantities)
+
+    def reprice(self, factor: float, category=None, ndigits: int = 2) -> int:
+        """
+        Multiplies prices in one atomic batch, e.g. ``1.05`` for +5%.
+
+        Args:
+            factor (float): The multiplier applied to every price.
+            category (Category, optional): Only reprice this category.
+            ndigits (int or None): Decimal places to round new prices to;
+                None leaves them unrounded.
+
+        Returns:
+            int: The number of prices changed.
+
+        Raises:
+            TypeError: If category is given and is not a Category instance.
+            ValueError: If the factor is negative or not finite.
+        """
+        if not 0 <= factor < math.inf:  # also rejects NaN
+            raise ValueError("Price factor must be finite and non-negative.")
+        if category is not None and not isinstance(category, Category):
+            raise TypeError("Expected a Category object.")
+        with self._index_lock:
+            if category is None:
+                products = list(self.products.values())
+            else:
+                products = list(self._by_category.get(category, {}).values())
+        # The SKU locks must come before the index lock, so the products are
+        # listed first and re-checked once both are held.
+        with SKU_LOCKS.hold(product.sku_bytes for product in products):
+            with self._index_lock:
+                prices = [
+                    (
+                        product.sku_bytes,
+                        product.price * factor
+                        if ndigits is None
+                        else round(product.price * factor, ndigits),
+                    )
+                    for product in products
+                    if self.products.get(product.sku_bytes) is product
+                    and (category is None or product.category is category)
+                ]
+                return self.bulk_update(prices=prices)
+
+    def _resolve(self, rows):
+        """Yields ``(product, value)`` for SKU/value rows of a bulk update."""
+        if rows is None:
+            return
+        for product_id, value in rows.items() if isinstance(rows, dict) else rows:
+            product = self.products.get(sku_bytes(product_id))
+            if product is None:
+                raise ValueError(f"Product {product_id} not found.")
+            yield product, value
+
+    def __contains__(self, product_id) -> bool:
+        """Checks whether a SKU, as a string or 16 bytes, is in the inventory."""
+        return sku_bytes(product_id) in self.products
 
     def get_product_by_id(self, product_id):
         """
         Retrieves a product by its SKU.
 
         Args:
-            product_id (str): The SKU of the product.
+            product_id (str | bytes): The SKU of the product.
 
         Returns:
             Product or None: The product object if found, otherwise None.
         """
-        return self.products.get(product_id, None)
+        try:  # Inlined fast path for the usual UUID string.
+            key = bytes.fromhex(product_id.replace("-", ""))
+        except (AttributeError, TypeError, ValueError):
+            key = sku_bytes(product_id)
+        return self.products.get(key, None)
 
+    @_locked
     def get_all_products(self):
         """
         Retrieves all products in inventory.
@@ -66,6 +294,16 @@ class InventoryManager:
 
         return list(self.products.values())
 
+    def iter_products(self):
+        """
+        Iterates over all products without building a list.
+
+        Returns:
+            iterator: An iterator over the products in the inventory.
+        """
+        return iter(self.products.values())
+
+    @_locked
     def get_products_by_category(self, category) -> list[Product]:
         """
         Retrieves all products belonging to a specific category.
@@ -81,12 +319,435 @@ class InventoryManager:
         """
         if not isinstance(category, Category):
             raise TypeError("Expected a Category object.")
-        return [
-            product
-            for product in self.products.values()
-            if product.category == category
-        ]
+        return list(self._by_category.get(category, {}).values())
+
+    @_locked
+    def get_products_by_price_range(self, low: float, high: float) -> list[Product]:
+        """
+        Retrieves all products priced between ``low`` and ``high`` inclusive.
+
+        Args:
+            low (float): The lowest price to include.
+            high (float): The highest price to include.
+
+        Returns:
+            list: Matching products ordered by ascending price.
+        """
+        return [self.products[sku] for sku in self._prices.range(low, high)]
+
+    @_locked
+    def top_n_by_price(self, n: int, category=None, descending=True) -> list[Product]:
+        """
+        Retrieves the most expensive (or cheapest) products.
+
+        Args:
+            n (int): The maximum number of products to return.
+            category (Category, optional): Restrict results to this category.
+            descending (bool): Most expensive first when True, cheapest first
+                otherwise.
+
+        Returns:
+            list: Up to ``n`` products ordered by price.
+
+        Raises:
+            TypeError: If category is given and is not a Category instance.
+        """
+        if category is None:
+            index = self._prices
+        elif not isinstance(category, Category):
+            raise TypeError("Expected a Category object.")
+        else:
+            index = self._prices_by_category.get(category)
+            if index is None:
+                return []
+        skus = index.highest(n) if descending else index.lowest(n)
+        return [self.products[sku] for sku in skus]
+
+    @_locked
+    def get_low_stock(self, threshold: int) -> list[Product]:
+        """
+        Retrieves products whose stock has fallen below a threshold.
+
+        Args:
+            threshold (int): Products with fewer units than this are returned.
+
+        Returns:
+            list: Matching products, lowest stock first.
+        """
+        return [self.products[sku] for sku in self._stock.below(threshold)]
+
+    @_locked
+    def next_to_run_out(self, n: int) -> list[Product]:
+        """
+        Retrieves the products with the least stock remaining.
+
+        Args:
+            n (int): The maximum number of products to return.
+
+        Returns:
+            list: Up to ``n`` products, lowest stock first.
+        """
+        return [self.products[sku] for sku in self._stock.lowest(n)]
+
+    @_locked
+    def search_by_name(self, query: str, limit: int = 20) -> list[Product]:
+        """
+        Searches products by name, best matches first.
+
+        Whole words score above prefixes, and products matching more of the
+        query's words rank higher, so ``"app wat"`` finds "Apple Watch".
+
+        Args:
+            query (str): Words or word prefixes to look for.
+            limit (int): The maximum number of products to return.
+
+        Returns:
+            list: Up to ``limit`` matching products.
+        """
+        return [self.products[sku] for sku in self._names.search(query, limit)]
+
+    @_locked
+    def stats(self) -> dict:
+        """
+        Reports inventory totals without scanning the products.
+
+        The totals are kept up to date on every add, remove and product
+        change, so this costs O(number of categories) however large the
+        catalog is.
+
+        Returns:
+            dict: ``products``, ``units``, ``value`` (price times quantity)
+            and ``out_of_stock`` counts for the whole inventory, plus
+            ``categories``, a mapping of Category to the same four totals.
+        """
+        stats = self._totals.overall()
+        stats["categories"] = self._totals.by_category()
+        return stats
+
+    def add_location(self, name: str, latitude: float, longitude: float):
+        """
+        Registers (or moves) a stock location such as a warehouse.
+
+        Products may hold stock at unregistered locations too; only
+        registered ones are considered by ``nearest_location``.
+
+        Args:
+            name (str): The location name used with ``Product.update_stock``.
+            latitude (float): Latitude in degrees.
+            longitude (float): Longitude in degrees.
+        """
+        self._locations[name] = (latitude, longitude)
+
+    def units_at(self, location: str) -> int:
+        """
+        Returns the units held at a location across every product, in O(1).
+
+        Args:
+            location (str): The location name.
+        """
+        return self._location_units.get(location, 0)
+
+    def units_by_location(self) -> dict:
+        """Returns a mapping of location name to units held across products."""
+        with self._index_lock:
+            return dict(self._location_units)
+
+    def nearest_location(self, product_id, units: int, latitude, longitude):
+        """
+        Finds the closest registered location holding enough of a product.
+
+        Only the product's own locations are examined, so this costs
+        O(locations holding the product).
+
+        Args:
+            product_id (str): The SKU of the product.
+            units (int): The number of units needed at one location.
+            latitude (float): Latitude of the destination in degrees.
+            longitude (float): Longitude of the destination in degrees.
+
+        Returns:
+            tuple or None: ``(location name, distance in km)``, or None if no
+            registered location holds ``units`` units.
+
+        Raises:
+            ValueError: If the product does not exist.
+        """
+        product = self.get_product_by_id(product_id)
+        if product is None:
+            raise ValueError("Product not found.")
+        best = None
+        for location, held in product.stock_by_location().items():
+            position = self._locations.get(location)
+            if held < units or position is None:
+                continue
+            distance = _great_circle_km(position, (latitude, longitude))
+            if best is None or distance < best[1]:
+                best = (location, distance)
+        return best
+
+    def transfer_stock(self, product_id, source, target, units: int):
+        """
+        Moves units of a product between locations.
+
+        Args:
+            product_id (str): The SKU of the product.
+            source (str or None): The location to take from; None for
+                unassigned stock.
+            target (str or None): The location to move to; None for
+                unassigned stock.
+            units (int): The number of units to move.
+
+        Raises:
+            ValueError: If the product does not exist, units is not positive,
+                or the source lacks stock.
+        """
+        product = self.get_product_by_id(product_id)
+        if product is None:
+            raise ValueError("Product not found.")
+        product.transfer_stock(source, target, units)
+
+    def query(self) -> Query:
+        """
+        Starts a composable query over the inventory.
+
+        Returns:
+            Query: An unfiltered query; chain filters, order_by and limit.
+        """
+        return Query(self)
+
+    @_locked
+    def reindex_product(self, product_id):
+        """
+        Re-files a product under its current category.
+
+        Only needed when ``product.category`` was assigned directly;
+        ``Product.update_category`` keeps the index up to date on its own.
+
+        Args:
+            product_id (str): The SKU of the product.
+
+        Raises:
+            ValueError: If the product does not exist.
+        """
+        key = sku_bytes(product_id)
+        product = self.products.get(key)
+        if product is None:
+            raise ValueError("Product not found.")
+        for category, members in list(self._by_category.items()):
+            if key in members and category is not product.category:
+                self._discard_from_category(category, product)
+                self._totals.remove(category, product.price, product.quantity)
+                self._totals.add(product.category, product.price, product.quantity)
+        if key not in self._by_category.get(product.category, ()):
+            self._file_under_category(product)
+            self._emit("category", product, None)
+
+    def add_listener(self, listener):
+        """
+        Registers a listener for inventory mutations.
+
+        Listeners must implement ``inventory_changed(event, product, old_value)``
+        where event is ``"add"``, ``"remove"`` or the name of the product
+        attribute that changed. They may also implement
+        ``inventory_settled()``, called once every event of a mutation has
+        been delivered; a batch such as ``add_products`` settles only after
+        its last event, when listeners have seen all of the new state.
+
+        Args:
+            listener: The object to notify on mutations.
+        """
+        if listener not in self._listeners:
+            self._listeners += (listener,)
+            settled = getattr(listener, "inventory_settled", None)
+            if settled is not None:
+                self._settled += (settled,)
+
+    def remove_listener(self, listener):
+        """
+        Unregisters a previously added listener.
+
+        Args:
+            listener: The listener to remove.
+        """
+        self._listeners = tuple(o for o in self._listeners if o is not listener)
+        self._settled = tuple(
+            callback
+            for callback in self._settled
+            if getattr(callback, "__self__", None) is not listener
+        )
+
+    def _emit(self, event, product, old_value):
+        """Notifies all listeners of a single-event mutation."""
+        for listener in self._listeners:
+            listener.inventory_changed(event, product, old_value)
+        for settled in self._settled:
+            settled()
+
+    def _emit_many(self, events):
+        """Notifies all listeners of a batch, settling once at the end."""
+        listeners = self._listeners
+        for event, product, old_value in events:
+            for listener in listeners:
+                listener.inventory_changed(event, product, old_value)
+        for settled in self._settled:
+            settled()
+
+    @_locked
+    def product_changed(self, product, attribute, old_value):
+        """
+        Observer callback invoked by products held in this inventory.
+
+        Args:
+            product (Product): The product that changed.
+            attribute (str): The name of the changed attribute.
+            old_value: The attribute's value before the change.
+        """
+        self._update_indexes(product, attribute, old_value)
+        self._emit(attribute, product, old_value)
+
+    def _update_indexes(self, product, attribute, old_value):
+        """Moves a changed product to its new place in the secondary indexes."""
+        if attribute == "category":
+            self._discard_from_category(old_value, product)
+            self._file_under_category(product)
+            self._totals.remove(old_value, product.price, product.quantity)
+            self._totals.add(product.category, product.price, product.quantity)
+        elif attribute == "price":
+            self._totals.reprice(
+                product.category, product.quantity, old_value, product.price
+            )
+            entry = (product.price, product.sku_bytes)
+            self._prices.remove(old_value, product.sku_bytes)
+            self._prices.add_entry(entry)
+            category_prices = self._prices_by_category[product.category]
+            category_prices.remove(old_value, product.sku_bytes)
+            category_prices.add_entry(entry)
+        elif attribute == "quantity":
+            self._stock.update(product.sku_bytes, product.quantity)
+            self._totals.restock(
+                product.category, product.price, old_value, product.quantity
+            )
+        elif attribute == "name":
+            self._names.remove(product.sku_bytes, old_value)
+            self._names.add(product.sku_bytes, product.name)
+        elif attribute == "location":
+            location, old_units = old_value
+            if location is not None:
+                self._count_at(location, product.stock_at(location) - old_units)
+
+    def _update_indexes_batch(self, old_prices, old_quantities):
+        """
+        Re-files a batch of repriced and restocked products, re-sorting each
+        affected price index once.
+
+        Args:
+            old_prices (dict): Product -> price before the batch.
+            old_quantities (dict): Product -> quantity before the batch.
+        """
+        if old_prices:
+            entries = [(product.price, product.sku_bytes) for product in old_prices]
+            by_category = {}
+            for product, entry in zip(old_prices, entries):
+                by_category.setdefault(product.category, []).append(entry)
+                self._totals.reprice(
+                    product.category,
+                    old_quantities.get(product, product.quantity),
+                    old_prices[product],
+                    product.price,
+                )
+            self._prices.replace({sku for _, sku in entries}, entries)
+            for category, category_entries in by_category.items():
+                self._prices_by_category[category].replace(
+                    {sku for _, sku in category_entries}, category_entries
+                )
+        if old_quantities:
+            self._stock.update_many(
+                [(product.sku_bytes, product.quantity) for product in old_quantities]
+            )
+            for product, old_quantity in old_quantities.items():
+                self._totals.restock(
+                    product.category, product.price, old_quantity, product.quantity
+                )
+
+    def _index_product(self, product):
+        """Adds a product to the secondary indexes."""
+        entry = (product.price, product.sku_bytes)
+        self._prices.add_entry(entry)
+        self._stock.update(product.sku_bytes, product.quantity)
+        self._names.add(product.sku_bytes, product.name)
+        self._totals.add(product.category, product.price, product.quantity)
+        for location, units in product.stock_by_location().items():
+            self._count_at(location, units)
+        self._file_under_category(product, entry)
+
+    def _index_products(self, products):
+        """Adds a batch of products to the secondary indexes."""
+        entries = [(product.price, product.sku_bytes) for product in products]
+        self._prices.add_entries(entries)
+        by_category = {}
+        for product, entry in zip(products, entries):
+            self._stock.update(product.sku_bytes, product.quantity)
+            self._names.add(product.sku_bytes, product.name)
+            self._totals.add(product.category, product.price, product.quantity)
+            for location, units in product.stock_by_location().items():
+                self._count_at(location, units)
+            self._by_category.setdefault(product.category, {})[
+                product.sku_bytes
+            ] = product
+            by_category.setdefault(product.category, []).append(entry)
+        for category, category_entries in by_category.items():
+            if category not in self._prices_by_category:
+                self._prices_by_category[category] = PriceIndex()
+            self._prices_by_category[category].add_entries(category_entries)
+
+    def _unindex_product(self, product):
+        """Removes a product from the secondary indexes."""
+        self._prices.remove(product.price, product.sku_bytes)
+        self._stock.discard(product.sku_bytes)
+        self._names.remove(product.sku_bytes, product.name)
+        self._totals.remove(product.category, product.price, product.quantity)
+        for location, units in product.stock_by_location().items():
+            self._count_at(location, -units)
+        self._discard_from_category(product.category, product)
+
+    def _count_at(self, location, units):
+        """Adjusts the running unit total of a location."""
+        total = self._location_units.get(location, 0) + units
+        if total:
+            self._location_units[location] = total
+        else:
+            self._location_units.pop(location, None)
+
+    def _file_under_category(self, product, price_entry=None):
+        """Adds a product to its category's bucket and price index."""
+        category = product.category
+        self._by_category.setdefault(category, {})[product.sku_bytes] = product
+        if category not in self._prices_by_category:
+            self._prices_by_category[category] = PriceIndex()
+        if price_entry is None:
+            price_entry = (product.price, product.sku_bytes)
+        self._prices_by_category[category].add_entry(price_entry)
+
+    def _discard_from_category(self, category, product):
+        """Drops a product from a category bucket, pruning empty buckets."""
+        members = self._by_category.get(category)
+        if members is None or members.pop(product.sku_bytes, None) is None:
+            return
+        self._prices_by_category[category].remove(product.price, product.sku_bytes)
+        if not members:
+            del self._by_category[category]
+            del self._prices_by_category[category]
 
     def __str__(self):
         """Returns a readable string representation of the inventory."""
         return f"Inventory[Total Products={len(self.products)}]"
+
+
+def _great_circle_km(origin: tuple, destination: tuple) -> float:
+    """Returns the haversine distance in km between two (lat, lon) points."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (*origin, *destination))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * 6371.0 * math.asin(math.sqrt(a))
@@ -0,0 +1,322 @@
+import json
+import mmap
+import os
+import struct
+
+from .category import Category
+from .inventory import InventoryManager
+from .product import Product
+
+SNAPSHOT_MAGIC = b"INVSNAP1"
+_HEADER = struct.Struct("<8sQI")  # magic, sequence number, category count
+_CATEGORY = struct.Struct("<HI")  # name length, description length
+_COUNT = struct.Struct("<Q")
+_PRODUCT = struct.Struct("<16sdqIH")  # SKU, price, quantity, category, name length
+# Optional trailer: a count, then per-location stock of the products above.
+_STOCK = struct.Struct("<16sqH")  # SKU, units, location name length
+
+
+class Journal:
+    """
+    Write-ahead log and snapshot store for an ``InventoryManager``.
+
+    Once attached, every mutation is appended to ``journal.log`` as one JSON
+    line tagged with a sequence number. After every ``snapshot_interval``
+    records, once the mutation being logged has finished, the whole
+    inventory is written to a compact binary ``snapshot.bin`` and the log is
+    truncated, so ``recover()`` only has to load the snapshot (through
+    ``mmap``) and replay about one interval of log records, plus the rest
+    of any batch that crossed it.
+
+    Attributes:
+        directory (str): The directory holding the snapshot and log.
+        snapshot_interval (int): Log records written between snapshots.
+    """
+
+    def __init__(self, directory, snapshot_interval=100000, fsync=False):
+        """
+        Initializes a journal stored in ``directory``.
+
+        Args:
+            directory (str): Where the snapshot and log files live.
+            snapshot_interval (int): Log records written between snapshots.
+            fsync (bool): Whether to fsync the log after every record.
+        """
+        self.directory = directory
+        self.snapshot_interval = snapshot_interval
+        self._fsync = fsync
+        self._log_path = os.path.join(directory, "journal.log")
+        self._snapshot_path = os.path.join(directory, "snapshot.bin")
+        self._log = None
+        self._inventory = None
+        self._sequence = 0
+        self._since_snapshot = 0
+
+    def recover(self, inventory=None, categories=None) -> InventoryManager:
+        """
+        Rebuilds an inventory from the latest snapshot and the log tail,
+        then attaches the journal to it.
+
+        Args:
+            inventory (InventoryManager, optional): An empty inventory to
+                fill; a new one is created when omitted.
+            categories (dict, optional): Category name to Category, reused
+                for matching names and extended with new ones.
+
+        Returns:
+            InventoryManager: The recovered inventory.
+        """
+        inventory = InventoryManager() if inventory is None else inventory
+        categories = {} if categories is None else categories
+        self._sequence = self._load_snapshot(inventory, categories)
+        replayed = self._replay_log(inventory, categories)
+        self.attach(inventory)
+        if replayed:
+            self.snapshot()
+        return inventory
+
+    def load(self, inventory=None, categories=None) -> InventoryManager:
+        """
+        Rebuilds an inventory like ``recover`` without touching the files.
+
+        Nothing is attached, snapshotted, repaired or created, so this is
+        safe for read-only use of a journal another process may own.
+
+        Args:
+            inventory (InventoryManager, optional): An empty inventory to
+                fill; a new one is created when omitted.
+            categories (dict, optional): Category name to Category, reused
+                for matching names and extended with new ones.
+
+        Returns:
+            InventoryManager: The rebuilt inventory.
+        """
+        inventory = InventoryManager() if inventory is None else inventory
+        categories = {} if categories is None else categories
+        self._sequence = self._load_snapshot(inventory, categories)
+        self._replay_log(inventory, categories, repair=False)
+        return inventory
+
+    def attach(self, inventory):
+        """
+        Starts recording the mutations of an inventory.
+
+        Args:
+            inventory (InventoryManager): The inventory to record.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self._inventory = inventory
+        self._log = open(self._log_path, "a", encoding="utf-8")
+        inventory.add_listener(self)
+
+    def detach(self):
+        """Stops recording and closes the log."""
+        if self._inventory is not None:
+            self._inventory.remove_listener(self)
+            self._inventory = None
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def inventory_changed(self, event, product, old_value):
+        """Listener callback that appends one mutation to the log."""
+        self._sequence += 1
+        record = {"seq": self._sequence, "op": event, "sku": product.id}
+        if event == "add":
+            record.update(
+                name=product.name,
+                price=product.price,
+                quantity=product.quantity,
+                category=product.category.name,
+                description=product.category.description,
+            )
+            locations = product.stock_by_location()
+            if locations:
+                record["locations"] = locations
+        elif event == "location":
+            record.update(location=old_value[0], value=product.stock_at(old_value[0]))
+        elif event == "category":
+            record.update(
+                category=product.category.name,
+                description=product.category.description,
+            )
+        elif event != "remove":
+            record["value"] = getattr(product, event)
+        self._log.write(json.dumps(record) + "\n")
+        self._log.flush()
+        if self._fsync:
+            os.fsync(self._log.fileno())
+        self._since_snapshot += 1
+
+    def inventory_settled(self):
+        """
+        Listener callback once a mutation's events are all logged.
+
+        Snapshots are only taken here: in the middle of a batch the
+        inventory already holds state whose records are not logged yet, and
+        replaying those records over such a snapshot would apply them twice.
+        """
+        if self._since_snapshot >= self.snapshot_interval:
+            self.snapshot()
+
+    def snapshot(self):
+        """Writes a snapshot of the attached inventory and truncates the log."""
+        temporary = self._snapshot_path + ".tmp"
+        products = self._inventory.products.values()
+        codes = {}
+        for product in products:
+            codes.setdefault(product.category, len(codes))
+        with open(temporary, "wb") as handle:
+            handle.write(_HEADER.pack(SNAPSHOT_MAGIC, self._sequence, len(codes)))
+            for category in codes:
+                name = category.name.encode("utf-8")
+                description = category.description.encode("utf-8")
+                handle.write(_CATEGORY.pack(len(name), len(description)))
+                handle.write(name + description)
+            handle.write(_COUNT.pack(len(products)))
+            for product in products:
+                name = product.name.encode("utf-8")
+                handle.write(
+                    _PRODUCT.pack(
+                        product.sku_bytes,
+                        product.price,
+                        product.quantity,
+                        codes[product.category],
+                        len(name),
+                    )
+                )
+                handle.write(name)
+            stock = [
+                (product.sku_bytes, location, units)
+                for product in products
+                for location, units in product.stock_by_location().items()
+            ]
+            handle.write(_COUNT.pack(len(stock)))
+            for sku, location, units in stock:
+                location = location.encode("utf-8")
+                handle.write(_STOCK.pack(sku, units, len(location)) + location)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self._snapshot_path)
+        self._log.truncate(0)
+        self._log.flush()
+        self._since_snapshot = 0
+
+    def close(self):
+        """Writes a final snapshot and stops recording."""
+        if self._inventory is not None:
+            self.snapshot()
+        self.detach()
+
+    def _load_snapshot(self, inventory, categories) -> int:
+        """Loads the snapshot into the inventory and returns its sequence."""
+        if not os.path.exists(self._snapshot_path):
+            return 0
+        with open(self._snapshot_path, "rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            magic, sequence, category_count = _HEADER.unpack_from(data, 0)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError("Not an inventory snapshot.")
+            offset = _HEADER.size
+            by_code = []
+            for _ in range(category_count):
+                name_length, description_length = _CATEGORY.unpack_from(data, offset)
+                offset += _CATEGORY.size
+                name = data[offset : offset + name_length].decode("utf-8")
+                offset += name_length
+                description = data[offset : offset + description_length]
+                offset += description_length
+                if name not in categories:
+                    categories[name] = Category(name, description.decode("utf-8"))
+                by_code.append(categories[name])
+            (count,) = _COUNT.unpack_from(data, offset)
+            offset += _COUNT.size
+            batch = []
+            for _ in range(count):
+                sku, price, quantity, code, name_length = _PRODUCT.unpack_from(
+                    data, offset
+                )
+                offset += _PRODUCT.size
+                name = data[offset : offset + name_length].decode("utf-8")
+                offset += name_length
+                batch.append(Product(name, price, by_code[code], quantity, sku=sku))
+            if offset < len(data):  # Snapshots without locations end here.
+                by_sku = {product.sku_bytes: product for product in batch}
+                (count,) = _COUNT.unpack_from(data, offset)
+                offset += _COUNT.size
+                for _ in range(count):
+                    sku, units, length = _STOCK.unpack_from(data, offset)
+                    offset += _STOCK.size
+                    location = data[offset : offset + length].decode("utf-8")
+                    offset += length
+                    by_sku[sku].transfer_stock(None, location, units)
+        inventory.add_products(batch)
+        return sequence
+
+    def _replay_log(self, inventory, categories, repair=True) -> int:
+        """
+        Applies log records newer than the snapshot; returns how many.
+
+        With ``repair``, a torn final write is cut off the log, so records
+        appended after recovery start on a fresh line instead of behind the
+        fragment.
+        """
+        if not os.path.exists(self._log_path):
+            return 0
+        replayed = intact = 0
+        with open(self._log_path, "rb") as handle:
+            for line in handle:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("Unterminated record.")
+                    record = json.loads(line)
+                except ValueError:
+                    break  # A torn final write; everything after it is lost.
+                intact += len(line)
+                if record["seq"] <= self._sequence:
+                    continue
+                self._apply(record, inventory, categories)
+                self._sequence = record["seq"]
+                replayed += 1
+        if repair and intact < os.path.getsize(self._log_path):
+            os.truncate(self._log_path, intact)
+        return replayed
+
+    @staticmethod
+    def _apply(record, inventory, categories):
+        """Re-applies one logged mutation."""
+        op = record["op"]
+        if op in ("add", "category"):
+            category = categories.get(record["category"])
+            if category is None:
+                category = categories[record["category"]] = Category(
+                    record["category"], record["description"]
+                )
+        if op == "add":
+            product = Product(
+                record["name"],
+                record["price"],
+                category,
+                record["quantity"],
+                sku=record["sku"],
+            )
+            for location, units in record.get("locations", {}).items():
+                product.transfer_stock(None, location, units)
+            inventory.add_product(product)
+            return
+        if op == "remove":
+            inventory.remove_product(record["sku"])
+            return
+        product = inventory.get_product_by_id(record["sku"])
+        if op == "category":
+            product.update_category(category)
+        elif op == "price":
+            product.update_price(record["value"])
+        elif op == "quantity":
+            product.update_quantity(record["value"] - product.quantity)
+        elif op == "name":
+            product.update_name(record["value"])
+        elif op == "location":
+            location = record["location"]
+            product.update_stock(location, record["value"] - product.stock_at(location))
@@ -0,0 +1,49 @@
+import threading
+from contextlib import contextmanager
+
+
+class StripedLock:
+    """
+    A fixed pool of re-entrant locks shared out by key.
+
+    Each key maps to one of ``stripes`` locks, so operations on different
+    keys rarely contend while operations on the same key always serialize.
+    Several keys are locked in ascending stripe order, which keeps
+    multi-key operations free of deadlocks.
+    """
+
+    def __init__(self, stripes: int = 64):
+        """
+        Initializes the lock pool.
+
+        Args:
+            stripes (int): The number of locks in the pool.
+        """
+        self._locks = [threading.RLock() for _ in range(stripes)]
+
+    def for_key(self, key):
+        """Returns the lock guarding ``key``."""
+        return self._locks[hash(key) % len(self._locks)]
+
+    @contextmanager
+    def hold(self, keys):
+        """
+        Holds the locks for several keys at once, acquired in stripe order.
+
+        Args:
+            keys (iterable): The keys to lock.
+        """
+        stripes = sorted({hash(key) % len(self._locks) for key in keys})
+        acquired = []
+        try:
+            for stripe in stripes:
+                self._locks[stripe].acquire()
+                acquired.append(self._locks[stripe])
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+
+# Guards stock changes per SKU; shared by Product, reservations and checkout.
+SKU_LOCKS = StripedLock()
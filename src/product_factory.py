@@ -1,6 +1,6 @@
 from .product import Product
 from .category import Category
-import uuid
+import os
 
 
 class ProductFactory:
@@ -14,6 +14,9 @@ class ProductFactory:
     Example Usage:
         electronics = Category("Electronics", "Devices and gadgets")
         laptop = ProductFactory.create_product("Laptop", 1200.00, electronics, 5)
+        products = ProductFactory.create_products(
+            [("Phone", 699.99, electronics, 10), ("Tablet", 329.00, electronics, 4)]
+        )
     """
 
     @staticmethod
@@ -31,3 +34,45 @@ class ProductFactory:
             raise ValueError("Quantity cannot be negative.")
 
         return Product(name, price, category, quantity)
+
+    @staticmethod
+    def create_products(rows) -> list[Product]:
+        """
+        Creates many Product instances after validating every row.
+
+        All rows are checked before any product is built, and SKUs are drawn
+        from a single ``os.urandom`` call instead of one ``uuid4()`` each.
+
+        Args:
+            rows (iterable): ``(name, price, category, quantity)`` tuples,
+                optionally followed by an existing SKU to reuse (or None).
+
+        Returns:
+            list: The new products, in row order.
+
+        Raises:
+            TypeError: If a row's category is not a Category object.
+            ValueError: If a row has a negative price or quantity.
+        """
+        rows = list(rows)
+        for index, (_, price, category, quantity, *_) in enumerate(rows):
+            if not isinstance(category, Category):
+                raise TypeError(f"Row {index}: Category must be a Category object.")
+            if price < 0:
+                raise ValueError(f"Row {index}: Price cannot be negative.")
+            if quantity < 0:
+                raise ValueError(f"Row {index}: Quantity cannot be negative.")
+
+        skus = bytearray(os.urandom(16 * len(rows)))
+        # Stamp RFC 4122 version 4 and variant bits, as uuid.uuid4() does.
+        for offset in range(0, len(skus), 16):
+            skus[offset + 6] = (skus[offset + 6] & 0x0F) | 0x40
+            skus[offset + 8] = (skus[offset + 8] & 0x3F) | 0x80
+        skus = bytes(skus)
+        products = []
+        for i, (name, price, category, quantity, *given) in enumerate(rows):
+            sku = given[0] if given and given[0] is not None else None
+            if sku is None:
+                sku = skus[16 * i : 16 * i + 16]
+            products.append(Product(name, price, category, quantity, sku=sku))
+        return products
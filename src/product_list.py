@@ -0,0 +1,256 @@
+import tkinter as tk
+from tkinter import ttk
+
+COLUMNS = ("id", "name", "price", "category", "quantity")
+
+
+class ProductListModel:
+    """
+    Ordered, filterable list of products backing a virtualized view.
+
+    The model keeps only SKUs; rows are formatted on demand for the window
+    the view is showing, so a list of a million products costs one list of
+    references, not a million strings or widgets. ``apply`` folds change
+    feed batches in place: adds append, removes drop one entry, and
+    updates only re-check the filter. A set of the listed SKUs makes
+    replayed or out-of-filter changes cheap to recognise.
+
+    Attributes:
+        inventory (InventoryManager): The inventory being listed.
+    """
+
+    # Removals per batch above which the list is rebuilt in one pass.
+    _REBUILD_THRESHOLD = 16
+
+    def __init__(self, inventory):
+        """
+        Initializes a model listing every product.
+
+        Args:
+            inventory (InventoryManager): The inventory to list.
+        """
+        self.inventory = inventory
+        self._predicate = None
+        self._skus = []
+        self._members = set()  # the SKUs in ``_skus``
+        self.show()
+
+    def show(self, products=None, predicate=None):
+        """
+        Replaces the listed products.
+
+        Args:
+            products (iterable, optional): The products to list, in order;
+                every product in the inventory when omitted.
+            predicate (callable, optional): Decides whether products added
+                or changed later belong in the list. Without one, later
+                additions are always listed.
+        """
+        self._predicate = predicate
+        if products is None:
+            # A locked copy: writers on worker threads may still be adding.
+            products = self.inventory.get_all_products()
+            if predicate is not None:
+                products = filter(predicate, products)
+        self._skus = [product.sku_bytes for product in products]
+        self._members = set(self._skus)
+
+    def reload(self):
+        """Rebuilds the list from the inventory under the current filter."""
+        self.show(predicate=self._predicate)
+
+    def apply(self, changes) -> bool:
+        """
+        Applies a batch of change feed entries.
+
+        Args:
+            changes (list): Change objects from a ``Subscription``.
+
+        Returns:
+            bool: Whether anything was received that may alter the view.
+        """
+        removed = set()
+        for change in changes:
+            if change.op == "reset":
+                self.reload()
+                return True
+            predicate = self._predicate
+            wanted = change.op != "remove" and (
+                predicate is None or predicate(change.product)
+            )
+            if change.sku in self._members:
+                if not wanted:
+                    removed.add(change.sku)
+            elif wanted:
+                self._members.add(change.sku)
+                self._skus.append(change.sku)
+        if removed:
+            self._remove(removed)
+        return bool(changes)
+
+    def rows(self, start: int, count: int) -> list:
+        """
+        Formats a window of the list.
+
+        Args:
+            start (int): Index of the first row.
+            count (int): The number of rows wanted.
+
+        Returns:
+            list: ``(sku, values)`` pairs with one value per column.
+        """
+        products = self.inventory.products
+        window = []
+        for sku in self._skus[max(start, 0) : max(start, 0) + count]:
+            product = products.get(sku)
+            if product is not None:
+                window.append(
+                    (
+                        sku,
+                        (
+                            product.id,
+                            product.name,
+                            f"${product.price}",
+                            product.category.name,
+                            product.quantity,
+                        ),
+                    )
+                )
+        return window
+
+    def sku_at(self, index: int):
+        """Returns the SKU listed at ``index``, or None if out of range."""
+        if 0 <= index < len(self._skus):
+            return self._skus[index]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._skus)
+
+    def _remove(self, skus: set):
+        """Drops SKUs from the list."""
+        self._members -= skus
+        if len(skus) > self._REBUILD_THRESHOLD:
+            self._skus = [sku for sku in self._skus if sku not in skus]
+            return
+        for sku in skus:
+            del self._skus[self._skus.index(sku)]
+
+
+class ProductListView:
+    """
+    ``ttk.Treeview`` that shows a ``ProductListModel`` one window at a time.
+
+    Only ``height`` tree items ever exist; scrolling re-fills them from the
+    model instead of moving through a million inserted rows. When given a
+    change feed subscription the view polls it from the Tk event loop and
+    repaints just the visible window after each batch.
+    """
+
+    def __init__(self, master, model, subscription=None, height=10, poll_ms=100):
+        """
+        Builds the tree and its scrollbar inside ``master``.
+
+        Args:
+            master (tk.Widget): The parent widget.
+            model (ProductListModel): The rows to show.
+            subscription (Subscription, optional): Changes to apply live.
+            height (int): The number of visible rows.
+            poll_ms (int): Milliseconds between subscription polls.
+        """
+        self.model = model
+        self.frame = tk.Frame(master)
+        self.tree = ttk.Treeview(
+            self.frame, columns=COLUMNS, show="headings", height=height
+        )
+        self.tree.configure(selectmode="browse")
+        for column, width in zip(COLUMNS, (270, 160, 80, 110, 70)):
+            self.tree.heading(column, text=column.title())
+            self.tree.column(column, width=width, stretch=column == "name")
+        self.scrollbar = ttk.Scrollbar(
+            self.frame, orient="vertical", command=self._on_scroll
+        )
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda _: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda _: self.scroll(3))
+        self._height = height
+        self._top = 0
+        self._selected = None
+        self._slot_skus = []  # SKU shown in each visible slot
+        self._subscription = subscription
+        self._poll_ms = poll_ms
+        self.render()
+        if subscription is not None:
+            self.frame.after(poll_ms, self._poll)
+
+    def pack(self, **options):
+        """Packs the view's frame."""
+        self.frame.pack(**options)
+
+    def show(self, products=None, predicate=None):
+        """Replaces the listed products and scrolls to the top."""
+        self.model.show(products, predicate)
+        self._top = 0
+        self.render()
+
+    def selected_sku(self):
+        """Returns the SKU of the selected row, or None."""
+        return self._selected
+
+    def scroll(self, rows: int):
+        """Moves the window by ``rows``."""
+        self._scroll_to(self._top + rows)
+
+    def render(self):
+        """Fills the visible tree items from the model."""
+        self._top = max(0, min(self._top, len(self.model) - self._height))
+        rows = self.model.rows(self._top, self._height)
+        self._slot_skus = [sku for sku, _ in rows]
+        for slot in range(self._height):
+            iid = str(slot)
+            if slot < len(rows):
+                sku, values = rows[slot]
+                if self.tree.exists(iid):
+                    self.tree.item(iid, values=values)
+                else:
+                    self.tree.insert("", "end", iid=iid, values=values)
+                if sku == self._selected:
+                    self.tree.selection_set(iid)
+                elif iid in self.tree.selection():
+                    self.tree.selection_remove(iid)
+            elif self.tree.exists(iid):
+                self.tree.delete(iid)
+        total = max(len(self.model), 1)
+        self.scrollbar.set(self._top / total, (self._top + self._height) / total)
+
+    def _scroll_to(self, top: int):
+        self._top = top
+        self.render()
+
+    def _on_scroll(self, action, amount, unit=None):
+        """Scrollbar callback: ``moveto`` a fraction or ``scroll`` by a step."""
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * len(self.model)))
+        else:
+            step = self._height if unit == "pages" else 1
+            self.scroll(int(amount) * step)
+
+    def _on_wheel(self, event):
+        self.scroll(-1 if event.delta > 0 else 1)
+
+    def _on_select(self, _event):
+        selection = self.tree.selection()
+        if selection:
+            self._selected = self._slot_skus[int(selection[0])]
+
+    def _poll(self):
+        """Applies pending changes and schedules the next poll."""
+        try:
+            changes = self._subscription.poll()
+            if changes and self.model.apply(changes):
+                self.render()
+        finally:
+            self.frame.after(self._poll_ms, self._poll)
@@ -0,0 +1,209 @@
+import heapq
+import math
+from itertools import islice
+
+from .category import Category
+from .indexes import NameIndex, tokenize
+
+_ORDER_KEYS = {
+    "price": lambda product: product.price,
+    "quantity": lambda product: product.quantity,
+    "name": lambda product: product.name,
+}
+
+
+class Query:
+    """
+    Composable, lazily evaluated product query over an ``InventoryManager``.
+
+    Filters are combined with AND. When the query runs, each index that can
+    answer one of the filters estimates how many products it would yield;
+    the smallest becomes the driver and every other filter is checked per
+    product. Ordering by price through a price index streams results already
+    sorted, so ``limit`` stops the walk early; any other ordering keeps only
+    ``limit`` products in a heap instead of sorting every match.
+
+    Example Usage:
+        cheap_phones = (
+            inventory.query()
+            .category(electronics)
+            .price_between(high=300)
+            .in_stock()
+            .order_by("price")
+            .limit(20)
+            .all()
+        )
+    """
+
+    def __init__(self, inventory):
+        """
+        Initializes an unfiltered query.
+
+        Args:
+            inventory (InventoryManager): The inventory to query.
+        """
+        self._inventory = inventory
+        self._category = None
+        self._price = (-math.inf, math.inf)
+        self._quantity = (-math.inf, math.inf)
+        self._name = None
+        self._order = None
+        self._descending = False
+        self._limit = None
+
+    def category(self, category):
+        """Keeps products in ``category``."""
+        if not isinstance(category, Category):
+            raise TypeError("Expected a Category object.")
+        self._category = category
+        return self
+
+    def price_between(self, low=None, high=None):
+        """Keeps products priced between ``low`` and ``high`` inclusive."""
+        self._price = (
+            -math.inf if low is None else low,
+            math.inf if high is None else high,
+        )
+        return self
+
+    def quantity_between(self, low=None, high=None):
+        """Keeps products with stock between ``low`` and ``high`` inclusive."""
+        self._quantity = (
+            -math.inf if low is None else low,
+            math.inf if high is None else high,
+        )
+        return self
+
+    def in_stock(self):
+        """Keeps products with at least one unit in stock."""
+        return self.quantity_between(low=1)
+
+    def name_matches(self, text: str):
+        """Keeps products whose name contains every word (or word prefix)."""
+        self._name = text if tokenize(text) else None
+        return self
+
+    def order_by(self, attribute: str, descending=False):
+        """
+        Sorts results by ``"price"``, ``"quantity"`` or ``"name"``.
+
+        Raises:
+            ValueError: If the attribute cannot be sorted on.
+        """
+        if attribute not in _ORDER_KEYS:
+            raise ValueError(f"Cannot order by {attribute!r}.")
+        self._order = attribute
+        self._descending = descending
+        return self
+
+    def limit(self, n: int):
+        """Returns at most ``n`` products."""
+        self._limit = max(n, 0)
+        return self
+
+    def explain(self) -> str:
+        """Returns the name of the index that would drive the query."""
+        return self._plan()[0]
+
+    def all(self) -> list:
+        """Runs the query and returns the results as a list."""
+        return list(self)
+
+    def first(self):
+        """Returns the first result, or None if nothing matches."""
+        return next(iter(self), None)
+
+    def count(self) -> int:
+        """Counts the matching products, ignoring order and limit."""
+        return sum(1 for _ in self._matches(self._plan()[1]))
+
+    def __iter__(self):
+        """Runs the query, yielding products as they are found."""
+        _, skus, ordered = self._plan()
+        matches = self._matches(skus)
+        if self._order is not None and not ordered:
+            key = _ORDER_KEYS[self._order]
+            if self._limit is not None:
+                pick = heapq.nlargest if self._descending else heapq.nsmallest
+                matches = iter(pick(self._limit, matches, key=key))
+            else:
+                matches = iter(sorted(matches, key=key, reverse=self._descending))
+        if self._limit is not None:
+            matches = islice(matches, self._limit)
+        return matches
+
+    def _plan(self) -> tuple:
+        """Chooses the cheapest index; returns (name, SKU iterable, ordered)."""
+        inventory = self._inventory
+        low, high = self._price
+        by_price = self._order == "price"
+        # Every driver works on a copy taken under the index lock, so removals
+        # and concurrent writes while the results are consumed are safe.
+        candidates = [
+            (
+                len(inventory.products),
+                "scan",
+                lambda: iter(list(inventory.products)),
+                False,
+            )
+        ]
+        if self._price != (-math.inf, math.inf) or by_price:
+            candidates.append(
+                (
+                    inventory._prices.count(low, high),
+                    "price",
+                    lambda: inventory._prices.iter_range(low, high, self._descending),
+                    by_price,
+                )
+            )
+        if self._category is not None:
+            prices = inventory._prices_by_category.get(self._category)
+            if prices is None:
+                return "category", iter(()), True
+            candidates.append(
+                (
+                    prices.count(low, high),
+                    "category",
+                    lambda: prices.iter_range(low, high, self._descending),
+                    by_price,
+                )
+            )
+        if self._name is not None:
+            candidates.append(
+                (
+                    inventory._names.estimate(self._name),
+                    "name",
+                    lambda: iter(inventory._names.matching(self._name)),
+                    False,
+                )
+            )
+        # An ordered walk only needs to reach ``limit`` matches, so when one
+        # is available with a limit it wins ties and near-ties.
+        if by_price and self._limit is not None:
+            candidates.sort(key=lambda c: (c[0] / 8 if c[3] else c[0], not c[3]))
+        else:
+            candidates.sort(key=lambda c: c[0])
+        _, name, skus, ordered = candidates[0]
+        with inventory._index_lock:
+            return name, skus(), ordered
+
+    def _matches(self, skus):
+        """Yields the products behind ``skus`` that pass every filter."""
+        products = self._inventory.products
+        category = self._category
+        price_low, price_high = self._price
+        quantity_low, quantity_high = self._quantity
+        name = self._name
+        for sku in skus:
+            product = products.get(sku)
+            if product is None:
+                continue
+            if category is not None and product.category is not category:
+                continue
+            if not price_low <= product.price <= price_high:
+                continue
+            if not quantity_low <= product.quantity <= quantity_high:
+                continue
+            if name is not None and not NameIndex.name_matches(name, product.name):
+                continue
+            yield product
@@ -0,0 +1,173 @@
+import itertools
+import threading
+import time
+
+from .locking import SKU_LOCKS
+from .product import sku_bytes
+
+
+class Reservation:
+    """
+    Stock held for a pending order.
+
+    Attributes:
+        id (int): The reservation handle.
+        sku (bytes): The reserved product's SKU.
+        quantity (int): The number of units held.
+        expires_at (float): Clock time after which the hold lapses.
+    """
+
+    __slots__ = ("id", "sku", "quantity", "expires_at")
+
+    def __init__(self, reservation_id: int, sku: bytes, quantity: int, expires_at):
+        """Initializes a Reservation instance."""
+        self.id = reservation_id
+        self.sku = sku
+        self.quantity = quantity
+        self.expires_at = expires_at
+
+
+class ReservationManager:
+    """
+    Holds stock for orders in progress without overselling.
+
+    ``reserve`` takes units out of ``Product.quantity`` straight away, so
+    every other reader and writer sees them as unavailable. ``commit``
+    makes the hold final and ``release`` (or lapsing past the TTL) puts the
+    units back. Work on one SKU is serialized by that SKU's stripe in
+    ``SKU_LOCKS``; reservations for different SKUs proceed in parallel.
+    """
+
+    def __init__(self, inventory, ttl: float = 900.0, clock=time.monotonic):
+        """
+        Initializes a ReservationManager.
+
+        Args:
+            inventory (InventoryManager): The inventory holding the products.
+            ttl (float): Default seconds before an uncommitted hold lapses.
+            clock (callable): Returns the current time in seconds.
+        """
+        self.inventory = inventory
+        self.ttl = ttl
+        self._clock = clock
+        self._ids = itertools.count(1)
+        self._reservations = {}  # id -> Reservation
+        self._by_sku = {}  # SKU bytes -> {id -> Reservation}
+        self._registry_lock = threading.Lock()
+
+    def reserve(self, product_id, quantity: int, ttl: float = None) -> int:
+        """
+        Holds units of a product for a pending order.
+
+        Args:
+            product_id (str): The SKU of the product.
+            quantity (int): The number of units to hold.
+            ttl (float, optional): Seconds before the hold lapses.
+
+        Returns:
+            int: The reservation id to pass to commit or release.
+
+        Raises:
+            ValueError: If the product does not exist, quantity is not
+                positive, or there is not enough stock.
+        """
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        product = self.inventory.get_product_by_id(product_id)
+        if product is None:
+            raise ValueError("Product not found.")
+        key = product.sku_bytes
+        with SKU_LOCKS.for_key(key):
+            self._expire_sku(key)
+            product.update_quantity(-quantity)
+            expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+            reservation = Reservation(next(self._ids), key, quantity, expires_at)
+            with self._registry_lock:
+                self._reservations[reservation.id] = reservation
+                self._by_sku.setdefault(key, {})[reservation.id] = reservation
+        return reservation.id
+
+    def commit(self, reservation_id: int):
+        """
+        Makes a reservation final; its units stay out of stock.
+
+        Args:
+            reservation_id (int): The id returned by reserve.
+
+        Raises:
+            ValueError: If the reservation is unknown or has lapsed.
+        """
+        reservation = self._take(reservation_id)
+        if reservation.expires_at <= self._clock():
+            self._restock(reservation)
+            raise ValueError("Reservation expired.")
+
+    def release(self, reservation_id: int):
+        """
+        Cancels a reservation and returns its units to stock.
+
+        Args:
+            reservation_id (int): The id returned by reserve.
+
+        Raises:
+            ValueError: If the reservation is unknown.
+        """
+        self._restock(self._take(reservation_id))
+
+    def reserved_quantity(self, product_id) -> int:
+        """
+        Returns the number of units currently held for a product.
+
+        Args:
+            product_id (str): The SKU of the product.
+        """
+        with self._registry_lock:
+            held = list(self._by_sku.get(sku_bytes(product_id), {}).values())
+        return sum(reservation.quantity for reservation in held)
+
+    def expire(self) -> int:
+        """
+        Releases every lapsed reservation.
+
+        Returns:
+            int: The number of reservations released.
+        """
+        with self._registry_lock:
+            skus = list(self._by_sku)
+        return sum(self._expire_sku(key) for key in skus)
+
+    def _take(self, reservation_id):
+        """Removes a reservation from the registry and returns it."""
+        with self._registry_lock:
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is None:
+                raise ValueError("Reservation not found.")
+            held = self._by_sku[reservation.sku]
+            del held[reservation_id]
+            if not held:
+                del self._by_sku[reservation.sku]
+        return reservation
+
+    def _restock(self, reservation):
+        """Returns a reservation's units to its product, if still stocked."""
+        product = self.inventory.get_product_by_id(reservation.sku)
+        if product is not None:
+            product.update_quantity(reservation.quantity)
+
+    def _expire_sku(self, key) -> int:
+        """Releases lapsed reservations for one SKU; returns how many."""
+        now = self._clock()
+        with self._registry_lock:
+            lapsed = [
+                reservation.id
+                for reservation in self._by_sku.get(key, {}).values()
+                if reservation.expires_at <= now
+            ]
+        released = 0
+        for reservation_id in lapsed:
+            try:
+                self._restock(self._take(reservation_id))
+                released += 1
+            except ValueError:
+                pass  # Committed or released by another thread meanwhile.
+        return released
@@ -0,0 +1,299 @@
+import multiprocessing
+import threading
+
+from .category import Category
+from .inventory import InventoryManager
+from .product import Product, sku_bytes
+
+
+def _shard_of(key: bytes, shards: int) -> int:
+    """Maps a 16-byte SKU to a shard, identically in every process."""
+    return int.from_bytes(key[:8], "little") % shards
+
+
+def _to_row(product) -> tuple:
+    """Flattens a product into a picklable row."""
+    category = product.category
+    return (
+        product.sku_bytes,
+        product.name,
+        product.price,
+        category.name,
+        category.description,
+        product.quantity,
+    )
+
+
+def _shard_worker(connection):
+    """
+    Serves one shard: receives batches of commands, replies with results.
+
+    Each command is a tuple ``(op, *args)``; each result is ``(True, value)``
+    or ``(False, (exception_name, message))``. ``None`` shuts the shard down.
+    """
+    inventory = InventoryManager()
+    categories = {}
+
+    def category_for(name, description):
+        if name not in categories:
+            categories[name] = Category(name, description)
+        return categories[name]
+
+    def execute(op, *args):
+        if op == "add":
+            rows = args[0]
+            inventory.add_products(
+                Product(name, price, category_for(cat, desc), quantity, sku=sku)
+                for sku, name, price, cat, desc, quantity in rows
+            )
+            return len(rows)
+        if op == "remove":
+            inventory.remove_product(args[0])
+            return None
+        if op == "get":
+            product = inventory.get_product_by_id(args[0])
+            return None if product is None else _to_row(product)
+        if op == "update_quantity":
+            product = inventory.get_product_by_id(args[0])
+            if product is None:
+                raise ValueError("Product not found.")
+            product.update_quantity(args[1])
+            return product.quantity
+        if op == "update_price":
+            product = inventory.get_product_by_id(args[0])
+            if product is None:
+                raise ValueError("Product not found.")
+            product.update_price(args[1])
+            return None
+        if op == "category":
+            category = categories.get(args[0])
+            if category is None:
+                return []
+            return [_to_row(p) for p in inventory.get_products_by_category(category)]
+        if op == "count":
+            return len(inventory.products)
+        raise ValueError(f"Unknown op: {op!r}")
+
+    while True:
+        batch = connection.recv()
+        if batch is None:
+            connection.close()
+            return
+        results = []
+        for command in batch:
+            try:
+                results.append((True, execute(*command)))
+            except Exception as error:  # Reported back to the caller.
+                results.append((False, (type(error).__name__, str(error))))
+        connection.send(results)
+
+
+class ShardedInventory:
+    """
+    Inventory partitioned across worker processes.
+
+    Each SKU lives in exactly one shard, chosen from its bytes, and every
+    shard is an ``InventoryManager`` in its own process, so stock updates on
+    different shards run on different cores without sharing a GIL. Point
+    operations go to the owning shard; category queries are scattered to all
+    shards and gathered. The bulk methods group their work by shard and send
+    one message per shard, which is what makes throughput scale.
+
+    Products returned by queries are detached copies: mutate stock through
+    this class, not through them.
+
+    Attributes:
+        shards (int): The number of worker processes.
+    """
+
+    def __init__(self, shards: int = None, start_method: str = "spawn"):
+        """
+        Starts the shard processes.
+
+        Args:
+            shards (int, optional): Worker count; defaults to the CPU count.
+            start_method (str): The multiprocessing start method.
+        """
+        self.shards = shards or multiprocessing.cpu_count()
+        context = multiprocessing.get_context(start_method)
+        self._connections = []
+        self._processes = []
+        for _ in range(self.shards):
+            parent, child = context.Pipe()
+            process = context.Process(target=_shard_worker, args=(child,), daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+        self._categories = {}  # name -> Category, for rebuilding products
+        self._lock = threading.Lock()  # One request/reply exchange at a time.
+
+    def add_product(self, product):
+        """Adds a product to its owning shard."""
+        self.add_products([product])
+
+    def add_products(self, products):
+        """
+        Adds many products, one message per shard.
+
+        Each shard inserts its part atomically; a duplicate SKU fails only
+        the shard that owns it.
+
+        Raises:
+            TypeError: If any item is not a Product instance.
+            ValueError: If a shard rejects its part of the batch.
+        """
+        by_shard = {}
+        for product in products:
+            if not isinstance(product, Product):
+                raise TypeError("Only Product objects can be added to inventory.")
+            self._categories.setdefault(product.category.name, product.category)
+            shard = _shard_of(product.sku_bytes, self.shards)
+            by_shard.setdefault(shard, []).append(_to_row(product))
+        commands = {shard: [("add", rows)] for shard, rows in by_shard.items()}
+        for results in self._exchange(commands).values():
+            self._unwrap(results[0])
+
+    def remove_product(self, product_id):
+        """
+        Removes a product from its shard.
+
+        Raises:
+            ValueError: If the product does not exist.
+        """
+        self._point("remove", product_id)
+
+    def get_product_by_id(self, product_id):
+        """Returns a detached copy of a product, or None if not found."""
+        key = sku_bytes(product_id)
+        if key is None:
+            return None
+        return self._from_row(self._point("get", key))
+
+    def update_quantity(self, product_id, quantity_change: int) -> int:
+        """
+        Changes a product's stock on its shard.
+
+        Returns:
+            int: The new quantity.
+
+        Raises:
+            ValueError: If the product does not exist or stock is insufficient.
+        """
+        return self._point("update_quantity", product_id, quantity_change)
+
+    def update_quantities(self, changes) -> list:
+        """
+        Applies many stock changes, one message per shard.
+
+        Args:
+            changes (iterable): ``(sku, quantity_change)`` pairs.
+
+        Returns:
+            list: The new quantity for each change in order, or the
+            ValueError raised for a change that failed.
+        """
+        return self._scatter_point("update_quantity", changes)
+
+    def update_price(self, product_id, new_price: float):
+        """
+        Changes a product's price on its shard.
+
+        Raises:
+            ValueError: If the product does not exist or the price is negative.
+        """
+        self._point("update_price", product_id, new_price)
+
+    def get_products_by_category(self, category) -> list[Product]:
+        """
+        Gathers detached copies of a category's products from every shard.
+
+        Raises:
+            TypeError: If the category argument is not a Category instance.
+        """
+        if not isinstance(category, Category):
+            raise TypeError("Expected a Category object.")
+        commands = {
+            shard: [("category", category.name)] for shard in range(self.shards)
+        }
+        products = []
+        for results in self._exchange(commands).values():
+            products.extend(map(self._from_row, self._unwrap(results[0])))
+        return products
+
+    def close(self):
+        """Stops the shard processes."""
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections, self._processes = [], []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        commands = {shard: [("count",)] for shard in range(self.shards)}
+        return sum(self._unwrap(r[0]) for r in self._exchange(commands).values())
+
+    def __str__(self):
+        """Returns a readable string representation of the inventory."""
+        return f"Inventory[Total Products={len(self)}, Shards={self.shards}]"
+
+    def _point(self, op, product_id, *args):
+        """Runs one command on the shard that owns ``product_id``."""
+        key = sku_bytes(product_id)
+        if key is None:
+            raise ValueError("Product not found.")
+        shard = _shard_of(key, self.shards)
+        return self._unwrap(self._exchange({shard: [(op, key, *args)]})[shard][0])
+
+    def _scatter_point(self, op, pairs) -> list:
+        """Runs per-SKU commands grouped into one batch per shard."""
+        by_shard, order = {}, []
+        for product_id, value in pairs:
+            key = sku_bytes(product_id)
+            shard = _shard_of(key, self.shards) if key is not None else 0
+            commands = by_shard.setdefault(shard, [])
+            order.append((shard, len(commands)))
+            commands.append((op, key, value))
+        replies = self._exchange(by_shard)
+        results = []
+        for shard, position in order:
+            try:
+                results.append(self._unwrap(replies[shard][position]))
+            except ValueError as error:
+                results.append(error)
+        return results
+
+    def _exchange(self, commands: dict) -> dict:
+        """Sends each shard its batch, then collects every reply."""
+        with self._lock:
+            for shard, batch in commands.items():
+                self._connections[shard].send(batch)
+            return {shard: self._connections[shard].recv() for shard in commands}
+
+    @staticmethod
+    def _unwrap(result):
+        """Returns a command's value or re-raises its error."""
+        ok, value = result
+        if ok:
+            return value
+        name, message = value
+        raise (TypeError if name == "TypeError" else ValueError)(message)
+
+    def _from_row(self, row):
+        """Builds a detached Product from a shard row."""
+        if row is None:
+            return None
+        sku, name, price, category_name, description, quantity = row
+        category = self._categories.get(category_name)
+        if category is None:
+            category = self._categories[category_name] = Category(
+                category_name, description
+            )
+        return Product(name, price, category, quantity, sku=sku)
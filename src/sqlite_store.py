@@ -0,0 +1,374 @@
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+
+from .category import Category
+from .product import Product, sku_bytes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS categories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    description TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS products (
+    sku BLOB PRIMARY KEY,
+    name TEXT NOT NULL,
+    price REAL NOT NULL,
+    category_id INTEGER NOT NULL REFERENCES categories(id),
+    quantity INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_products_category ON products(category_id, price);
+CREATE INDEX IF NOT EXISTS idx_products_price ON products(price);
+CREATE INDEX IF NOT EXISTS idx_products_quantity ON products(quantity);
+"""
+
+_COLUMNS = "sku, name, price, category_id, quantity"
+
+
+class SQLiteInventoryManager:
+    """
+    Inventory manager that persists products in SQLite.
+
+    Offers the same API as ``InventoryManager``. Products are loaded on
+    demand and kept in an LRU cache, so hot ``get_product_by_id`` calls are
+    served from memory; any product object still referenced elsewhere is
+    reused rather than loaded twice. Changes made through ``Product``
+    mutators are queued and written in one transaction every ``batch_size``
+    changes, on ``flush()``, or before a query that reads the table.
+    Categories are stored once and matched by name.
+
+    Attributes:
+        path (str): The SQLite database path, or ``":memory:"``.
+    """
+
+    def __init__(self, path=":memory:", cache_size=10000, batch_size=1000):
+        """
+        Opens (and if needed creates) an SQLite-backed inventory.
+
+        Args:
+            path (str): The database file, or ``":memory:"``.
+            cache_size (int): How many recently used products stay cached.
+            batch_size (int): How many pending changes trigger a write.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.RLock()
+        self._cache_size = cache_size
+        self._batch_size = batch_size
+        self._cache = OrderedDict()  # SKU bytes -> Product, least recent first
+        self._live = weakref.WeakValueDictionary()  # SKU bytes -> Product
+        self._dirty = {}  # SKU bytes -> Product awaiting an UPDATE
+        self._categories = {}  # id -> Category
+        self._category_ids = {}  # name -> id
+        for category_id, name, description in self._connection.execute(
+            "SELECT id, name, description FROM categories"
+        ):
+            self._categories[category_id] = Category(name, description)
+            self._category_ids[name] = category_id
+
+    def add_product(self, product):
+        """
+        Adds a new product to the inventory.
+
+        Args:
+            product (Product): The product to be added.
+
+        Raises:
+            TypeError: If the argument is not a Product instance.
+            ValueError: If the product SKU already exists.
+        """
+        self.add_products([product])
+
+    def add_products(self, products):
+        """
+        Adds many products to the inventory in one transaction.
+
+        Args:
+            products (iterable): The products to be added.
+
+        Raises:
+            TypeError: If any item is not a Product instance.
+            ValueError: If any SKU already exists or repeats within the batch.
+        """
+        batch = list(products)
+        if not all(isinstance(product, Product) for product in batch):
+            raise TypeError("Only Product objects can be added to inventory.")
+        with self._lock:
+            with self._connection:
+                self._write_dirty()
+                for category in {product.category for product in batch}:
+                    self._category_id(category)
+            try:
+                with self._connection:
+                    self._connection.executemany(
+                        f"INSERT INTO products ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                        [self._row(product) for product in batch],
+                    )
+            except sqlite3.IntegrityError:
+                raise ValueError("Product SKU already exists.")
+            for product in batch:
+                product.add_observer(self)
+                self._remember(product)
+
+    def remove_product(self, product_id):
+        """
+        Removes a product from inventory.
+
+        Args:
+            product_id (str): The SKU of the product to be removed.
+
+        Raises:
+            ValueError: If the product does not exist.
+        """
+        key = sku_bytes(product_id)
+        with self._lock, self._connection:
+            deleted = self._connection.execute(
+                "DELETE FROM products WHERE sku = ?", (key,)
+            ).rowcount
+            if not deleted:
+                raise ValueError("Product not found.")
+            self._dirty.pop(key, None)
+            self._cache.pop(key, None)
+            product = self._live.pop(key, None)
+            if product is not None:
+                product.remove_observer(self)
+
+    def get_product_by_id(self, product_id):
+        """
+        Retrieves a product by its SKU, from the cache when possible.
+
+        Args:
+            product_id (str): The SKU of the product.
+
+        Returns:
+            Product or None: The product object if found, otherwise None.
+        """
+        key = sku_bytes(product_id)
+        if key is None:
+            return None
+        with self._lock:
+            product = self._cache.get(key)
+            if product is not None:
+                self._cache.move_to_end(key)
+                return product
+            row = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM products WHERE sku = ?", (key,)
+            ).fetchone()
+            return None if row is None else self._load(row)
+
+    def get_all_products(self):
+        """
+        Retrieves all products in inventory.
+
+        Returns:
+            list: A list of all products in the inventory.
+        """
+        return list(self.iter_products())
+
+    def iter_products(self, chunk_size=1000):
+        """
+        Iterates over all products, fetching rows in chunks.
+
+        Args:
+            chunk_size (int): The number of rows fetched per round trip.
+
+        Yields:
+            Product: Each product in the inventory.
+        """
+        with self._lock:
+            self._write_dirty()
+            cursor = self._connection.execute(f"SELECT {_COLUMNS} FROM products")
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(chunk_size)
+                products = [self._load(row, cache=False) for row in rows]
+            if not products:
+                return
+            yield from products
+
+    def get_products_by_category(self, category) -> list[Product]:
+        """
+        Retrieves all products belonging to a specific category.
+
+        Args:
+            category (Category): The category to filter products by.
+
+        Returns:
+            list: A list of products in the given category.
+
+        Raises:
+            TypeError: If the category argument is not a Category instance.
+        """
+        if not isinstance(category, Category):
+            raise TypeError("Expected a Category object.")
+        category_id = self._category_ids.get(category.name)
+        if category_id is None:
+            return []
+        return self._select("WHERE category_id = ?", (category_id,))
+
+    def get_products_by_price_range(self, low: float, high: float) -> list[Product]:
+        """
+        Retrieves all products priced between ``low`` and ``high`` inclusive.
+
+        Returns:
+            list: Matching products ordered by ascending price.
+        """
+        return self._select(
+            "WHERE price BETWEEN ? AND ? ORDER BY price, sku", (low, high)
+        )
+
+    def top_n_by_price(self, n: int, category=None, descending=True) -> list[Product]:
+        """
+        Retrieves the most expensive (or cheapest) products.
+
+        Args:
+            n (int): The maximum number of products to return.
+            category (Category, optional): Restrict results to this category.
+            descending (bool): Most expensive first when True.
+
+        Returns:
+            list: Up to ``n`` products ordered by price.
+        """
+        order = "DESC" if descending else "ASC"
+        if category is None:
+            return self._select(
+                f"ORDER BY price {order}, sku {order} LIMIT ?", (max(n, 0),)
+            )
+        if not isinstance(category, Category):
+            raise TypeError("Expected a Category object.")
+        category_id = self._category_ids.get(category.name)
+        if category_id is None:
+            return []
+        return self._select(
+            f"WHERE category_id = ? ORDER BY price {order}, sku {order} LIMIT ?",
+            (category_id, max(n, 0)),
+        )
+
+    def get_low_stock(self, threshold: int) -> list[Product]:
+        """
+        Retrieves products whose stock has fallen below a threshold.
+
+        Returns:
+            list: Matching products, lowest stock first.
+        """
+        return self._select("WHERE quantity < ? ORDER BY quantity", (threshold,))
+
+    def next_to_run_out(self, n: int) -> list[Product]:
+        """
+        Retrieves the products with the least stock remaining.
+
+        Returns:
+            list: Up to ``n`` products, lowest stock first.
+        """
+        return self._select("ORDER BY quantity LIMIT ?", (max(n, 0),))
+
+    def reindex_product(self, product_id):
+        """
+        Queues a product for rewriting after its attributes were assigned directly.
+
+        Raises:
+            ValueError: If the product does not exist.
+        """
+        product = self.get_product_by_id(product_id)
+        if product is None:
+            raise ValueError("Product not found.")
+        self.product_changed(product, None, None)
+
+    def product_changed(self, product, attribute, old_value):
+        """Observer callback that queues a changed product for writing."""
+        with self._lock:
+            self._dirty[product.sku_bytes] = product
+            if len(self._dirty) >= self._batch_size:
+                self.flush()
+
+    def flush(self):
+        """Writes all pending changes in a single transaction."""
+        with self._lock, self._connection:
+            self._write_dirty()
+
+    def close(self):
+        """Flushes pending changes and closes the database."""
+        with self._lock:
+            self.flush()
+            self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def __str__(self):
+        """Returns a readable string representation of the inventory."""
+        return f"Inventory[Total Products={len(self)}]"
+
+    def _select(self, clause, params) -> list[Product]:
+        """Runs a product query after writing pending changes."""
+        with self._lock:
+            self._write_dirty()
+            rows = self._connection.execute(
+                f"SELECT {_COLUMNS} FROM products {clause}", params
+            ).fetchall()
+            return [self._load(row) for row in rows]
+
+    def _write_dirty(self):
+        """Issues UPDATEs for pending changes inside the current transaction."""
+        if self._dirty:
+            self._connection.executemany(
+                "UPDATE products SET name = ?, price = ?, category_id = ?, "
+                "quantity = ? WHERE sku = ?",
+                [row[1:] + row[:1] for row in map(self._row, self._dirty.values())],
+            )
+            self._dirty.clear()
+
+    def _row(self, product) -> tuple:
+        """Converts a product to a database row."""
+        return (
+            product.sku_bytes,
+            product.name,
+            product.price,
+            self._category_id(product.category),
+            product.quantity,
+        )
+
+    def _category_id(self, category) -> int:
+        """Returns the row id for a category, inserting it if new."""
+        category_id = self._category_ids.get(category.name)
+        if category_id is None:
+            category_id = self._connection.execute(
+                "INSERT INTO categories (name, description) VALUES (?, ?)",
+                (category.name, category.description),
+            ).lastrowid
+            self._category_ids[category.name] = category_id
+            self._categories[category_id] = category
+        return category_id
+
+    def _load(self, row, cache=True) -> Product:
+        """Returns the product for a row, reusing any live instance."""
+        key, name, price, category_id, quantity = row
+        product = self._live.get(key)
+        if product is None:
+            product = Product(
+                name, price, self._categories[category_id], quantity, sku=key
+            )
+            product.add_observer(self)
+        if cache:
+            self._remember(product)
+        else:
+            self._live[key] = product
+        return product
+
+    def _remember(self, product):
+        """Puts a product in the LRU cache, evicting the oldest entry if full."""
+        key = product.sku_bytes
+        self._live[key] = product
+        self._cache[key] = product
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
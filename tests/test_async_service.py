@@ -0,0 +1,81 @@
+import asyncio
+import json
+import threading
+import unittest
+from src.async_service import AsyncInventoryService, serve
+from src.category import Category
+from src.inventory import InventoryManager
+from src.product import Product
+
+
+class CountingInventory(InventoryManager):
+    """Inventory that counts lookups and blocks them until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.lookups = 0
+        self.gate = threading.Event()
+
+    def get_product_by_id(self, product_id):
+        self.lookups += 1
+        self.gate.wait(5)
+        return super().get_product_by_id(product_id)
+
+
+class TestAsyncInventoryService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Set up a service over an inventory with one product."""
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.inventory = CountingInventory()
+        self.product = Product("Laptop", 1200, self.category, 5)
+        self.inventory.add_product(self.product)
+        self.service = AsyncInventoryService(
+            self.inventory, {"Electronics": self.category}
+        )
+
+    async def test_identical_reads_are_coalesced(self):
+        """Test concurrent lookups of one SKU share a single executor call."""
+        lookups = [self.service.get_product(self.product.id) for _ in range(10)]
+        pending = asyncio.gather(*lookups)
+        await asyncio.sleep(0.05)
+        self.inventory.gate.set()
+        results = await pending
+        self.assertEqual(results, [self.product] * 10)
+        self.assertEqual(self.inventory.lookups, 1)
+
+    async def test_add_query_and_reserve(self):
+        """Test add, category query and reservation through the facade."""
+        self.inventory.gate.set()
+        phone = await self.service.add_product("Phone", 800, "Electronics", 3)
+        products = await self.service.get_products_by_category("Electronics")
+        self.assertEqual(products, [self.product, phone])
+        reservation = await self.service.reserve(phone.id, 2)
+        await self.service.commit(reservation)
+        self.assertEqual(phone.quantity, 1)
+        with self.assertRaises(ValueError):
+            await self.service.reserve(phone.id, 2)
+
+    async def test_socket_front_end(self):
+        """Test the JSON Lines server answers lookups and reports errors."""
+        self.inventory.gate.set()
+        server = await serve(self.service)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for request in (
+            {"op": "get", "id": self.product.id},
+            {"op": "reserve", "id": self.product.id, "quantity": 99},
+        ):
+            writer.write(json.dumps(request).encode() + b"\n")
+        await writer.drain()
+        found = json.loads(await reader.readline())
+        failed = json.loads(await reader.readline())
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        self.assertEqual(found["result"]["Name"], "Laptop")
+        self.assertFalse(failed["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
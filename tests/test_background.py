@@ -0,0 +1,99 @@
+import io
+import threading
+import time
+import unittest
+from src.background import BackgroundTasks, TaskCancelled
+from src.catalog_io import import_catalog
+from src.inventory import InventoryManager
+
+
+class TestBackgroundTasks(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a task runner."""
+        self.tasks = BackgroundTasks()
+        self.results = []
+
+    def tearDown(self):
+        self.tasks.shutdown()
+
+    def drain(self):
+        """Dispatch until every submitted task has reported back."""
+        deadline = time.monotonic() + 5
+        while self.tasks.pending() and time.monotonic() < deadline:
+            self.tasks.dispatch()
+            time.sleep(0.001)
+
+    def test_results_are_delivered_on_dispatch(self):
+        """Test callbacks run only in dispatch, on the calling thread."""
+        self.tasks.submit(
+            lambda task: threading.get_ident(),
+            on_done=lambda ident: self.results.append((ident, threading.get_ident())),
+        )
+        self.tasks.submit(lambda task: 1 / 0, on_error=self.results.append)
+        self.drain()
+        worker, caller = self.results[0]
+        self.assertNotEqual(worker, caller)
+        self.assertEqual(caller, threading.get_ident())
+        self.assertIsInstance(self.results[1], ZeroDivisionError)
+
+    def test_newer_task_on_channel_supersedes_older(self):
+        """Test submitting on a busy channel cancels the running task."""
+        started = threading.Event()
+
+        def slow(task):
+            started.set()
+            while True:
+                task.check()
+                time.sleep(0.001)
+
+        old = self.tasks.submit(slow, on_done=self.results.append, channel="list")
+        started.wait(5)
+        self.tasks.submit(
+            lambda task: "new", on_done=self.results.append, channel="list"
+        )
+        self.drain()
+        self.assertTrue(old.cancelled)
+        self.assertEqual(self.results, ["new"])
+
+    def test_progress_is_coalesced_and_import_cancellable(self):
+        """Test progress reports and cancelling an import between chunks."""
+        inventory = InventoryManager()
+        lines = ["id,name,price,category,quantity"]
+        lines += [f",Item {i},1.0,Books,1" for i in range(100)]
+        reported, release = threading.Event(), threading.Event()
+        progress = []
+
+        def run(task):
+            def report(import_report):
+                task.report(import_report.imported, 100)
+                reported.set()
+                release.wait(5)
+
+            return import_catalog(
+                io.StringIO("\n".join(lines)),
+                inventory,
+                fmt="csv",
+                chunk_size=10,
+                progress=report,
+            )
+
+        task = self.tasks.submit(
+            run,
+            on_progress=lambda done, total: progress.append((done, total)),
+            on_error=self.results.append,
+        )
+        reported.wait(5)
+        self.tasks.dispatch()
+        task.cancel()
+        release.set()
+        self.drain()
+        self.assertEqual(progress, [(10, 100)])
+        self.assertEqual(self.results, [])
+        self.assertLess(len(inventory.products), 100)
+        with self.assertRaises(TaskCancelled):
+            task.check()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import csv
+import io
+import os
+import tempfile
+import unittest
+from src.catalog_io import MAX_REJECTED, export_catalog, import_catalog
+from src.category import Category
+from src.inventory import InventoryManager
+from src.product import Product
+
+
+class TestCatalogIO(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an inventory and a scratch directory."""
+        self.inventory = InventoryManager()
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.categories = {"Electronics": self.category}
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_csv_import_reports_rejected_rows(self):
+        """Test bad rows are reported while good rows are imported."""
+        source = io.StringIO(
+            "name,price,category,quantity\n"
+            "Laptop,1200,Electronics,5\n"
+            "Broken,abc,Electronics,1\n"
+            "T-Shirt,19.99,Clothing,50\n"
+            ",10,Electronics,1\n"
+        )
+        report = import_catalog(
+            source, self.inventory, self.categories, fmt="csv", chunk_size=2
+        )
+        self.assertEqual(report.imported, 2)
+        self.assertEqual([line for line, _ in report.rejected], [3, 5])
+        self.assertIn("Clothing", self.categories)
+        laptops = self.inventory.get_products_by_category(self.category)
+        self.assertEqual([p.name for p in laptops], ["Laptop"])
+
+    def test_jsonl_round_trip_keeps_skus(self):
+        """Test exporting and re-importing JSON Lines preserves products."""
+        product = Product("Laptop", 1200.5, self.category, 5)
+        self.inventory.add_product(product)
+        path = os.path.join(self.tmpdir.name, "catalog.jsonl")
+        self.assertEqual(export_catalog(self.inventory.products.values(), path), 1)
+
+        restored = InventoryManager()
+        report = import_catalog(path, restored, self.categories)
+        self.assertEqual(report.imported, 1)
+        copy = restored.get_product_by_id(product.id)
+        self.assertEqual(copy.get_details(), product.get_details())
+
+    def test_import_rejects_duplicate_skus(self):
+        """Test SKUs already in the inventory or repeated are rejected."""
+        product = Product("Laptop", 1200, self.category, 5)
+        self.inventory.add_product(product)
+        source = io.StringIO(
+            f'{{"id": "{product.id}", "name": "Laptop", "price": 1, '
+            f'"category": "Electronics", "quantity": 1}}\n'
+            "not json\n"
+        )
+        report = import_catalog(source, self.inventory, self.categories, fmt="jsonl")
+        self.assertEqual(report.imported, 0)
+        self.assertEqual([line for line, _ in report.rejected], [1, 2])
+
+    def test_malformed_rows_do_not_abort_import(self):
+        """Test CSV errors and invalid UTF-8 only reject their own rows."""
+        path = os.path.join(self.tmpdir.name, "catalog.csv")
+        with open(path, "wb") as handle:
+            handle.write(
+                b"name,price,category,quantity\n"
+                b"Laptop,1200,Electronics,5\n"
+                b"Caf\xe9,3,Electronics,1\n"
+                b"A name past the field size limit,1,Electronics,1\n"
+                b"Phone,800,Electronics,2\n"
+            )
+        csv_limit = csv.field_size_limit(16)
+        try:
+            report = import_catalog(path, self.inventory, self.categories)
+        finally:
+            csv.field_size_limit(csv_limit)
+        self.assertEqual(report.imported, 2)
+        self.assertEqual([line for line, _ in report.rejected], [3, 4])
+
+    def test_quantity_must_be_an_integer(self):
+        """Test JSON floats and booleans are rejected instead of truncated."""
+        source = io.StringIO(
+            '{"name": "A", "price": 1, "category": "Electronics", "quantity": 2.7}\n'
+            '{"name": "B", "price": 1, "category": "Electronics", "quantity": true}\n'
+            '{"name": "C", "price": true, "category": "Electronics", "quantity": 1}\n'
+            '{"name": "D", "price": 1.5, "category": "Electronics", "quantity": 3}\n'
+        )
+        report = import_catalog(source, self.inventory, self.categories, fmt="jsonl")
+        self.assertEqual(report.imported, 1)
+        self.assertEqual([line for line, _ in report.rejected], [1, 2, 3])
+
+    def test_rejections_are_capped(self):
+        """Test only the first rejections are kept while all are counted."""
+        rows = "name,price,category,quantity\n" + "x,bad,Electronics,1\n" * (
+            MAX_REJECTED + 5
+        )
+        report = import_catalog(
+            io.StringIO(rows), self.inventory, self.categories, fmt="csv"
+        )
+        self.assertEqual(report.rejected_count, MAX_REJECTED + 5)
+        self.assertEqual(len(report.rejected), MAX_REJECTED)
+        self.assertIn(f"Rejected={MAX_REJECTED + 5}", str(report))
+
+    def test_csv_export(self):
+        """Test CSV export writes a header and one line per product."""
+        self.inventory.add_product(Product("Laptop", 1200, self.category, 5))
+        target = io.StringIO()
+        export_catalog(self.inventory.products.values(), target, fmt="csv")
+        lines = target.getvalue().splitlines()
+        self.assertEqual(lines[0], "id,name,price,category,quantity")
+        self.assertTrue(lines[1].endswith(",Laptop,1200,Electronics,5"))
+
+
+if __name__ == "__main__":
+    unittest.main()
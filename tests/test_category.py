@@ -19,6 +19,12 @@ class TestCategory(unittest.TestCase):
         self.assertEqual(details["Name"], "Electronics")
         self.assertEqual(details["Description"], "Electronic gadgets and devices")
 
+    def test_category_name_is_interned(self):
+        """Test categories share one interned name string."""
+        other = Category("".join(["Electro", "nics"]), "Another description")
+        self.assertIs(self.category.name, other.name)
+        self.assertFalse(hasattr(self.category, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
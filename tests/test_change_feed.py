@@ -0,0 +1,77 @@
+import threading
+import unittest
+from src.category import Category
+from src.change_feed import ChangeFeed
+from src.inventory import InventoryManager
+from src.product import Product
+
+
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an inventory with a feed and one subscription."""
+        self.inventory = InventoryManager()
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.product1 = Product("Laptop", 1200, self.category, 5)
+        self.product2 = Product("Smartphone", 800, self.category, 8)
+        self.inventory.add_product(self.product1)
+        self.feed = ChangeFeed(self.inventory)
+        self.subscription = self.feed.subscribe()
+
+    def test_changes_arrive_in_sequence_order(self):
+        """Test each mutation is delivered once with increasing seq."""
+        self.inventory.add_product(self.product2)
+        self.product1.update_price(1100)
+        changes = self.subscription.poll()
+        self.assertEqual([c.op for c in changes], ["add", "update"])
+        self.assertEqual([c.seq for c in changes], [1, 2])
+        self.assertEqual(changes[1].fields, {"price"})
+        self.assertEqual(self.subscription.poll(), [])
+
+    def test_rapid_changes_to_one_sku_coalesce(self):
+        """Test bursts fold into one change per SKU."""
+        for _ in range(5):
+            self.product1.update_quantity(-1)
+        self.product1.update_name("Notebook")
+        self.inventory.add_product(self.product2)
+        self.product2.update_price(750)
+        self.inventory.add_product(Product("Tablet", 300, self.category, 1))
+        self.inventory.remove_product(self.product1.id)
+        changes = self.subscription.poll()
+        self.assertEqual([c.op for c in changes], ["add", "add", "remove"])
+        self.assertEqual(changes[0].product, self.product2)
+        self.assertEqual(changes[2].product, self.product1)
+        self.assertEqual(changes[-1].seq, self.feed.sequence)
+
+    def test_add_then_remove_cancels_out(self):
+        """Test a product added and removed between polls is not reported."""
+        self.inventory.add_product(self.product2)
+        self.inventory.remove_product(self.product2.id)
+        self.assertEqual(self.subscription.poll(), [])
+
+    def test_slow_subscriber_is_bounded_and_reset(self):
+        """Test a subscriber past max_pending gets a single reset."""
+        slow = self.feed.subscribe(max_pending=2)
+        self.inventory.add_products(
+            Product(f"Item {i}", 1, self.category, 1) for i in range(5)
+        )
+        self.assertEqual(len(slow), 1)
+        self.assertEqual([c.op for c in slow.poll()], ["reset"])
+        self.assertEqual(len(self.subscription.poll(max_items=3)), 3)
+        self.assertEqual(len(self.subscription), 2)
+
+    def test_wait_wakes_on_change_and_times_out(self):
+        """Test wait blocks until a change is published."""
+        self.assertEqual(self.subscription.wait(timeout=0.01), [])
+        timer = threading.Timer(0.05, self.product1.update_price, (10,))
+        timer.start()
+        changes = self.subscription.wait(timeout=5)
+        timer.join()
+        self.assertEqual([c.fields for c in changes], [{"price"}])
+        self.subscription.close()
+        self.product1.update_price(20)
+        self.assertEqual(self.subscription.poll(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from src import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATALOG = (
+    "id,name,price,category,quantity\n"
+    "00000000000000000000000000000001,Laptop,1200,Electronics,5\n"
+    "00000000000000000000000000000002,Smartphone,800,Electronics,0\n"
+    "00000000000000000000000000000003,Novel,15,Books,40\n"
+    ",,oops,Books,1\n"
+)
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an empty data directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.data = os.path.join(self.tmpdir.name, "data")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_cli(self, *argv, stdin=""):
+        """Runs the CLI in-process; returns ``(status, stdout, stderr)``."""
+        out, err = io.StringIO(), io.StringIO()
+        with mock.patch("sys.stdin", io.StringIO(stdin)):
+            with redirect_stdout(out), redirect_stderr(err):
+                status = cli.main(["--data", self.data, *argv])
+        return status, out.getvalue(), err.getvalue()
+
+    def python(self, *argv):
+        """Runs a fresh interpreter from the repository root."""
+        return subprocess.run(
+            [sys.executable, *argv],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+    def test_import_from_stdin_persists(self):
+        """Test piped rows are imported, bad rows reported and data kept."""
+        status, out, err = self.run_cli("import", "-", stdin=CATALOG)
+        self.assertEqual(status, 0)
+        self.assertIn("Imported=3, Rejected=1", out)
+        self.assertIn("line 5", err)
+        stats = json.loads(self.run_cli("stats")[1])
+        self.assertEqual(stats["products"], 3)
+        self.assertEqual(stats["units"], 45)
+        self.assertEqual(stats["categories"]["Books"]["units"], 40)
+
+    def test_query_streams_matches(self):
+        """Test query filters, orders and limits its JSON Lines output."""
+        self.run_cli("import", "-", stdin=CATALOG)
+        status, out, _ = self.run_cli(
+            "query", "--category", "Electronics", "--order-by", "price"
+        )
+        self.assertEqual(status, 0)
+        rows = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([row["name"] for row in rows], ["Smartphone", "Laptop"])
+        out = self.run_cli("query", "--in-stock", "--max-price", "100")[1]
+        rows = [json.loads(line) for line in out.splitlines()]
+        self.assertEqual([row["name"] for row in rows], ["Novel"])
+        self.assertEqual(self.run_cli("query", "--category", "Toys")[1], "")
+
+    def test_update_and_reprice(self):
+        """Test piped price and stock changes and a category reprice persist."""
+        self.run_cli("import", "-", stdin=CATALOG)
+        changes = (
+            "id,price,quantity_change\n"
+            "00000000000000000000000000000001,1000,\n"
+            "00000000000000000000000000000002,,1\n"
+            "00000000000000000000000000000003,,3\n"
+        )
+        status, out, _ = self.run_cli(
+            "update", "-", "--batch-size", "2", stdin=changes
+        )
+        self.assertEqual(status, 0)
+        self.assertIn("Applied 3 changes.", out)
+        out = self.run_cli("reprice", "2", "--category", "Books")[1]
+        self.assertIn("Repriced 1 products.", out)
+        products = {
+            row["name"]: row
+            for row in map(json.loads, self.run_cli("query")[1].splitlines())
+        }
+        self.assertEqual(products["Laptop"]["price"], 1000)
+        self.assertEqual(products["Novel"]["quantity"], 43)
+        self.assertEqual(products["Novel"]["price"], 30)
+
+    def test_failed_update_changes_nothing(self):
+        """Test an invalid row aborts the update without persisting earlier ones."""
+        self.run_cli("import", "-", stdin=CATALOG)
+        changes = (
+            "id,price,quantity_change\n"
+            "00000000000000000000000000000001,1,\n"
+            "00000000000000000000000000000003,,-100\n"
+        )
+        status, _, err = self.run_cli(
+            "update", "-", "--batch-size", "1", stdin=changes
+        )
+        self.assertEqual(status, 1)
+        self.assertIn("error:", err)
+        self.assertEqual(json.loads(self.run_cli("stats")[1])["value"], 6600)
+
+    def test_update_validates_rows_like_import(self):
+        """Test booleans, fractional changes and absolute quantities are refused."""
+        self.run_cli("import", "-", stdin=CATALOG)
+        sku = "00000000000000000000000000000001"
+        for row in (
+            {"id": sku, "price": True},
+            {"id": sku, "quantity_change": 2.9},
+            {"id": sku, "price": "nan"},
+            {"id": sku, "quantity": 5},
+        ):
+            status, out, err = self.run_cli(
+                "update", "-", "--format", "jsonl", stdin=json.dumps(row) + "\n"
+            )
+            self.assertEqual((status, out), (1, ""), row)
+            self.assertIn("line 1:", err)
+        self.assertEqual(json.loads(self.run_cli("stats")[1])["value"], 6600)
+
+    def test_read_only_commands_create_nothing(self):
+        """Test query and stats neither create nor modify the data directory."""
+        self.assertEqual(self.run_cli("stats")[0], 1)
+        self.assertFalse(os.path.exists(self.data))
+        self.run_cli("import", "-", stdin=CATALOG)
+        os.remove(os.path.join(self.data, "journal.log"))
+        before = sorted(os.listdir(self.data))
+        self.assertEqual(self.run_cli("query")[0], 0)
+        self.assertEqual(self.run_cli("stats")[0], 0)
+        self.assertEqual(sorted(os.listdir(self.data)), before)
+
+    def test_export_round_trip(self):
+        """Test an export can be imported into another data directory."""
+        self.run_cli("import", "-", stdin=CATALOG)
+        path = os.path.join(self.tmpdir.name, "catalog.jsonl")
+        self.assertEqual(self.run_cli("export", path)[0], 0)
+        self.data = os.path.join(self.tmpdir.name, "copy")
+        self.assertIn("Imported=3", self.run_cli("import", path)[1])
+
+    def test_help_imports_nothing_heavy(self):
+        """Test starting the CLI loads no inventory, I/O or GUI modules."""
+        loaded = self.python(
+            "-c",
+            "import sys; from src import cli; print(' '.join(sys.modules))",
+        ).split()
+        modules = [name for name in loaded if name.startswith("src.")]
+        self.assertEqual(modules, ["src.cli"])
+        for heavy in ("tkinter", "csv", "json", "threading", "concurrent"):
+            self.assertNotIn(heavy, loaded)
+
+    def test_startup_time(self):
+        """Test ``--help`` costs little more than starting the interpreter."""
+
+        def best(*argv):
+            timings = []
+            for _ in range(5):
+                start = time.perf_counter()
+                self.python(*argv)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        bare = best("-c", "pass")
+        startup = best("-m", "src.cli", "--help")
+        message = f"startup {startup:.3f}s, bare interpreter {bare:.3f}s"
+        self.assertLess(startup - bare, 0.25, message)
+
+
+if __name__ == "__main__":
+    unittest.main()
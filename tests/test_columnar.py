@@ -0,0 +1,94 @@
+import threading
+import unittest
+from unittest import mock
+from src import columnar
+from src.category import Category
+from src.columnar import ColumnarInventoryManager
+from src.product import Product
+
+
+class TestColumnarInventoryManager(unittest.TestCase):
+    """Runs every aggregate on the pure-Python array loops."""
+
+    numpy = None
+
+    def setUp(self):
+        """Set up a columnar inventory with products in two categories."""
+        patcher = mock.patch.object(columnar, "np", self.numpy)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.inventory = ColumnarInventoryManager()
+        self.electronics = Category("Electronics", "Electronic gadgets")
+        self.clothing = Category("Clothing", "Apparel")
+        self.laptop = Product("Laptop", 1000, self.electronics, 2)
+        self.phone = Product("Smartphone", 500, self.electronics, 4)
+        self.shirt = Product("T-Shirt", 20, self.clothing, 10)
+        for product in (self.laptop, self.phone, self.shirt):
+            self.inventory.add_product(product)
+
+    def test_total_value(self):
+        """Test total_value matches the object loop."""
+        expected = sum(p.price * p.quantity for p in self.inventory.get_all_products())
+        self.assertEqual(self.inventory.total_value(), expected)
+
+    def test_per_category_sums(self):
+        """Test value and unit sums per category."""
+        self.assertEqual(
+            self.inventory.value_by_category(),
+            {self.electronics: 4000, self.clothing: 200},
+        )
+        self.assertEqual(
+            self.inventory.units_by_category(),
+            {self.electronics: 6, self.clothing: 10},
+        )
+
+    def test_columns_follow_mutations(self):
+        """Test price, quantity and category changes reach the columns."""
+        self.laptop.update_price(1500)
+        self.phone.update_quantity(-4)
+        self.shirt.update_category(self.electronics)
+        self.assertEqual(self.inventory.value_by_category(), {self.electronics: 3200})
+        self.assertEqual(self.inventory.count_below(1), 1)
+
+    def test_removed_slots_are_reused(self):
+        """Test removal clears a slot and the next product reuses it."""
+        self.inventory.remove_product(self.shirt.id)
+        self.assertEqual(self.inventory.total_value(), 4000)
+        self.assertEqual(self.inventory.count_below(100), 2)
+        self.inventory.add_product(Product("Jeans", 50, self.clothing, 1))
+        self.assertEqual(len(self.inventory._live_col), 3)
+        self.assertEqual(self.inventory.units_by_category()[self.clothing], 1)
+
+    def test_columns_follow_bulk_updates(self):
+        """Test bulk price and stock changes reach the columns."""
+        self.inventory.reprice(2, category=self.clothing)
+        self.inventory.bulk_update(quantities={self.laptop.id: 3})
+        self.assertEqual(
+            self.inventory.value_by_category(),
+            {self.electronics: 7000, self.clothing: 400},
+        )
+
+    def test_aggregates_wait_for_writers(self):
+        """Test aggregates hold the index lock so columns never resize under them."""
+        totals = []
+        with self.inventory._index_lock:
+            reader = threading.Thread(
+                target=lambda: totals.append(self.inventory.total_value())
+            )
+            reader.start()
+            reader.join(0.05)
+            self.assertTrue(reader.is_alive())
+            self.inventory.add_product(Product("Jeans", 50, self.clothing, 1))
+        reader.join()
+        self.assertEqual(totals, [4250])
+
+
+@unittest.skipUnless(columnar.np, "NumPy is not installed.")
+class TestColumnarInventoryManagerNumPy(TestColumnarInventoryManager):
+    """Runs every aggregate on the vectorized NumPy path."""
+
+    numpy = columnar.np
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import uuid
 from src.product import Product
 from src.category import Category
 from src.product_factory import ProductFactory
@@ -29,6 +30,22 @@ class TestProductFactory(unittest.TestCase):
         with self.assertRaises(ValueError):
             ProductFactory.create_product("Headphones", 150, self.category, -2)
 
+    def test_create_products_batch(self):
+        """Test batch creation returns valid products with unique SKUs."""
+        products = ProductFactory.create_products(
+            [("Phone", 700, self.category, 10), ("Tablet", 300, self.category, 4)]
+        )
+        self.assertEqual([p.name for p in products], ["Phone", "Tablet"])
+        self.assertNotEqual(products[0].id, products[1].id)
+        self.assertEqual(uuid.UUID(products[0].id).version, 4)
+
+    def test_create_products_rejects_whole_batch(self):
+        """Test one invalid row rejects the batch and names the row."""
+        with self.assertRaisesRegex(ValueError, "Row 1"):
+            ProductFactory.create_products(
+                [("Phone", 700, self.category, 10), ("Tablet", -1, self.category, 4)]
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
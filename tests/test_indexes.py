@@ -0,0 +1,119 @@
+import unittest
+from src.indexes import NameIndex, PriceIndex, StockTotals, StockWatch
+
+
+class TestPriceIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a price index with a few entries."""
+        self.index = PriceIndex()
+        for price, sku in [(19.99, "b"), (5, "a"), (50, "c"), (19.99, "d")]:
+            self.index.add(price, sku)
+
+    def test_range_is_inclusive_and_sorted(self):
+        """Test range returns SKUs within the bounds in price order."""
+        self.assertEqual(self.index.range(5, 19.99), ["a", "b", "d"])
+        self.assertEqual(self.index.range(20, 49), [])
+
+    def test_lowest_and_highest(self):
+        """Test top-N queries from both ends of the index."""
+        self.assertEqual(self.index.lowest(2), ["a", "b"])
+        self.assertEqual(self.index.highest(2), ["c", "d"])
+        self.assertEqual(self.index.highest(0), [])
+
+    def test_replace_moves_many_entries(self):
+        """Test replace re-files several SKUs in one step."""
+        self.index.replace({"a", "c"}, [(30, "a"), (1, "c")])
+        self.assertEqual(self.index.lowest(4), ["c", "b", "d", "a"])
+
+    def test_remove(self):
+        """Test removing entries, including a missing one."""
+        self.index.remove(19.99, "b")
+        self.assertEqual(len(self.index), 3)
+        with self.assertRaises(KeyError):
+            self.index.remove(19.99, "b")
+
+
+class TestStockWatch(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a stock watch with a few SKUs."""
+        self.watch = StockWatch()
+        for sku, quantity in [("a", 10), ("b", 2), ("c", 7), ("d", 0)]:
+            self.watch.update(sku, quantity)
+
+    def test_below_threshold(self):
+        """Test below returns SKUs under the threshold, lowest first."""
+        self.assertEqual(self.watch.below(8), ["d", "b", "c"])
+        self.assertEqual(self.watch.below(0), [])
+
+    def test_updates_supersede_old_entries(self):
+        """Test stale heap entries are ignored after an update or discard."""
+        self.watch.update("b", 20)
+        self.watch.discard("d")
+        self.assertEqual(self.watch.below(8), ["c"])
+        self.assertEqual(self.watch.lowest(2), ["c", "a"])
+        self.assertEqual(len(self.watch), 3)
+
+    def test_compaction_keeps_live_entries(self):
+        """Test many updates to one SKU do not lose other SKUs."""
+        for quantity in range(500):
+            self.watch.update("a", quantity)
+        self.assertLess(len(self.watch._heap), 500)
+        self.assertEqual(self.watch.lowest(4), ["d", "b", "c", "a"])
+
+    def test_update_many(self):
+        """Test a batch of updates supersedes the old entries."""
+        self.watch.update_many([("a", 1), ("d", 5)])
+        self.assertEqual(self.watch.below(6), ["a", "b", "d"])
+
+
+class TestNameIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a name index with a few product names."""
+        self.index = NameIndex()
+        self.index.add("a", "Apple iPhone 15")
+        self.index.add("b", "Apple Watch")
+        self.index.add("c", "Pineapple Slicer")
+
+    def test_exact_words_rank_above_prefixes(self):
+        """Test whole-word matches outrank prefix matches."""
+        self.index.add("d", "Applesauce")
+        self.assertEqual(self.index.search("apple", 10)[:2], ["a", "b"])
+        self.assertEqual(self.index.search("apple", 10)[2], "d")
+        self.assertNotIn("c", self.index.search("apple", 10))
+
+    def test_more_matched_words_rank_first(self):
+        """Test products matching every query word come first."""
+        self.assertEqual(self.index.search("app wat", 10), ["b", "a"])
+        self.assertEqual(self.index.search("app wat", 1), ["b"])
+
+    def test_remove(self):
+        """Test removed names stop matching and unused tokens are dropped."""
+        self.index.remove("c", "Pineapple Slicer")
+        self.assertEqual(self.index.search("slicer", 10), [])
+        self.assertNotIn("slicer", self.index._tokens)
+
+
+class TestStockTotals(unittest.TestCase):
+
+    def test_deltas_keep_totals_exact(self):
+        """Test totals after a sequence of changes match a recount."""
+        totals = StockTotals()
+        totals.add("a", 2.5, 4)
+        totals.add("b", 10, 0)
+        totals.restock("a", 2.5, 4, 1)
+        totals.reprice("b", 0, 10, 12)
+        self.assertEqual(
+            totals.overall(),
+            {"products": 2, "units": 1, "value": 2.5, "out_of_stock": 1},
+        )
+        totals.remove("a", 2.5, 1)
+        self.assertEqual(list(totals.by_category()), ["b"])
+        totals.remove("b", 12, 0)
+        self.assertEqual(totals.overall()["value"], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
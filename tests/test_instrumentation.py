@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from src import instrumentation
+from src.category import Category
+from src.instrumentation import MetricsRegistry, SamplingProfiler
+from src.inventory import InventoryManager
+from src.product import Product
+from src.product_factory import ProductFactory
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an inventory and a fresh registry."""
+        self.inventory = InventoryManager()
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.registry = MetricsRegistry()
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_disabled_leaves_methods_untouched(self):
+        """Test enable wraps methods in place and disable restores them."""
+        original = InventoryManager.__dict__["add_product"]
+        instrumentation.enable(self.registry)
+        self.assertTrue(instrumentation.is_enabled())
+        self.assertIsNot(InventoryManager.__dict__["add_product"], original)
+        instrumentation.disable()
+        self.assertIs(InventoryManager.__dict__["add_product"], original)
+        self.assertFalse(instrumentation.is_enabled())
+
+    def test_counts_latencies_and_errors(self):
+        """Test calls across manager, factory and product are recorded."""
+        instrumentation.enable(self.registry)
+        product = ProductFactory.create_product("Laptop", 1200, self.category, 5)
+        self.inventory.add_product(product)
+        product.update_quantity(-1)
+        with self.assertRaises(ValueError):
+            self.inventory.remove_product("missing")
+        snapshot = self.registry.snapshot()
+        self.assertEqual(snapshot["factory.create_product"]["count"], 1)
+        self.assertEqual(snapshot["product.update_quantity"]["count"], 1)
+        self.assertEqual(snapshot["inventory.remove_product"]["errors"], 1)
+        self.assertEqual(snapshot["inventory.add_product"]["buckets"][-1], ["+Inf", 1])
+
+    def test_stock_location_operations_are_recorded(self):
+        """Test per-location stock moves are timed on manager and product."""
+        product = Product("Laptop", 1200, self.category, 5)
+        self.inventory.add_product(product)
+        instrumentation.enable(self.registry)
+        product.update_stock("Berlin", 2)
+        self.inventory.transfer_stock(product.id, "Berlin", "Paris", 1)
+        snapshot = self.registry.snapshot()
+        self.assertEqual(snapshot["product.update_stock"]["count"], 1)
+        self.assertEqual(snapshot["inventory.transfer_stock"]["count"], 1)
+        self.assertEqual(snapshot["product.transfer_stock"]["count"], 1)
+
+    def test_exports(self):
+        """Test JSON and Prometheus exports to files."""
+        self.registry.record("inventory.add_product", 3e-6)
+        self.registry.record("inventory.add_product", 5e-3, failed=True)
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "metrics.json")
+            prom_path = os.path.join(directory, "metrics.prom")
+            self.registry.export(json_path)
+            self.registry.export(prom_path)
+            with open(json_path, encoding="utf-8") as handle:
+                figures = json.load(handle)["inventory.add_product"]
+            with open(prom_path, encoding="utf-8") as handle:
+                text = handle.read()
+        self.assertEqual(figures["count"], 2)
+        self.assertEqual(figures["p50"], 4e-6)
+        self.assertIn(
+            'inventory_operation_seconds_count{operation="inventory.add_product"} 2',
+            text,
+        )
+        self.assertIn(
+            'inventory_operation_errors_total{operation="inventory.add_product"} 1',
+            text,
+        )
+        with self.assertRaises(ValueError):
+            self.registry.export(json_path, fmt="xml")
+
+    def test_profiler_samples_instrumented_calls(self):
+        """Test the sampling profiler records stacks of slow operations."""
+        profiler = SamplingProfiler(interval=0.001)
+        instrumentation.enable(self.registry, profiler)
+        product = Product("Laptop", 1200, self.category, 5)
+        self.inventory.add_product(product)
+        self.inventory.add_listener(self)
+        self.inventory.add_product(Product("Phone", 800, self.category, 5))
+        instrumentation.disable()
+        stacks = [stack for stack, _ in profiler.hottest(50)]
+        self.assertTrue(any("inventory_changed" in stack for stack in stacks))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.txt")
+            profiler.dump(path)
+            with open(path, encoding="utf-8") as handle:
+                self.assertTrue(handle.readline().rstrip().split()[-1].isdigit())
+
+    def inventory_changed(self, event, product, old_value):
+        """Listener that makes an add slow enough to be sampled."""
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,7 @@
+import math
+import random
+import sys
+import threading
 import unittest
 from src.product import Product
 from src.category import Category
@@ -40,6 +44,12 @@ class TestInventoryManager(unittest.TestCase):
         self.inventory.add_product(self.product1)
         retrieved_product = self.inventory.get_product_by_id(self.product1.id)
         self.assertEqual(retrieved_product.name, "Laptop")
+        self.assertIs(
+            self.inventory.get_product_by_id(self.product1.sku_bytes), self.product1
+        )
+        self.assertIsNone(self.inventory.get_product_by_id("missing"))
+        self.assertIn(self.product1.id, self.inventory)
+        self.assertNotIn(self.product2.id, self.inventory)
 
     def test_get_products_by_category(self):
         """Test retrieving products by category."""
@@ -48,6 +58,294 @@ class TestInventoryManager(unittest.TestCase):
         products = self.inventory.get_products_by_category(self.category)
         self.assertEqual(len(products), 2)
 
+    def test_category_index_tracks_removal(self):
+        """Test removed products disappear from category lookups."""
+        self.inventory.add_product(self.product1)
+        self.inventory.add_product(self.product2)
+        self.inventory.remove_product(self.product1.id)
+        products = self.inventory.get_products_by_category(self.category)
+        self.assertEqual(products, [self.product2])
+
+    def test_category_index_follows_update_category(self):
+        """Test Product.update_category moves the product between buckets."""
+        clothing = Category("Clothing", "Apparel")
+        self.inventory.add_product(self.product1)
+        self.product1.update_category(clothing)
+        self.assertEqual(self.inventory.get_products_by_category(self.category), [])
+        self.assertEqual(
+            self.inventory.get_products_by_category(clothing), [self.product1]
+        )
+
+    def test_reindex_product_after_direct_assignment(self):
+        """Test reindex_product re-files a product whose category was assigned."""
+        clothing = Category("Clothing", "Apparel")
+        self.inventory.add_product(self.product1)
+        self.product1.category = clothing
+        self.inventory.reindex_product(self.product1.id)
+        self.assertEqual(self.inventory.get_products_by_category(self.category), [])
+        self.assertEqual(
+            self.inventory.get_products_by_category(clothing), [self.product1]
+        )
+
+    def test_get_products_by_price_range(self):
+        """Test price range lookups follow Product.update_price."""
+        self.inventory.add_product(self.product1)
+        self.inventory.add_product(self.product2)
+        self.assertEqual(
+            self.inventory.get_products_by_price_range(700, 900), [self.product2]
+        )
+        self.product1.update_price(750)
+        self.assertEqual(
+            self.inventory.get_products_by_price_range(700, 900),
+            [self.product1, self.product2],
+        )
+
+    def test_top_n_by_price(self):
+        """Test top-N queries globally and within a category."""
+        clothing = Category("Clothing", "Apparel")
+        shirt = Product("T-Shirt", 20, clothing, 50)
+        for product in (self.product1, self.product2, shirt):
+            self.inventory.add_product(product)
+        self.assertEqual(self.inventory.top_n_by_price(1), [self.product1])
+        self.assertEqual(
+            self.inventory.top_n_by_price(2, descending=False),
+            [shirt, self.product2],
+        )
+        self.assertEqual(
+            self.inventory.top_n_by_price(5, category=clothing), [shirt]
+        )
+        self.product1.update_category(clothing)
+        self.assertEqual(
+            self.inventory.top_n_by_price(1, category=clothing), [self.product1]
+        )
+
+    def test_low_stock_follows_update_quantity(self):
+        """Test low-stock queries reflect Product.update_quantity."""
+        self.inventory.add_product(self.product1)
+        self.inventory.add_product(self.product2)
+        self.assertEqual(self.inventory.get_low_stock(6), [self.product1])
+        self.product2.update_quantity(-6)
+        self.assertEqual(
+            self.inventory.get_low_stock(6), [self.product2, self.product1]
+        )
+        self.assertEqual(self.inventory.next_to_run_out(1), [self.product2])
+        self.inventory.remove_product(self.product2.id)
+        self.assertEqual(self.inventory.next_to_run_out(5), [self.product1])
+
+    def test_add_products_batch(self):
+        """Test batch insertion fills every index."""
+        self.inventory.add_products([self.product1, self.product2])
+        self.assertEqual(
+            self.inventory.get_products_by_category(self.category),
+            [self.product1, self.product2],
+        )
+        self.assertEqual(self.inventory.top_n_by_price(1), [self.product1])
+        self.product2.update_quantity(-8)
+        self.assertEqual(self.inventory.next_to_run_out(1), [self.product2])
+
+    def test_add_products_is_all_or_nothing(self):
+        """Test a duplicate SKU rejects the whole batch."""
+        self.inventory.add_product(self.product1)
+        with self.assertRaises(ValueError):
+            self.inventory.add_products([self.product2, self.product1])
+        with self.assertRaises(ValueError):
+            self.inventory.add_products([self.product2, self.product2])
+        self.assertEqual(self.inventory.get_all_products(), [self.product1])
+
+    def test_checkout_applies_whole_basket(self):
+        """Test a valid basket updates every line."""
+        self.inventory.add_products([self.product1, self.product2])
+        self.inventory.checkout(
+            {self.product1.id: -2, self.product2.id: -8}
+        )
+        self.assertEqual((self.product1.quantity, self.product2.quantity), (3, 0))
+        self.assertEqual(self.inventory.next_to_run_out(1), [self.product2])
+
+    def test_checkout_is_all_or_nothing(self):
+        """Test one failing line leaves every quantity untouched."""
+        self.inventory.add_products([self.product1, self.product2])
+        with self.assertRaises(ValueError):
+            self.inventory.checkout(
+                [(self.product1.id, -2), (self.product2.id, -5), (self.product2.id, -4)]
+            )
+        with self.assertRaises(ValueError):
+            self.inventory.checkout([(self.product1.id, -1), ("invalid_sku", -1)])
+        self.assertEqual((self.product1.quantity, self.product2.quantity), (5, 8))
+
+    def test_concurrent_checkouts_do_not_deadlock_or_oversell(self):
+        """Test threads locking the same SKUs in opposite orders."""
+        self.product1.update_quantity(995)
+        self.inventory.add_products([self.product1, self.product2])
+        self.product2.update_quantity(992)
+        failures = []
+
+        def worker(index):
+            first, second = (self.product1, self.product2)[:: 1 if index % 2 else -1]
+            for _ in range(150):
+                try:
+                    self.inventory.checkout([(first.id, -1), (second.id, -1)])
+                except ValueError:
+                    failures.append(index)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual((self.product1.quantity, self.product2.quantity), (0, 0))
+        self.assertEqual(len(failures), 8 * 150 - 1000)
+
+    def test_search_by_name_follows_renames(self):
+        """Test name search tracks add, rename and remove."""
+        self.inventory.add_products([self.product1, self.product2])
+        self.assertEqual(self.inventory.search_by_name("lap"), [self.product1])
+        self.product1.update_name("Gaming Notebook")
+        self.assertEqual(self.inventory.search_by_name("lap"), [])
+        self.assertEqual(self.inventory.search_by_name("notebook"), [self.product1])
+        self.inventory.remove_product(self.product1.id)
+        self.assertEqual(self.inventory.search_by_name("notebook"), [])
+
+    def test_stats_follow_every_mutation(self):
+        """Test stats totals track adds, removes and product changes."""
+        clothing = Category("Clothing", "Apparel")
+        self.inventory.add_products([self.product1, self.product2])
+        stats = self.inventory.stats()
+        self.assertEqual((stats["products"], stats["units"]), (2, 13))
+        self.assertAlmostEqual(stats["value"], 1200 * 5 + 800 * 8)
+        self.product1.update_price(1000)
+        self.product2.update_quantity(-8)
+        self.product1.update_category(clothing)
+        stats = self.inventory.stats()
+        self.assertAlmostEqual(stats["value"], 1000 * 5)
+        self.assertEqual(stats["out_of_stock"], 1)
+        self.assertEqual(stats["categories"][clothing]["units"], 5)
+        self.assertEqual(stats["categories"][self.category]["out_of_stock"], 1)
+        self.inventory.remove_product(self.product2.id)
+        self.assertNotIn(self.category, self.inventory.stats()["categories"])
+
+    def test_bulk_update_keeps_indexes_consistent(self):
+        """Test a bulk update lands in every index and notifies listeners."""
+        events = []
+
+        class Recorder:
+            def inventory_changed(self, event, product, old_value):
+                events.append((event, product.name, old_value))
+
+        self.inventory.add_products([self.product1, self.product2])
+        self.inventory.add_listener(Recorder())
+        applied = self.inventory.bulk_update(
+            prices={self.product1.id: 700},
+            quantities=[(self.product2.id, -5), (self.product2.id, -3)],
+        )
+        self.assertEqual(applied, 2)
+        self.assertEqual(
+            self.inventory.get_products_by_price_range(650, 750), [self.product1]
+        )
+        self.assertEqual(self.inventory.next_to_run_out(1), [self.product2])
+        self.assertAlmostEqual(self.inventory.stats()["value"], 700 * 5)
+        self.assertEqual(
+            events, [("price", "Laptop", 1200), ("quantity", "Smartphone", 8)]
+        )
+
+    def test_bulk_update_is_all_or_nothing(self):
+        """Test one bad row leaves every product untouched."""
+        self.inventory.add_products([self.product1, self.product2])
+        for prices, quantities in (
+            ({self.product1.id: 1}, {self.product2.id: -9}),
+            ({self.product1.id: 1, self.product2.id: -1}, None),
+            ({self.product1.id: 1, "invalid_sku": 2}, None),
+            ({self.product1.id: math.nan}, None),
+            ({self.product1.id: math.inf}, None),
+        ):
+            with self.assertRaises(ValueError):
+                self.inventory.bulk_update(prices, quantities)
+        self.assertEqual((self.product1.price, self.product2.quantity), (1200, 8))
+        self.assertEqual(self.inventory.stats()["value"], 1200 * 5 + 800 * 8)
+
+    def test_concurrent_price_updates_keep_indexes_exact(self):
+        """Test racing price, name, category and bulk updates on shared SKUs."""
+        clothing = Category("Clothing", "Apparel")
+        self.inventory.add_products([self.product1, self.product2])
+        products = [self.product1, self.product2]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def worker(seed):
+            rng = random.Random(seed)
+            for step in range(300):
+                product = rng.choice(products)
+                action = step % 4
+                if action == 0:
+                    product.update_price(rng.choice((10, 20, 30, 45)))
+                elif action == 1:
+                    product.update_category(rng.choice((self.category, clothing)))
+                elif action == 2:
+                    product.update_name(rng.choice(("Alpha", "Beta one")))
+                else:
+                    self.inventory.reprice(1, category=product.category)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = self.inventory.stats()
+        self.assertEqual(stats["value"], sum(p.price * p.quantity for p in products))
+        self.assertCountEqual(
+            self.inventory.get_products_by_price_range(0, 100), products
+        )
+        for category in (self.category, clothing):
+            members = [p for p in products if p.category is category]
+            self.assertCountEqual(
+                self.inventory.get_products_by_category(category), members
+            )
+            self.assertCountEqual(
+                self.inventory.top_n_by_price(5, category=category), members
+            )
+        for product in products:
+            self.assertEqual(
+                self.inventory.search_by_name(product.name.split()[0]).count(product),
+                1,
+            )
+
+    def test_reprice_category_by_factor(self):
+        """Test reprice applies a percentage rule to one category."""
+        clothing = Category("Clothing", "Apparel")
+        shirt = Product("T-Shirt", 19.99, clothing, 50)
+        self.inventory.add_products([self.product1, shirt])
+        self.assertEqual(self.inventory.reprice(1.05, category=clothing), 1)
+        self.assertEqual((shirt.price, self.product1.price), (20.99, 1200))
+        self.assertEqual(self.inventory.top_n_by_price(1, category=clothing), [shirt])
+        for factor in (-1, math.nan, math.inf):
+            with self.assertRaises(ValueError):
+                self.inventory.reprice(factor)
+
+    def test_location_totals_and_nearest_location(self):
+        """Test running per-location totals, transfers and nearest lookup."""
+        self.inventory.add_location("Berlin", 52.52, 13.40)
+        self.inventory.add_location("Paris", 48.86, 2.35)
+        self.product1.update_stock("Berlin", 3)
+        self.inventory.add_products([self.product1, self.product2])
+        self.product2.update_stock("Paris", 10)
+        self.inventory.transfer_stock(self.product1.id, "Berlin", "Paris", 2)
+        self.assertEqual(self.inventory.units_by_location(), {"Berlin": 1, "Paris": 12})
+        self.assertEqual(self.inventory.stats()["units"], 5 + 3 + 8 + 10)
+        frankfurt = (50.11, 8.68)
+        location, distance = self.inventory.nearest_location(
+            self.product1.id, 1, *frankfurt
+        )
+        self.assertEqual(location, "Berlin")
+        self.assertAlmostEqual(distance, 424, delta=5)
+        self.assertEqual(
+            self.inventory.nearest_location(self.product1.id, 2, *frankfurt)[0],
+            "Paris",
+        )
+        self.assertIsNone(self.inventory.nearest_location(self.product1.id, 9, 0, 0))
+        self.inventory.remove_product(self.product2.id)
+        self.assertEqual(self.inventory.units_at("Paris"), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
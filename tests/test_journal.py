@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+from src.category import Category
+from src.inventory import InventoryManager
+from src.journal import Journal
+from src.product import Product
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a journaled inventory in a scratch directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.inventory = InventoryManager()
+        self.journal = Journal(self.tmpdir.name, snapshot_interval=5)
+        self.journal.attach(self.inventory)
+
+    def tearDown(self):
+        self.journal.detach()
+        self.tmpdir.cleanup()
+
+    def recover(self):
+        """Recovers a fresh inventory from the journal directory."""
+        self.journal.detach()
+        self.journal = Journal(self.tmpdir.name, snapshot_interval=5)
+        return self.journal.recover()
+
+    def details(self, inventory):
+        return sorted(
+            (p.get_details() for p in inventory.get_all_products()),
+            key=lambda d: d["ID"],
+        )
+
+    def test_recover_replays_log(self):
+        """Test adds and updates are replayed from the log alone."""
+        laptop = Product("Laptop", 1200, self.category, 5)
+        phone = Product("Smartphone", 800, self.category, 8)
+        self.inventory.add_product(laptop)
+        self.inventory.add_product(phone)
+        laptop.update_price(999.5)
+        laptop.update_quantity(-2)
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir.name, "snapshot.bin")))
+
+        recovered = self.recover()
+        self.assertEqual(self.details(recovered), self.details(self.inventory))
+
+    def test_snapshot_bounds_log_replay(self):
+        """Test a snapshot is taken every interval and the log is truncated."""
+        products = [Product(f"Item {i}", i, self.category, i) for i in range(7)]
+        for product in products:
+            self.inventory.add_product(product)
+        products[0].update_category(Category("Clothing", "Apparel"))
+        self.inventory.remove_product(products[1].id)
+        with open(os.path.join(self.tmpdir.name, "journal.log")) as log:
+            self.assertEqual(len(log.readlines()), 4)
+
+        recovered = self.recover()
+        self.assertEqual(self.details(recovered), self.details(self.inventory))
+        clothing = recovered.get_product_by_id(products[0].id).category
+        self.assertEqual(clothing.description, "Apparel")
+
+    def test_batches_larger_than_the_snapshot_interval(self):
+        """Test a snapshot never lands in the middle of a logged batch."""
+        self.inventory.add_products(
+            Product(f"Item {i}", i, self.category, i) for i in range(12)
+        )
+        self.inventory.bulk_update(
+            quantities={p.id: 1 for p in self.inventory.get_all_products()}
+        )
+        self.inventory.add_products(
+            Product(f"Extra {i}", i, self.category, i) for i in range(3)
+        )
+        self.assertEqual(self.details(self.recover()), self.details(self.inventory))
+
+    def test_torn_final_record_is_ignored(self):
+        """Test a partially written last line does not break recovery."""
+        self.inventory.add_product(Product("Laptop", 1200, self.category, 5))
+        with open(os.path.join(self.tmpdir.name, "journal.log"), "a") as log:
+            log.write('{"seq": 2, "op": "qua')
+        recovered = self.recover()
+        self.assertEqual(len(recovered.get_all_products()), 1)
+
+    def test_records_after_torn_tail_survive(self):
+        """Test writes made after recovering from a torn tail are kept."""
+        self.inventory.add_product(Product("Laptop", 1200, self.category, 5))
+        self.journal.snapshot()
+        with open(os.path.join(self.tmpdir.name, "journal.log"), "a") as log:
+            log.write('{"seq": 2, "op": "qua')
+        recovered = self.recover()
+        recovered.add_product(Product("Smartphone", 800, self.category, 8))
+        recovered.add_product(Product("Tablet", 300, self.category, 2))
+        expected = self.details(recovered)
+        self.assertEqual(len(expected), 3)
+        self.assertEqual(self.details(self.recover()), expected)
+
+    def test_load_leaves_files_untouched(self):
+        """Test a read-only load neither repairs the log nor creates files."""
+        self.inventory.add_product(Product("Laptop", 1200, self.category, 5))
+        log_path = os.path.join(self.tmpdir.name, "journal.log")
+        with open(log_path, "a") as log:
+            log.write('{"seq": 2, "op": "qua')
+        size = os.path.getsize(log_path)
+        loaded = Journal(self.tmpdir.name).load()
+        self.assertEqual(len(loaded.get_all_products()), 1)
+        self.assertEqual(os.path.getsize(log_path), size)
+        missing = os.path.join(self.tmpdir.name, "missing")
+        self.assertEqual(len(Journal(missing).load().get_all_products()), 0)
+        self.assertFalse(os.path.exists(missing))
+
+    def test_recover_restores_stock_locations(self):
+        """Test per-location stock survives the log and a snapshot."""
+        laptop = Product("Laptop", 1200, self.category, 5)
+        laptop.update_stock("Berlin", 2)
+        self.inventory.add_product(laptop)
+        laptop.transfer_stock(None, "Paris", 3)
+        laptop.transfer_stock("Berlin", "Paris", 1)
+        recovered = self.recover().get_product_by_id(laptop.id)
+        self.assertEqual(recovered.stock_by_location(), {"Berlin": 1, "Paris": 4})
+        self.assertEqual(recovered.quantity, 7)
+
+        self.journal.snapshot()
+        recovered = self.recover().get_product_by_id(laptop.id)
+        self.assertEqual(recovered.stock_by_location(), {"Berlin": 1, "Paris": 4})
+        self.assertEqual(recovered.unassigned_quantity, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from src.product import Product
+import uuid
+from src.product import Product, sku_bytes
 from src.category import Category
 
 
@@ -37,12 +38,73 @@ class TestProduct(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.product.update_quantity(-15)
 
+    def test_product_category_update(self):
+        """Test moving a product to another category."""
+        clothing = Category("Clothing", "Apparel and fashion")
+        self.product.update_category(clothing)
+        self.assertIs(self.product.category, clothing)
+
+    def test_product_category_update_invalid(self):
+        """Test update_category with a non-Category should raise TypeError."""
+        with self.assertRaises(TypeError):
+            self.product.update_category("Clothing")
+
+    def test_product_name_update(self):
+        """Test renaming a product, including to an empty name."""
+        self.product.update_name("Notebook")
+        self.assertEqual(self.product.name, "Notebook")
+        with self.assertRaises(ValueError):
+            self.product.update_name("  ")
+
     def test_product_details(self):
         """Test if get_details returns correct information."""
         details = self.product.get_details()
         self.assertEqual(details["Name"], "Laptop")
         self.assertEqual(details["Category"], "Electronics")
 
+    def test_product_id_renders_compact_sku(self):
+        """Test the id string round-trips through the 16-byte SKU."""
+        self.assertEqual(str(uuid.UUID(self.product.id)), self.product.id)
+        self.assertEqual(len(self.product.sku_bytes), 16)
+        self.assertEqual(sku_bytes(self.product.id), self.product.sku_bytes)
+        self.assertEqual(self.product.get_details()["ID"], self.product.id)
+
+    def test_sku_bytes_accepts_uuid_forms(self):
+        """Test plain, braced and URN SKU strings parse; others do not."""
+        raw = self.product.sku_bytes
+        for text in (self.product.id, "{%s}" % self.product.id, raw.hex()):
+            self.assertEqual(sku_bytes(text), raw)
+        self.assertEqual(sku_bytes(f"urn:uuid:{self.product.id}"), raw)
+        for bad in ("not-a-sku", raw.hex()[:-2], raw[:8], None, 42):
+            self.assertIsNone(sku_bytes(bad))
+
+    def test_product_with_existing_sku(self):
+        """Test constructing a product with a given SKU, valid or not."""
+        sku = str(uuid.uuid4())
+        product = Product("Mouse", 25, self.category, 3, sku=sku)
+        self.assertEqual(product.id, sku)
+        with self.assertRaises(ValueError):
+            Product("Mouse", 25, self.category, 3, sku="not-a-sku")
+
+    def test_product_has_no_instance_dict(self):
+        """Test products are slots-based."""
+        self.assertFalse(hasattr(self.product, "__dict__"))
+
+    def test_stock_by_location(self):
+        """Test per-location stock keeps the total and unassigned stock."""
+        self.product.update_stock("Berlin", 5)
+        self.product.transfer_stock(None, "Paris", 4)
+        self.assertEqual(self.product.quantity, 15)
+        self.assertEqual(self.product.stock_by_location(), {"Berlin": 5, "Paris": 4})
+        self.assertEqual(self.product.unassigned_quantity, 6)
+        with self.assertRaises(ValueError):
+            self.product.update_quantity(-7)  # Only 6 units are unassigned.
+        with self.assertRaises(ValueError):
+            self.product.transfer_stock("Berlin", "Paris", 6)
+        self.product.transfer_stock("Berlin", "Paris", 5)
+        self.assertEqual(self.product.stock_by_location(), {"Paris": 9})
+        self.assertEqual(self.product.stock_at("Berlin"), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,133 @@
+import threading
+import tkinter as tk
+import unittest
+from unittest import mock
+from src.category import Category
+from src.change_feed import ChangeFeed
+from src.inventory import InventoryManager
+from src.product import Product
+from src.product_list import ProductListModel, ProductListView
+
+
+class TestProductListModel(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an inventory, a feed and a model listing everything."""
+        self.inventory = InventoryManager()
+        self.electronics = Category("Electronics", "Electronic gadgets")
+        self.clothing = Category("Clothing", "Apparel")
+        self.products = [
+            Product(f"Item {i}", i, self.electronics if i % 2 else self.clothing, i)
+            for i in range(50)
+        ]
+        self.inventory.add_products(self.products)
+        self.subscription = ChangeFeed(self.inventory).subscribe()
+        self.model = ProductListModel(self.inventory)
+
+    def test_rows_formats_only_the_window(self):
+        """Test rows returns the requested slice as column values."""
+        rows = self.model.rows(10, 3)
+        self.assertEqual(
+            [sku for sku, _ in rows],
+            [product.sku_bytes for product in self.products[10:13]],
+        )
+        self.assertEqual(rows[0][1][1:], ("Item 10", "$10", "Clothing", 10))
+        self.assertEqual(self.model.rows(49, 10)[0][1][1], "Item 49")
+
+    def test_apply_adds_and_removes_single_rows(self):
+        """Test feed batches append new products and drop removed ones."""
+        extra = Product("Extra", 1, self.clothing, 1)
+        self.inventory.add_product(extra)
+        self.inventory.remove_product(self.products[0].id)
+        self.products[1].update_price(99)
+        self.assertTrue(self.model.apply(self.subscription.poll()))
+        self.assertEqual(len(self.model), 50)
+        self.assertEqual(self.model.sku_at(0), self.products[1].sku_bytes)
+        self.assertEqual(self.model.sku_at(49), extra.sku_bytes)
+        self.assertFalse(self.model.apply(self.subscription.poll()))
+
+    def test_filter_follows_changes(self):
+        """Test products move in and out of a filtered list as they change."""
+        self.model.show(predicate=lambda product: product.category is self.clothing)
+        self.assertEqual(len(self.model), 25)
+        self.products[1].update_category(self.clothing)
+        self.products[0].update_category(self.electronics)
+        self.inventory.add_product(Product("Gadget", 5, self.electronics, 1))
+        self.model.apply(self.subscription.poll())
+        self.assertEqual(len(self.model), 25)
+        self.assertEqual(self.model.sku_at(24), self.products[1].sku_bytes)
+
+    def test_bulk_removal_and_reset(self):
+        """Test large removal batches and feed resets rebuild the list."""
+        for product in self.products[:30]:
+            self.inventory.remove_product(product.id)
+        self.model.apply(self.subscription.poll())
+        self.assertEqual(self.model.sku_at(0), self.products[30].sku_bytes)
+        slow = ChangeFeed(self.inventory).subscribe(max_pending=1)
+        self.inventory.add_products(self.products[:2])
+        self.model.apply(slow.poll())
+        self.assertEqual(len(self.model), 22)
+
+    def test_reload_copies_under_the_index_lock(self):
+        """Test a reset reload waits for writers instead of racing them."""
+        reloaded = threading.Event()
+
+        def reload():
+            self.model.reload()
+            reloaded.set()
+
+        with self.inventory._index_lock:
+            worker = threading.Thread(target=reload)
+            worker.start()
+            self.assertFalse(reloaded.wait(0.05))
+            self.inventory.remove_product(self.products[0].id)
+        worker.join()
+        self.assertEqual(len(self.model), 49)
+
+
+class TestProductListView(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a view over a large inventory, when a display exists."""
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            self.skipTest("No display available.")
+        self.inventory = InventoryManager()
+        category = Category("Electronics", "Electronic gadgets")
+        self.inventory.add_products(
+            Product(f"Item {i}", i, category, i) for i in range(10000)
+        )
+        self.view = ProductListView(
+            self.root, ProductListModel(self.inventory), height=5
+        )
+
+    def tearDown(self):
+        self.root.destroy()
+
+    def test_only_visible_rows_exist(self):
+        """Test scrolling refills a fixed set of tree items."""
+        self.assertEqual(len(self.view.tree.get_children()), 5)
+        self.view.scroll(9998)
+        self.assertEqual(len(self.view.tree.get_children()), 5)
+        last = self.view.tree.item("4", "values")
+        self.assertEqual(last[1], "Item 9999")
+
+    def test_polling_survives_a_failed_batch(self):
+        """Test an error while applying changes does not stop live updates."""
+        view = ProductListView(
+            self.root,
+            ProductListModel(self.inventory),
+            ChangeFeed(self.inventory).subscribe(),
+        )
+        view.model.apply = mock.Mock(side_effect=RuntimeError("boom"))
+        self.inventory.remove_product(self.inventory.get_all_products()[0].id)
+        pending = len(self.root.tk.splitlist(self.root.tk.call("after", "info")))
+        with self.assertRaises(RuntimeError):
+            view._poll()
+        after = len(self.root.tk.splitlist(self.root.tk.call("after", "info")))
+        self.assertEqual(after, pending + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from src.category import Category
+from src.inventory import InventoryManager
+from src.product import Product
+
+
+class TestQuery(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an inventory with products in two categories."""
+        self.inventory = InventoryManager()
+        self.electronics = Category("Electronics", "Electronic gadgets")
+        self.clothing = Category("Clothing", "Apparel")
+        self.laptop = Product("Gaming Laptop", 1200, self.electronics, 5)
+        self.phone = Product("Smartphone", 800, self.electronics, 0)
+        self.cable = Product("USB Cable", 10, self.electronics, 100)
+        self.shirt = Product("Gaming T-Shirt", 20, self.clothing, 50)
+        self.inventory.add_products([self.laptop, self.phone, self.cable, self.shirt])
+
+    def test_combined_filters(self):
+        """Test category, price, stock and name filters combine with AND."""
+        query = self.inventory.query().category(self.electronics).in_stock()
+        self.assertCountEqual(query.all(), [self.laptop, self.cable])
+        query.price_between(low=100)
+        self.assertEqual(query.all(), [self.laptop])
+        self.assertEqual(self.inventory.query().name_matches("gam").count(), 2)
+        self.assertEqual(
+            self.inventory.query().name_matches("gaming shi").all(), [self.shirt]
+        )
+
+    def test_order_and_limit(self):
+        """Test sorting with and without a price index and a limit."""
+        by_price = self.inventory.query().order_by("price", descending=True).limit(2)
+        self.assertEqual(by_price.all(), [self.laptop, self.phone])
+        self.assertEqual(by_price.explain(), "price")
+        by_stock = self.inventory.query().in_stock().order_by("quantity").limit(2)
+        self.assertEqual(by_stock.all(), [self.laptop, self.shirt])
+        by_name = self.inventory.query().order_by("name")
+        self.assertEqual(by_name.first(), self.laptop)
+
+    def test_planner_picks_selective_index(self):
+        """Test the smallest candidate index drives the query."""
+        for i in range(20):
+            self.inventory.add_product(Product(f"Sock {i}", 5, self.clothing, 1))
+        self.assertEqual(
+            self.inventory.query().category(self.electronics).explain(), "category"
+        )
+        self.assertEqual(
+            self.inventory.query()
+            .category(self.clothing)
+            .name_matches("gaming")
+            .explain(),
+            "name",
+        )
+        self.assertEqual(self.inventory.query().price_between(1000).explain(), "price")
+        self.assertEqual(self.inventory.query().in_stock().explain(), "scan")
+
+    def test_results_stream_lazily(self):
+        """Test iteration yields results without building the full list."""
+        query = self.inventory.query().price_between(high=1000).order_by("price")
+        results = iter(query)
+        self.assertIs(next(results), self.cable)
+        self.inventory.remove_product(self.phone.id)
+        self.assertEqual(list(results), [self.shirt])
+
+    def test_removing_matches_while_iterating(self):
+        """Test removing results mid-iteration skips none of the others."""
+        socks = [Product(f"Sock {i}", 100 + i, self.clothing, 1) for i in range(10)]
+        self.inventory.add_products(socks)
+        for driver in (
+            self.inventory.query().price_between(100, 200),
+            self.inventory.query().category(self.clothing).price_between(100, 200),
+        ):
+            removed = []
+            for product in driver.order_by("price"):
+                self.inventory.remove_product(product.id)
+                removed.append(product)
+            self.assertEqual(removed, socks)
+            self.inventory.add_products(socks)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import threading
+import time
+import unittest
+from src.category import Category
+from src.inventory import InventoryManager
+from src.product import Product
+from src.reservations import ReservationManager
+
+
+class FakeClock:
+    """A manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestReservationManager(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an inventory with one product and a reservation manager."""
+        self.inventory = InventoryManager()
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.product = Product("Laptop", 1200, self.category, 5)
+        self.inventory.add_product(self.product)
+        self.clock = FakeClock()
+        self.reservations = ReservationManager(self.inventory, ttl=60, clock=self.clock)
+
+    def test_reserve_commit_and_release(self):
+        """Test held units leave stock and only release returns them."""
+        first = self.reservations.reserve(self.product.id, 2)
+        second = self.reservations.reserve(self.product.id, 3)
+        self.assertEqual(self.product.quantity, 0)
+        self.assertEqual(self.reservations.reserved_quantity(self.product.id), 5)
+        with self.assertRaises(ValueError):
+            self.reservations.reserve(self.product.id, 1)
+        self.reservations.commit(first)
+        self.reservations.release(second)
+        self.assertEqual(self.product.quantity, 3)
+        with self.assertRaises(ValueError):
+            self.reservations.release(first)
+
+    def test_lapsed_reservations_return_stock(self):
+        """Test holds past their TTL are released and cannot be committed."""
+        lapsing = self.reservations.reserve(self.product.id, 4, ttl=10)
+        self.clock.now = 11
+        with self.assertRaises(ValueError):
+            self.reservations.commit(lapsing)
+        self.assertEqual(self.product.quantity, 5)
+
+        self.reservations.reserve(self.product.id, 5, ttl=10)
+        self.clock.now = 30
+        self.reservations.reserve(self.product.id, 5)  # Sweeps the lapsed hold.
+        self.assertEqual(self.reservations.expire(), 0)
+        self.assertEqual(self.product.quantity, 0)
+
+
+class TestReservationStress(unittest.TestCase):
+    """Concurrency stress tests for reservations."""
+
+    def setUp(self):
+        self.inventory = InventoryManager()
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.reservations = ReservationManager(self.inventory)
+
+    def run_threads(self, count, target):
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - start
+
+    def test_same_sku_is_never_oversold(self):
+        """Test many threads racing for one SKU reserve exactly its stock."""
+        product = Product("Console", 500, self.category, 1000)
+        self.inventory.add_product(product)
+        granted = []
+
+        def worker(_):
+            for _ in range(200):
+                try:
+                    granted.append(self.reservations.reserve(product.id, 1))
+                except ValueError:
+                    pass
+
+        self.run_threads(16, worker)
+        self.assertEqual(len(granted), 1000)
+        self.assertEqual(product.quantity, 0)
+
+    def test_checkouts_overlap_between_reserve_and_commit(self):
+        """Test checkouts on different SKUs overlap instead of serializing.
+
+        Each order reserves, waits for a simulated payment call and commits,
+        the way an order worker would. Locks are never held across the wait,
+        so every worker can be inside it at once: all of them must meet at a
+        barrier before committing, which fails if any lock serializes them.
+        """
+        products = [Product(f"Item {i}", 10, self.category, 10**6) for i in range(8)]
+        self.inventory.add_products(products)
+        workers, orders = 8, 5
+        barrier = threading.Barrier(workers, timeout=10)
+        lock = threading.Lock()
+        active, peak, broken = [0], [0], []
+
+        def worker(index):
+            sku = products[index % len(products)].id
+            for _ in range(orders):
+                reservation = self.reservations.reserve(sku, 1)
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    broken.append(index)
+                with lock:
+                    active[0] -= 1
+                self.reservations.commit(reservation)
+
+        self.run_threads(workers, worker)
+        self.assertEqual(broken, [])
+        self.assertEqual(peak[0], workers)
+        for product in products:
+            self.assertEqual(product.quantity, 10**6 - orders)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from src.category import Category
+from src.product import Product
+from src.sharding import ShardedInventory
+
+
+class TestShardedInventory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Start one pair of shard processes for the whole test case."""
+        cls.inventory = ShardedInventory(shards=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.inventory.close()
+
+    def setUp(self):
+        """Add a fresh set of products spread over the shards."""
+        self.category = Category(f"Electronics {self.id()}", "Electronic gadgets")
+        self.products = [
+            Product(f"Item {i}", 10 + i, self.category, 5) for i in range(20)
+        ]
+        self.inventory.add_products(self.products)
+
+    def tearDown(self):
+        for product in self.products:
+            try:
+                self.inventory.remove_product(product.id)
+            except ValueError:
+                pass
+
+    def test_point_lookup_and_scatter_gather(self):
+        """Test lookups reach the owning shard and category queries gather all."""
+        found = self.inventory.get_product_by_id(self.products[3].id)
+        self.assertEqual(found.get_details(), self.products[3].get_details())
+        gathered = self.inventory.get_products_by_category(self.category)
+        self.assertEqual(
+            sorted(p.id for p in gathered), sorted(p.id for p in self.products)
+        )
+        self.assertIsNone(self.inventory.get_product_by_id("invalid_sku"))
+
+    def test_batched_quantity_updates(self):
+        """Test batched updates return per-change results in order."""
+        changes = [(p.id, -2) for p in self.products] + [(self.products[0].id, -4)]
+        results = self.inventory.update_quantities(changes)
+        self.assertEqual(results[:20], [3] * 20)
+        self.assertIsInstance(results[20], ValueError)
+        self.assertEqual(self.inventory.update_quantity(self.products[0].id, -3), 0)
+
+    def test_remove_and_duplicates(self):
+        """Test removal and duplicate detection on the owning shard."""
+        with self.assertRaises(ValueError):
+            self.inventory.add_product(self.products[0])
+        self.inventory.remove_product(self.products[0].id)
+        self.assertIsNone(self.inventory.get_product_by_id(self.products[0].id))
+        with self.assertRaises(ValueError):
+            self.inventory.remove_product(self.products[0].id)
+        self.assertEqual(len(self.inventory), 19)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from src.category import Category
+from src.product import Product
+from src.sqlite_store import SQLiteInventoryManager
+
+
+class TestSQLiteInventoryManager(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a file-backed inventory with two products."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "inventory.db")
+        self.inventory = SQLiteInventoryManager(self.path, cache_size=1)
+        self.category = Category("Electronics", "Electronic gadgets")
+        self.product1 = Product("Laptop", 1200, self.category, 5)
+        self.product2 = Product("Smartphone", 800, self.category, 8)
+        self.inventory.add_products([self.product1, self.product2])
+
+    def tearDown(self):
+        self.inventory.close()
+        self.tmpdir.cleanup()
+
+    def test_add_duplicate_product(self):
+        """Test adding an existing SKU raises ValueError and writes nothing."""
+        other = Product("Tablet", 300, self.category, 1)
+        with self.assertRaises(ValueError):
+            self.inventory.add_products([other, self.product1])
+        self.assertIsNone(self.inventory.get_product_by_id(other.id))
+        self.assertEqual(len(self.inventory), 2)
+
+    def test_lookup_reuses_live_objects(self):
+        """Test lookups return the same object while it is referenced."""
+        found = self.inventory.get_product_by_id(self.product1.id)
+        self.assertIs(found, self.product1)
+        self.assertIsNone(self.inventory.get_product_by_id("invalid_sku"))
+
+    def test_queries_see_pending_changes(self):
+        """Test queued stock and price changes are visible to queries."""
+        self.product1.update_quantity(-4)
+        self.product2.update_price(1500)
+        self.assertEqual(self.inventory.get_low_stock(2), [self.product1])
+        self.assertEqual(self.inventory.top_n_by_price(1), [self.product2])
+        self.assertEqual(
+            self.inventory.get_products_by_price_range(1000, 1300), [self.product1]
+        )
+        self.assertEqual(len(self.inventory.get_products_by_category(self.category)), 2)
+
+    def test_changes_survive_reopen(self):
+        """Test flushed changes and removals persist across connections."""
+        self.product1.update_quantity(-1)
+        self.inventory.remove_product(self.product2.id)
+        self.inventory.close()
+
+        self.inventory = SQLiteInventoryManager(self.path)
+        restored = self.inventory.get_product_by_id(self.product1.id)
+        self.assertEqual(restored.get_details(), self.product1.get_details())
+        self.assertIsNot(restored, self.product1)
+        self.assertIsNone(self.inventory.get_product_by_id(self.product2.id))
+        with self.assertRaises(ValueError):
+            self.inventory.remove_product(self.product2.id)
+
+
+if __name__ == "__main__":
+    unittest.main()